@@ -0,0 +1,96 @@
+"""
+AVLTree.delete benchmark: single-descent delete vs the original one.
+
+The original delete copied the inorder successor's value into a node with
+two children and then searched the right subtree again to delete the
+successor. Its rebalance also recomputed the node, asked for balance
+factors through repeated get_balance/get_height calls, and updated the
+node a second time whenever it rotated. The current delete unlinks the
+successor node with pop_min during the same descent and computes each
+level's balance once.
+
+Both trees start from the same balanced tree of n keys, built in O(n) so
+that only the deletes are timed. All n keys are then deleted in random
+order, and a second run deletes absent keys to isolate the per-level
+rebalance cost.
+
+Run with:
+    python -m benchmarks.bench_avl_delete [n]
+"""
+
+import random
+import sys
+import time
+
+from structures.avl import AVLTree
+from structures.node import AVLMultiMapNode
+
+
+class OriginalAVLTree(AVLTree):
+    """The original delete and rebalance, kept here only as the baseline."""
+
+    def delete(self, root, value, all_copies=False):
+        if not root:
+            return root
+        if value < root.value:
+            root.left = self.delete(root.left, value, all_copies)
+        elif value > root.value:
+            root.right = self.delete(root.right, value, all_copies)
+        elif root.count > 1 and not all_copies:
+            root.count -= 1
+            root.size -= 1
+            return root
+        else:
+            if not root.left:
+                return root.right
+            elif not root.right:
+                return root.left
+            temp = self.get_min_value_node(root.right)
+            root.value, root.payload, root.count = temp.value, temp.payload, temp.count
+            root.right = self.delete(root.right, temp.value, True)
+        return self.rebalance(root)
+
+    def rebalance(self, root):
+        self._update(root)
+        balance = self.get_balance(root)
+        if balance > 1:
+            if self.get_balance(root.left) < 0:
+                root.left = self.left_rotate(root.left)
+            return self.right_rotate(root)
+        if balance < -1:
+            if self.get_balance(root.right) > 0:
+                root.right = self.right_rotate(root.right)
+            return self.left_rotate(root)
+        return root
+
+
+def run(tree_class, n, keys, absent):
+    avl = tree_class(AVLMultiMapNode)  # The baseline copies payloads between nodes
+    root = avl.build_balanced(range(n))
+    start = time.perf_counter()
+    for key in absent:
+        root = avl.delete(root, key)
+    miss = time.perf_counter() - start
+    start = time.perf_counter()
+    for key in keys:
+        root = avl.delete(root, key)
+    hit = time.perf_counter() - start
+    assert root is None
+    return hit, miss
+
+
+def main(n=1_000_000):
+    keys = list(range(n))
+    random.Random(42).shuffle(keys)
+    absent = [key + 0.5 for key in keys[: n // 10]]
+    print(f"random deletes ({n:,} keys; {len(absent):,} absent keys)")
+    baseline = None
+    for tree_class in (OriginalAVLTree, AVLTree):
+        hit, miss = run(tree_class, n, keys, absent)
+        speedup = "" if baseline is None else f"  x{baseline / hit:.2f}"
+        baseline = baseline or hit
+        print(f"  {tree_class.__name__:<16}delete {hit:8.3f}s  absent {miss:8.3f}s{speedup}")
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,134 @@
+"""
+BinarySearchTree benchmark: iterative operations vs the original recursive ones.
+
+Times insert, search, inorder traversal and delete on random keys and on
+sorted keys. Sorted keys turn any unbalanced BST into a chain, so each
+operation there is O(n) and a full build is O(n^2). The sorted run
+therefore uses a smaller n by default. The point of that run is that the
+iterative tree completes at depths where the recursive one raises
+RecursionError.
+
+Run with:
+    python -m benchmarks.bench_bst [random_n] [sorted_n]
+"""
+
+import random
+import sys
+import time
+
+from structures.bst import BinarySearchTree
+from structures.node import BSTNode
+
+
+class RecursiveBST:
+    """The original recursive implementation, kept here only as the baseline."""
+
+    def __init__(self):
+        self.root = None
+
+    def insert(self, value):
+        if self.root is None:
+            self.root = BSTNode(value)
+        else:
+            self._insert(self.root, value)
+
+    def _insert(self, node, value):
+        if value < node.value:
+            if node.left is None:
+                node.left = BSTNode(value)
+            else:
+                self._insert(node.left, value)
+        elif value > node.value:
+            if node.right is None:
+                node.right = BSTNode(value)
+            else:
+                self._insert(node.right, value)
+
+    def search(self, value):
+        return self._search(self.root, value)
+
+    def _search(self, node, value):
+        if node is None:
+            return False
+        if value == node.value:
+            return True
+        if value < node.value:
+            return self._search(node.left, value)
+        return self._search(node.right, value)
+
+    def inorder_traversal(self):
+        result = []
+        self._inorder(self.root, result)
+        return result
+
+    def _inorder(self, node, result):
+        if node:
+            self._inorder(node.left, result)
+            result.append(node.value)
+            self._inorder(node.right, result)
+
+    def delete(self, value):
+        self.root = self._delete(self.root, value)
+
+    def _delete(self, node, value):
+        if node is None:
+            return node
+        if value < node.value:
+            node.left = self._delete(node.left, value)
+        elif value > node.value:
+            node.right = self._delete(node.right, value)
+        else:
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+            node.value = successor.value
+            node.right = self._delete(node.right, successor.value)
+        return node
+
+
+def run(tree_class, keys):
+    timings = {}
+    tree = tree_class()
+    start = time.perf_counter()
+    for key in keys:
+        tree.insert(key)
+    timings['insert'] = time.perf_counter() - start
+    start = time.perf_counter()
+    for key in keys:
+        tree.search(key)
+    timings['search'] = time.perf_counter() - start
+    start = time.perf_counter()
+    tree.inorder_traversal()
+    timings['inorder'] = time.perf_counter() - start
+    start = time.perf_counter()
+    for key in keys:
+        tree.delete(key)
+    timings['delete'] = time.perf_counter() - start
+    return timings
+
+
+def report(label, keys):
+    print(f"{label} ({len(keys):,} keys)")
+    for tree_class in (RecursiveBST, BinarySearchTree):
+        try:
+            timings = run(tree_class, keys)
+        except RecursionError:
+            print(f"  {tree_class.__name__:<18}RecursionError")
+            continue
+        cells = "".join(f"{op} {seconds:8.3f}s  " for op, seconds in timings.items())
+        print(f"  {tree_class.__name__:<18}{cells}")
+
+
+def main(random_n=1_000_000, sorted_n=10_000):
+    keys = list(range(random_n))
+    random.Random(42).shuffle(keys)
+    report("random", keys)
+    report("sorted", list(range(sorted_n)))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
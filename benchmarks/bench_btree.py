@@ -0,0 +1,75 @@
+"""
+BTree benchmark: the B+-tree against AVLTreeMap on the same keys.
+
+Times insert, search, a full in-order scan, short range scans and delete
+on shuffled keys, and reports bytes per key and the number of levels a
+lookup passes through. The B+-tree is run at a few orders (keys per node).
+
+Run with:
+    python -m benchmarks.bench_btree [n]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+from structures.avl import AVLTreeMap
+from structures.btree import BTree
+
+
+def build(make, keys):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tree = make()
+    for key in keys:
+        tree.insert(key)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return tree, (after - before) / len(keys)
+
+
+def run(make, keys, windows):
+    timings = {}
+    _, bytes_per_key = build(make, keys)
+    tree = make()
+    start = time.perf_counter()
+    for key in keys:
+        tree.insert(key)
+    timings['insert'] = time.perf_counter() - start
+    start = time.perf_counter()
+    for key in keys:
+        tree.search(key)
+    timings['search'] = time.perf_counter() - start
+    start = time.perf_counter()
+    tree.inorder_traversal()
+    timings['inorder'] = time.perf_counter() - start
+    start = time.perf_counter()
+    for lo in windows:
+        for _ in tree.irange(lo, lo + 100):
+            pass
+    timings['irange'] = time.perf_counter() - start
+    levels = tree.height() + 1
+    start = time.perf_counter()
+    for key in keys:
+        tree.delete(key)
+    timings['delete'] = time.perf_counter() - start
+    return timings, bytes_per_key, levels
+
+
+def main(n=1_000_000):
+    rng = random.Random(42)
+    keys = list(range(n))
+    rng.shuffle(keys)
+    windows = [rng.randrange(n) for _ in range(10_000)]
+    print(f"{n:,} shuffled keys; irange = 10,000 scans of 100 keys")
+    cases = [('AVLTreeMap', AVLTreeMap)]
+    cases += [(f'BTree(order={order})', lambda order=order: BTree(order)) for order in (32, 64, 128)]
+    for label, make in cases:
+        timings, bytes_per_key, levels = run(make, keys, windows)
+        cells = "".join(f"{op} {seconds:7.3f}s  " for op, seconds in timings.items())
+        print(f"  {label:<18}{cells}{bytes_per_key:6.1f} B/key  {levels} levels")
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
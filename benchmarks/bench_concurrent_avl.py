@@ -0,0 +1,85 @@
+"""
+Multi-threaded benchmark: ConcurrentAVLTree vs an AVLTreeMap behind one global lock.
+
+Each thread performs a mix of lookups and updates on a shared tree. The
+report shows total throughput and the worst single-lookup latency, which
+is where lookups queueing behind writers show up. Under CPython's GIL
+threads do not run Python code in parallel, so the gain comes from reads
+never blocking rather than from extra cores.
+
+Run with:
+    python -m benchmarks.bench_concurrent_avl [threads] [ops_per_thread] [read_ratio]
+"""
+
+import random
+import sys
+import threading
+import time
+
+from structures.avl import AVLTreeMap
+from structures.concurrent_avl import ConcurrentAVLTree
+
+KEYS = 100_000
+
+
+class LockedAVLTreeMap:
+    """The baseline: every call serialized through a single lock."""
+
+    def __init__(self, values):
+        self._tree = AVLTreeMap.from_iterable(values)
+        self._lock = threading.Lock()
+
+    def search(self, value):
+        with self._lock:
+            return self._tree.search(value)
+
+    def insert(self, value):
+        with self._lock:
+            self._tree.insert(value)
+
+    def delete(self, value):
+        with self._lock:
+            self._tree.delete(value)
+
+
+def worker(tree, ops, read_ratio, seed, worst):
+    rng = random.Random(seed)
+    slowest = 0.0
+    for _ in range(ops):
+        key = rng.randrange(2 * KEYS)
+        if rng.random() < read_ratio:
+            start = time.perf_counter()
+            tree.search(key)
+            slowest = max(slowest, time.perf_counter() - start)
+        elif rng.random() < 0.5:
+            tree.insert(key)
+        else:
+            tree.delete(key)
+    worst.append(slowest)
+
+
+def run(tree, threads, ops, read_ratio):
+    worst = []
+    pool = [threading.Thread(target=worker, args=(tree, ops, read_ratio, seed, worst))
+            for seed in range(threads)]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return threads * ops / elapsed, max(worst)
+
+
+def main(threads=8, ops=50_000, read_ratio=0.9):
+    values = range(0, 2 * KEYS, 2)
+    print(f"{threads} threads x {ops:,} ops, {read_ratio:.0%} reads, {KEYS:,} keys")
+    for label, tree in [("AVLTreeMap + global lock", LockedAVLTreeMap(values)),
+                        ("ConcurrentAVLTree", ConcurrentAVLTree(values))]:
+        throughput, worst = run(tree, threads, ops, read_ratio)
+        print(f"{label:<26}{throughput:>12,.0f} ops/s   worst lookup {worst * 1e3:8.2f} ms")
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    main(*(int(arg) for arg in args[:2]), *(float(arg) for arg in args[2:3]))
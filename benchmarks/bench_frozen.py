@@ -0,0 +1,60 @@
+"""
+FrozenIndex benchmark: a built tree against its frozen, array-backed index.
+
+Builds an AVLTreeMap of n random keys and freezes it in each layout, as
+a list of objects and packed as 64-bit integers. Reports bytes per key
+(excluding the key objects themselves, which all variants share), the
+time for n single lookups, and the time for one search_many batch of n
+probes, half of them absent. Batches run vectorized when NumPy is
+installed and the index is packed.
+
+Run with:
+    python -m benchmarks.bench_frozen [n]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+from structures import frozen
+from structures.avl import AVLTreeMap
+
+
+def measure(build):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    structure = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return structure, after - before
+
+
+def main(n=1_000_000):
+    rng = random.Random(42)
+    keys = rng.sample(range(4 * n), n)
+    probes = keys[: n // 2] + [key + 4 * n for key in keys[: n // 2]]
+    rng.shuffle(probes)
+    tree, tree_bytes = measure(lambda: AVLTreeMap.from_iterable(keys))
+    print(f"{n:,} keys, {len(probes):,} probes; NumPy {'available' if frozen.np else 'not installed'}")
+    cases = [('AVLTreeMap', tree, tree_bytes)]
+    for layout in ('sorted', 'eytzinger'):
+        for typecode in (None, 'q'):
+            index, index_bytes = measure(lambda: tree.freeze(layout, typecode))
+            cases.append((f"{layout}/{typecode or 'list'}", index, index_bytes))
+    for label, structure, nbytes in cases:
+        search = structure.search
+        start = time.perf_counter()
+        for probe in probes:
+            search(probe)
+        single = time.perf_counter() - start
+        batch = ""
+        if hasattr(structure, 'search_many'):
+            start = time.perf_counter()
+            structure.search_many(probes)
+            batch = f"search_many {time.perf_counter() - start:7.3f}s"
+        print(f"  {label:<18}{nbytes / n:7.1f} B/key  search {single:7.3f}s  {batch}")
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
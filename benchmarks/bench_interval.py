@@ -0,0 +1,60 @@
+"""
+Interval overlap benchmark: IntervalTree against a full scan of a tree keyed on start.
+
+Stores n random time windows, each up to 100 units long, spread over
+[0, 100n). The baseline keeps them in a BinarySearchTree keyed on start
+and tests every window per query; IntervalTree prunes with its max-end
+augmentation. Reports the time for point and short-range queries, and
+for a batch of inserts and deletes on the interval tree.
+
+Run with:
+    python -m benchmarks.bench_interval [n]
+"""
+
+import random
+import sys
+import time
+
+from structures.bst import BinarySearchTree
+from structures.interval import IntervalTree
+
+
+def scan(tree, lo, hi):
+    return [interval for interval in tree if interval[0] <= hi and lo <= interval[1]]
+
+
+def timed(queries, run):
+    start = time.perf_counter()
+    found = sum(len(run(lo, hi)) for lo, hi in queries)
+    return time.perf_counter() - start, found
+
+
+def main(n=100_000, queries=200):
+    rng = random.Random(42)
+    intervals = []
+    for _ in range(n):
+        start = rng.randrange(100 * n)
+        intervals.append((start, start + rng.randrange(100)))
+    baseline = BinarySearchTree.from_iterable(intervals)
+    tree = IntervalTree.from_iterable(intervals)
+    print(f"{n:,} intervals, {queries} queries of each kind")
+    for label, width in (("point", 0), ("range 1000", 1000)):
+        probes = [(lo, lo + width) for lo in (rng.randrange(100 * n) for _ in range(queries))]
+        scan_time, scan_found = timed(probes, lambda lo, hi: scan(baseline, lo, hi))
+        tree_time, tree_found = timed(probes, tree.overlaps)
+        assert scan_found == tree_found
+        print(f"  {label:<11} full scan {scan_time * 1e3 / queries:9.3f} ms/query   "
+              f"IntervalTree {tree_time * 1e3 / queries:7.3f} ms/query   "
+              f"x{scan_time / tree_time:,.0f}   ({tree_found / queries:.1f} hits/query)")
+    updates = intervals[: n // 10]
+    start = time.perf_counter()
+    for interval in updates:
+        tree.delete(interval)
+    for interval in updates:
+        tree.insert(interval)
+    elapsed = time.perf_counter() - start
+    print(f"  {2 * len(updates):,} deletes and inserts: {elapsed / (2 * len(updates)) * 1e6:.1f} us each")
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
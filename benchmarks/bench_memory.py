@@ -0,0 +1,116 @@
+"""
+Memory benchmark: bytes per element for each structure.
+
+Compares the original shared ``Node`` (every field in a per-instance
+``__dict__``) against the compact ``__slots__`` node used by each structure.
+
+Run with:
+    python -m benchmarks.bench_memory [n]
+"""
+
+import sys
+import tracemalloc
+from unittest import mock
+
+from structures import avl, bst, dll, queue, sll, stack
+
+
+class DictNode:
+    """
+    The original node layout, kept here only as the "before" baseline.
+
+    It also takes the payload, count and size fields the trees now use, so
+    that every structure runs on it unchanged.
+    """
+
+    count = 1  # Class-level defaults; an instance only stores them once written
+    size = 1
+
+    def __init__(self, value, next=None, payload=None):
+        # Same call signature as the slotted nodes it stands in for
+        self.value = value
+        self.left = None
+        self.right = None
+        self.next = next
+        self.prev = None
+        self.height = 1
+        self.payload = payload
+
+
+def build_stack(n):
+    s = stack.Stack()
+    for i in range(n):
+        s.push(i)
+    return s
+
+
+def build_queue(n):
+    q = queue.Queue()
+    for i in range(n):
+        q.enqueue(i)
+    return q
+
+
+def build_sll(n):
+    lst = sll.SinglyLinkedList()
+    for i in range(n):
+        lst.prepend(i)
+    return lst
+
+
+def build_dll(n):
+    lst = dll.DoublyLinkedList()
+    for i in range(n):
+        lst.append(i)
+    return lst
+
+
+def build_bst(n):
+    # Insert in a pseudo-random order so the tree stays shallow.
+    tree = bst.BinarySearchTree()
+    for i in range(n):
+        tree.insert((i * 7919) % n)
+    return tree
+
+
+def build_avl(n):
+    tree = avl.AVLTree()
+    root = None
+    for i in range(n):
+        root = tree.insert(root, i)
+    return root
+
+
+# The lists build nodes through a module-level name; the trees through
+# their class's `_node_class`, so that is what gets swapped for DictNode.
+CASES = [
+    ('Stack', stack, 'SLLNode', build_stack),
+    ('Queue', queue, 'SLLNode', build_queue),
+    ('SinglyLinkedList', sll, 'SLLNode', build_sll),
+    ('DoublyLinkedList', dll, 'DLLNode', build_dll),
+    ('BinarySearchTree', bst.BinarySearchTree, '_node_class', build_bst),
+    ('AVLTree', avl.AVLTree, '_node_class', build_avl),
+]
+
+
+def bytes_per_element(build, n):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    structure = build(n)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del structure
+    return (after - before) / n
+
+
+def main(n=100_000):
+    print(f"{'structure':<20}{'before':>12}{'after':>12}{'saved':>10}")
+    for name, target, node_attr, build in CASES:
+        with mock.patch.object(target, node_attr, DictNode):
+            old = bytes_per_element(build, n)
+        new = bytes_per_element(build, n)
+        print(f"{name:<20}{old:>10.1f} B{new:>10.1f} B{1 - new / old:>9.0%}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
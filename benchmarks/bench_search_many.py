@@ -0,0 +1,61 @@
+"""
+search_many benchmark: one batch call against a loop of search calls.
+
+Trees hold n random keys and are probed with batches of several sizes,
+half the probes present. The linked lists hold m values and get a batch
+of m probes: a loop of search calls is O(m^2) there, and one pass over a
+set of the probes is O(m).
+
+Run with:
+    python -m benchmarks.bench_search_many [n] [m]
+"""
+
+import random
+import sys
+import time
+
+from structures.avl import AVLTreeMap
+from structures.bst import BinarySearchTree
+from structures.btree import BTree
+from structures.dll import DoublyLinkedList
+from structures.sll import SinglyLinkedList
+
+
+def compare(label, structure, probes):
+    search = structure.search
+    start = time.perf_counter()
+    looped = [search(probe) for probe in probes]
+    loop_time = time.perf_counter() - start
+    start = time.perf_counter()
+    batched = structure.search_many(probes)
+    batch_time = time.perf_counter() - start
+    assert batched == looped
+    print(f"  {label:<34}loop {loop_time:8.3f}s  search_many {batch_time:8.3f}s  x{loop_time / batch_time:.1f}")
+
+
+def main(n=1_000_000, m=5_000):
+    rng = random.Random(42)
+    keys = rng.sample(range(2 * n), n)
+    absent = [key + 2 * n for key in keys]
+    print(f"trees of {n:,} keys")
+    for tree_class in (BinarySearchTree, AVLTreeMap, BTree):
+        tree = tree_class()
+        for key in keys:
+            tree.insert(key)
+        for size in (n // 100, n // 10, n):
+            probes = keys[: size // 2] + absent[: size // 2]
+            rng.shuffle(probes)
+            compare(f"{tree_class.__name__}, {size:,} probes", tree, probes)
+    print(f"lists of {m:,} values, {m:,} probes")
+    values = keys[:m]
+    probes = values[: m // 2] + absent[: m // 2]
+    rng.shuffle(probes)
+    for list_class in (SinglyLinkedList, DoublyLinkedList):
+        lst = list_class()
+        for value in values:
+            lst.append(value)
+        compare(list_class.__name__, lst, probes)
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
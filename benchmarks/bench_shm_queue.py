@@ -0,0 +1,103 @@
+"""
+Throughput benchmark: SharedRingQueue vs the linked Queue vs multiprocessing.Queue.
+
+The shared-memory and multiprocessing queues move messages from a producer
+process to a consumer process. The linked Queue cannot cross processes, so
+it is timed in-process (enqueue everything, then dequeue everything) as a
+reference for raw per-message cost.
+
+Run with:
+    python -m benchmarks.bench_shm_queue [messages] [message_bytes]
+"""
+
+import multiprocessing
+import sys
+import time
+
+from structures.queue import Queue
+from structures.shm_queue import SharedRingQueue
+
+BATCH = 256
+
+
+def bench_linked(messages, payload):
+    queue = Queue()
+    start = time.perf_counter()
+    for _ in range(messages):
+        queue.enqueue(payload)
+    for _ in range(messages):
+        queue.dequeue()
+    return time.perf_counter() - start
+
+
+def _mp_producer(queue, messages, payload):
+    for _ in range(messages):
+        queue.put(payload)
+
+
+def bench_multiprocessing(messages, payload):
+    queue = multiprocessing.Queue()
+    producer = multiprocessing.Process(target=_mp_producer, args=(queue, messages, payload))
+    start = time.perf_counter()
+    producer.start()
+    for _ in range(messages):
+        queue.get()
+    elapsed = time.perf_counter() - start
+    producer.join()
+    return elapsed
+
+
+def _shm_producer(queue, messages, payload):
+    for _ in range(messages):
+        queue.put(payload)
+    queue.close()
+
+
+def bench_shared(messages, payload):
+    with SharedRingQueue.create(1 << 20) as queue:
+        producer = multiprocessing.Process(target=_shm_producer, args=(queue, messages, payload))
+        start = time.perf_counter()
+        producer.start()
+        for _ in range(messages):
+            queue.get()
+        elapsed = time.perf_counter() - start
+        producer.join()
+    return elapsed
+
+
+def _shm_batch_producer(queue, messages, payload):
+    sent = 0
+    while sent < messages:
+        sent += queue.enqueue_many([payload] * min(BATCH, messages - sent))
+    queue.close()
+
+
+def bench_shared_batched(messages, payload):
+    with SharedRingQueue.create(1 << 20) as queue:
+        producer = multiprocessing.Process(target=_shm_batch_producer, args=(queue, messages, payload))
+        start = time.perf_counter()
+        producer.start()
+        received = 0
+        while received < messages:
+            received += len(queue.dequeue_many(BATCH))
+        elapsed = time.perf_counter() - start
+        producer.join()
+    return elapsed
+
+
+def main(messages=200_000, size=64):
+    payload = b"x" * size
+    print(f"{messages} messages of {size} bytes")
+    for label, bench in [
+        ("linked Queue (in-process)", bench_linked),
+        ("multiprocessing.Queue", bench_multiprocessing),
+        ("SharedRingQueue", bench_shared),
+        ("SharedRingQueue (batched)", bench_shared_batched),
+    ]:
+        elapsed = bench(messages, payload)
+        print(f"{label:<28}{messages / elapsed:>14,.0f} msg/s")
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*args)
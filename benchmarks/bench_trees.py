@@ -0,0 +1,113 @@
+"""
+Ordered-container benchmark: every tree side by side on the same workloads.
+
+Reports throughput, in thousands of operations per second, for insert,
+search and delete, plus a write-heavy mix of 50% inserts and 50%
+deletes on a tree kept at about n/2 keys. Random keys are tried first,
+then ascending keys, which degrade the unbalanced BinarySearchTree to a
+chain, so it is skipped there. For the AVL and red-black trees the last
+column counts rotations per insert or delete over the whole run.
+
+Run with:
+    python -m benchmarks.bench_trees [n]
+"""
+
+import random
+import sys
+import time
+from unittest import mock
+
+from structures import rbtree
+from structures.avl import AVLTreeMap
+from structures.bst import BinarySearchTree
+from structures.btree import BTree
+from structures.rbtree import RedBlackTree
+from structures.treap import Treap
+
+CONTAINERS = [BinarySearchTree, AVLTreeMap, RedBlackTree, Treap, BTree]
+
+
+class RotationCounter:
+    """Counts calls to the rotation functions of one tree while active."""
+
+    def __init__(self, tree):
+        self.count = 0
+        if isinstance(tree, AVLTreeMap):
+            self._patches = [mock.patch.object(tree._avl, name, self._wrap(getattr(tree._avl, name)))
+                             for name in ('left_rotate', 'right_rotate')]
+        elif isinstance(tree, RedBlackTree):
+            self._patches = [mock.patch.object(rbtree, name, self._wrap(getattr(rbtree, name)))
+                             for name in ('_rotate_left', '_rotate_right')]
+        else:
+            self._patches = None
+
+    def _wrap(self, rotate):
+        def counted(node):
+            self.count += 1
+            return rotate(node)
+        return counted
+
+    def __enter__(self):
+        for patch in self._patches or ():
+            patch.start()
+        return self
+
+    def __exit__(self, *exc):
+        for patch in self._patches or ():
+            patch.stop()
+
+
+def throughput(operation, keys):
+    start = time.perf_counter()
+    for key in keys:
+        operation(key)
+    return len(keys) / (time.perf_counter() - start) / 1000
+
+
+def run(container, keys, mix):
+    rates = {}
+    tree = container()
+    rates['insert'] = throughput(tree.insert, keys)
+    rates['search'] = throughput(tree.search, keys)
+    rates['delete'] = throughput(tree.delete, keys)
+    for key in keys[::2]:
+        tree.insert(key)
+    start = time.perf_counter()
+    for insert, key in mix:
+        if insert:
+            tree.insert(key)
+        else:
+            tree.delete(key)
+    rates['mixed'] = len(mix) / (time.perf_counter() - start) / 1000
+
+    # Rotations are counted on a separate pass, so the wrappers do not skew the timings
+    tree = container()
+    with RotationCounter(tree) as counter:
+        for key in keys:
+            tree.insert(key)
+        for key in keys:
+            tree.delete(key)
+    rotations = counter.count / (2 * len(keys)) if counter._patches else None
+    return rates, rotations
+
+
+def report(label, keys, containers):
+    rng = random.Random(7)
+    mix = [(rng.random() < 0.5, rng.choice(keys)) for _ in range(len(keys))]
+    print(f"{label} ({len(keys):,} keys; thousands of operations per second)")
+    for container in containers:
+        rates, rotations = run(container, keys, mix)
+        cells = "".join(f"{op} {rate:7.1f}  " for op, rate in rates.items())
+        rotated = "" if rotations is None else f"rotations/update {rotations:.3f}"
+        print(f"  {container.__name__:<18}{cells}{rotated}")
+
+
+def main(n=200_000):
+    keys = list(range(n))
+    random.Random(42).shuffle(keys)
+    report("random", keys, CONTAINERS)
+    report("ascending", list(range(n)), CONTAINERS[1:])
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
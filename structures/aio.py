@@ -0,0 +1,173 @@
+# aio.py
+
+import asyncio
+from collections import deque
+
+from .queue import Queue, Empty, Full
+from .stack import Stack
+
+
+class _AsyncAdapter:
+    """
+    Shared machinery for the asyncio adapters below.
+
+    Waiting coroutines park on futures held in FIFO waiter lists and are
+    woken one at a time, so nothing polls the event loop. Subclasses set
+    the backing container and say which of its methods add and remove.
+    """
+
+    def __init__(self, maxsize=0):
+        self.maxsize = maxsize  # 0 means unbounded
+        self._getters = deque()
+        self._putters = deque()
+        self._unfinished_tasks = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+        self._closed = False
+
+    def _put(self, value):
+        raise NotImplementedError
+
+    def _get(self):
+        raise NotImplementedError
+
+    def _wakeup_next(self, waiters):
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _wait(self, waiters):
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                # Woken just before being cancelled: pass the wake-up on.
+                self._wakeup_next(waiters)
+            raise
+
+    def get_size(self):
+        """Return the number of elements held."""
+        return self._items.get_size()
+
+    def is_empty(self):
+        """Check if the container is empty."""
+        return self._items.is_empty()
+
+    def is_full(self):
+        """Check if a bounded container has reached `maxsize`."""
+        return 0 < self.maxsize <= self.get_size()
+
+    def put_nowait(self, value):
+        """Add an element without waiting; raise Full if there is no room."""
+        if self._closed:
+            raise RuntimeError("put on a closed container")
+        if self.is_full():
+            raise Full
+        self._put(value)
+        self._unfinished_tasks += 1
+        self._finished.clear()
+        self._wakeup_next(self._getters)
+
+    async def put(self, value):
+        """Add an element, waiting for a free slot if the container is full."""
+        while self.is_full():
+            await self._wait(self._putters)
+        self.put_nowait(value)
+
+    def get_nowait(self):
+        """Remove and return an element without waiting; raise Empty if there is none."""
+        if self.is_empty():
+            raise Empty
+        value = self._get()
+        self._wakeup_next(self._putters)
+        return value
+
+    async def get(self):
+        """
+        Remove and return an element, waiting until one is available.
+
+        Raises Empty if the container is closed and drained.
+        """
+        while self.is_empty():
+            if self._closed:
+                raise Empty
+            await self._wait(self._getters)
+        return self.get_nowait()
+
+    def task_done(self):
+        """Mark one previously fetched element as fully processed."""
+        if self._unfinished_tasks <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinished_tasks -= 1
+        if self._unfinished_tasks == 0:
+            self._finished.set()
+
+    async def join(self):
+        """Wait until every element put has been fetched and marked done."""
+        await self._finished.wait()
+
+    def close(self):
+        """
+        Stop accepting new elements.
+
+        Waiting getters are woken; once the remaining elements are drained,
+        `get` raises Empty and async iteration ends.
+        """
+        self._closed = True
+        while self._getters:
+            self._wakeup_next(self._getters)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return await self.get()
+        except Empty:
+            raise StopAsyncIteration from None
+
+
+class AsyncQueue(_AsyncAdapter):
+    """
+    asyncio FIFO queue built over the linked Queue.
+
+    `await put()` waits while a bounded queue is full, `await get()` waits
+    while it is empty, and `async for` consumes elements until `close()`
+    is called and the queue is drained.
+    """
+
+    def __init__(self, maxsize=0):
+        super().__init__(maxsize)
+        self._items = Queue()
+
+    def _put(self, value):
+        self._items.enqueue(value)
+
+    def _get(self):
+        return self._items.dequeue()
+
+
+class AsyncStack(_AsyncAdapter):
+    """
+    asyncio LIFO stack built over the linked Stack.
+
+    Same waiting, iteration and join semantics as AsyncQueue, but `get`
+    returns the most recently added element.
+    """
+
+    def __init__(self, maxsize=0):
+        super().__init__(maxsize)
+        self._items = Stack()
+
+    def _put(self, value):
+        self._items.push(value)
+
+    def _get(self):
+        return self._items.pop()
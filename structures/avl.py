@@ -1,104 +1,279 @@
-from .node import Node
+from .bst import BinarySearchTree, _iter_inorder, _iter_range, _sorted_runs, _sorted_unique
+from .node import AVLMapNode, AVLMultiMapNode, AVLMultiNode, AVLNode
 
 class AVLTree:
+    """
+    AVL balancing operations on subtrees identified by their root node.
+
+    Every method takes the root of a subtree and returns the (possibly new)
+    root, so callers thread `root` through each call. Nodes carry their
+    subtree height and size; `_update` recomputes both and is the single
+    place a subclass hooks in to maintain extra augmentation. AVLTreeMap
+    wraps these operations in a container that owns its root.
+
+    A value inserted more than once is kept as a count on its node rather
+    than as extra nodes; `size` counts every copy. A caller that never
+    inserts a value twice can pass a `node_class` without a count field.
+    """
+
+    _node_class = AVLMultiNode  # Augmented subclasses swap in a node with their extra fields
+
+    def __init__(self, node_class=None):
+        if node_class is not None:
+            self._node_class = node_class
+
     def insert(self, root, value):
         # Normal BST insertion
         if not root:
-            return Node(value)
+            return self._node_class(value)
         elif value < root.value:
             root.left = self.insert(root.left, value)
-        else:
+        elif value > root.value:
             root.right = self.insert(root.right, value)
+        else:
+            # Duplicate: count it in place; the shape is unchanged
+            root.count += 1
+            root.size += 1
+            return root
 
-        # Update the height of the ancestor node
-        root.height = 1 + max(self.get_height(root.left), self.get_height(root.right))
-
-        # Get the balance factor
-        balance = self.get_balance(root)
-
-        # Perform rotations to balance the tree if needed
-
-        # Left Left Case
-        if balance > 1 and value < root.left.value:
-            return self.right_rotate(root)
-
-        # Right Right Case
-        if balance < -1 and value > root.right.value:
-            return self.left_rotate(root)
-
-        # Left Right Case
-        if balance > 1 and value > root.left.value:
-            root.left = self.left_rotate(root.left)
-            return self.right_rotate(root)
-
-        # Right Left Case
-        if balance < -1 and value < root.right.value:
-            root.right = self.right_rotate(root.right)
-            return self.left_rotate(root)
+        # Update the height of the ancestor node and rotate if it is unbalanced
+        return self.rebalance(root)
 
-        return root
+    def delete(self, root, value, all_copies=False):
+        """
+        Delete one copy of `value` (every copy with `all_copies`) and rebalance.
 
-    def delete(self, root, value):
+        A node with two children is replaced by its inorder successor node,
+        which `pop_min` unlinks while rebalancing the right subtree, so the
+        tree is descended only once.
+        """
         # Step 1: Perform standard BST delete
         if not root:
             return root
 
         # If the value to be deleted is smaller than the root's value, go to the left subtree
         if value < root.value:
-            root.left = self.delete(root.left, value)
+            root.left = self.delete(root.left, value, all_copies)
 
         # If the value to be deleted is greater than the root's value, go to the right subtree
         elif value > root.value:
-            root.right = self.delete(root.right, value)
+            root.right = self.delete(root.right, value, all_copies)
+
+        # A value stored more than once just loses a copy
+        elif root.count > 1 and not all_copies:
+            root.count -= 1
+            root.size -= 1
+            return root
 
         # If value is equal to root's value, this is the node to be deleted
         else:
             # Node with only one child or no child
-            if not root.left:
-                return root.right
-            elif not root.right:
-                return root.left
-
-            # Node with two children: Get the inorder successor (smallest in the right subtree)
-            temp = self.get_min_value_node(root.right)
-            root.value = temp.value
-
-            # Delete the inorder successor
-            root.right = self.delete(root.right, temp.value)
-
-        # Step 2: Update the height of the current node
-        root.height = 1 + max(self.get_height(root.left), self.get_height(root.right))
-
-        # Step 3: Get the balance factor
-        balance = self.get_balance(root)
-
-        # Step 4: Perform rotations if necessary
-
-        # Left Left Case
-        if balance > 1 and self.get_balance(root.left) >= 0:
+            left, right = root.left, root.right
+            if not left:
+                return right
+            elif not right:
+                return left
+
+            # Node with two children: unlink the inorder successor (smallest in
+            # the right subtree) and put that node in the deleted node's place
+            right, root = self.pop_min(right)
+            root.left, root.right = left, right
+
+        # Step 2: Update the height of the current node and rotate if necessary
+        return self.rebalance(root)
+
+    def rebalance(self, root):
+        """Recompute `root` from its children and rotate it if it is out of balance."""
+        left, right = root.left, root.right
+        left_height = left.height if left is not None else 0
+        right_height = right.height if right is not None else 0
+
+        # Left Left / Left Right Case
+        if left_height > right_height + 1:
+            if self.get_height(left.left) < self.get_height(left.right):
+                root.left = self.left_rotate(left)
             return self.right_rotate(root)
 
-        # Left Right Case
-        if balance > 1 and self.get_balance(root.left) < 0:
-            root.left = self.left_rotate(root.left)
-            return self.right_rotate(root)
-
-        # Right Right Case
-        if balance < -1 and self.get_balance(root.right) <= 0:
-            return self.left_rotate(root)
-
-        # Right Left Case
-        if balance < -1 and self.get_balance(root.right) > 0:
-            root.right = self.right_rotate(root.right)
+        # Right Right / Right Left Case
+        if right_height > left_height + 1:
+            if self.get_height(right.right) < self.get_height(right.left):
+                root.right = self.right_rotate(right)
             return self.left_rotate(root)
 
+        # Balanced: the rotations update heights themselves, so only this case does
+        self._update(root)
         return root
-    
+
+    def build_balanced(self, values, lo=0, hi=None, payloads=None, counts=None):
+        """
+        Return the root of a perfectly balanced tree over sorted values[lo:hi].
+
+        Runs in O(n) with every height and size set, and no rotations.
+        `payloads` and `counts`, if given, are aligned with `values`.
+        """
+        if hi is None:
+            hi = len(values)
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = self._node_class(values[mid], None if payloads is None else payloads[mid])
+        if counts is not None:
+            node.count = counts[mid]
+        node.left = self.build_balanced(values, lo, mid, payloads, counts)
+        node.right = self.build_balanced(values, mid + 1, hi, payloads, counts)
+        self._update(node)
+        return node
+
+    def copy(self, root, counts=True):
+        """
+        Return a node-for-node copy of the subtree under `root`.
+
+        Without `counts`, every value is copied once.
+        """
+        if root is None:
+            return None
+        node = self._node_class(root.value, root.payload)
+        node.left = self.copy(root.left, counts)
+        node.right = self.copy(root.right, counts)
+        if counts:
+            node.count = root.count
+        self._update(node)
+        return node
+
+    def join(self, left, node, right):
+        """
+        Join `left`, the single node `node` and `right` into one AVL tree.
+
+        Every value in `left` must be smaller than node.value and every value
+        in `right` larger. Costs O(|height(left) - height(right)| + 1).
+        """
+        left_height, right_height = self.get_height(left), self.get_height(right)
+        if left_height > right_height + 1:
+            left.right = self.join(left.right, node, right)
+            return self.rebalance(left)
+        if right_height > left_height + 1:
+            right.left = self.join(left, node, right.left)
+            return self.rebalance(right)
+        node.left, node.right = left, right
+        self._update(node)
+        return node
+
+    def join2(self, left, right):
+        """Join two AVL trees where every value in `left` is smaller than every value in `right`."""
+        if left is None:
+            return right
+        if right is None:
+            return left
+        right, node = self.pop_min(right)
+        return self.join(left, node, right)
+
+    def pop_min(self, root):
+        """Unlink the smallest node under `root`; return (new root, that node)."""
+        if root.left is None:
+            right = root.right
+            root.right = None
+            return right, root
+        root.left, node = self.pop_min(root.left)
+        return self.rebalance(root), node
+
+    def split(self, root, value):
+        """
+        Split the tree under `root` around `value` in O(log n).
+
+        Returns (left, node, right): the values smaller than `value`, the
+        detached node holding `value` (or None), and the larger values.
+        The input tree is consumed.
+        """
+        if root is None:
+            return None, None, None
+        left, right = root.left, root.right
+        if value < root.value:
+            left_left, node, left_right = self.split(left, value)
+            return left_left, node, self.join(left_right, root, right)
+        if value > root.value:
+            right_left, node, right_right = self.split(right, value)
+            return self.join(left, root, right_left), node, right_right
+        root.left = root.right = None
+        self._update(root)
+        return left, root, right
+
+    def union(self, root1, root2, counts=False):
+        """
+        Merge two trees in O(m log(n/m + 1)), keeping root1's node on equal values.
+
+        With `counts`, equal values add their counts (multiset sum). Both
+        inputs are consumed.
+        """
+        if root1 is None:
+            return root2
+        if root2 is None:
+            return root1
+        left2, found, right2 = self.split(root2, root1.value)
+        if counts and found is not None:
+            root1.count += found.count
+        left, right = root1.left, root1.right
+        return self.join(self.union(left, left2, counts), root1, self.union(right, right2, counts))
+
+    def intersection(self, root1, root2, counts=False):
+        """
+        Keep root1's nodes whose values also occur under root2.
+
+        With `counts`, each kept node gets the smaller of the two counts.
+        Both inputs are consumed.
+        """
+        if root1 is None or root2 is None:
+            return None
+        left2, found, right2 = self.split(root2, root1.value)
+        left, right = root1.left, root1.right
+        left = self.intersection(left, left2, counts)
+        right = self.intersection(right, right2, counts)
+        if found is not None:
+            if counts and found.count < root1.count:
+                root1.count = found.count
+            return self.join(left, root1, right)
+        return self.join2(left, right)
+
+    def difference(self, root1, root2, counts=False):
+        """
+        Keep root1's nodes whose values do not occur under root2.
+
+        With `counts`, a shared value instead loses root2's count of copies
+        and is dropped only when none remain. Both inputs are consumed.
+        """
+        if root1 is None or root2 is None:
+            return root1
+        left1, found, right1 = self.split(root1, root2.value)
+        left, right = root2.left, root2.right
+        left, right = self.difference(left1, left, counts), self.difference(right1, right, counts)
+        if counts and found is not None and found.count > root2.count:
+            found.count -= root2.count
+            return self.join(left, found, right)
+        return self.join2(left, right)
+
+    def _update(self, node):
+        """Recompute the height and size of `node` from its children."""
+        left, right = node.left, node.right
+        if left is None:
+            if right is None:
+                node.height, node.size = 1, node.count
+            else:
+                node.height, node.size = right.height + 1, right.size + node.count
+        elif right is None:
+            node.height, node.size = left.height + 1, left.size + node.count
+        else:
+            node.height = 1 + (left.height if left.height > right.height else right.height)
+            node.size = node.count + left.size + right.size
+
     def get_height(self, node):
         if not node:
             return 0
         return node.height
 
+    def get_size(self, node):
+        if not node:
+            return 0
+        return node.size
+
     def get_balance(self, node):
         if not node:
             return 0
@@ -113,8 +288,8 @@ class AVLTree:
         z.left = T3
 
         # Update heights
-        z.height = 1 + max(self.get_height(z.left), self.get_height(z.right))
-        y.height = 1 + max(self.get_height(y.left), self.get_height(y.right))
+        self._update(z)
+        self._update(y)
 
         return y
 
@@ -127,8 +302,8 @@ class AVLTree:
         z.right = T2
 
         # Update heights
-        z.height = 1 + max(self.get_height(z.left), self.get_height(z.right))
-        y.height = 1 + max(self.get_height(y.left), self.get_height(y.right))
+        self._update(z)
+        self._update(y)
 
         return y
 
@@ -138,9 +313,213 @@ class AVLTree:
         return self.get_min_value_node(root.left)
 
     def inorder_traversal(self, root):
-        result = []
-        if root:
-            result = self.inorder_traversal(root.left)
-            result.append(root.value)
-            result = result + self.inorder_traversal(root.right)
-        return result
\ No newline at end of file
+        return list(_iter_inorder(root, True))
+
+    def iter_inorder(self, root):
+        """Yield the values under `root` in sorted order, lazily and in O(n) total."""
+        return _iter_inorder(root, True)
+
+    def irange(self, root, lo=None, hi=None, inclusive=(True, True)):
+        """Yield the values under `root` from `lo` to `hi`, in O(log n + k)."""
+        return _iter_range(root, lo, hi, inclusive, True)
+
+
+class AVLTreeMap(BinarySearchTree):
+    """
+    A self-balancing ordered container that owns its AVL tree.
+
+    Shares the API of BinarySearchTree: search, find_min/find_max, the
+    traversals, the `from_sorted` / `from_iterable` bulk loaders (which
+    here also set every height and size), and the key/value mode with
+    `key=`, `tree[key]`, `get`, `floor`, `ceiling`, `predecessor` and
+    `successor`, and multiset mode with `multiset=True` and `count`.
+    Insert and delete rebalance, and every node stores its subtree size,
+    so order statistics are O(log n); in multiset mode they count every
+    copy, as `len` does.
+
+    Methods:
+    --------
+    insert(value):
+        Inserts a value; duplicates are ignored, or counted on their node
+        in multiset mode.
+    delete(value):
+        Deletes a value if present.
+    len(tree), value in tree:
+        Number of values and membership, O(1) and O(log n).
+    rank(value) -> int:
+        Returns how many stored values are smaller than `value`.
+    select(k):
+        Returns the value at 0-based position `k` in sorted order.
+    kth_smallest(k):
+        Returns the k-th smallest value, counting from 1.
+    insert_many(values), delete_many(values):
+        Batch updates through split/join in O(m log(n/m + 1)) after sorting.
+    union(other), intersection(other), difference(other):
+        Set algebra returning a new tree; the `*_update` forms work in place.
+        Where keys collide, `union`/`update` take the payload from `other`
+        if it holds payloads, and otherwise keep this tree's, as the others do.
+    split(value):
+        Splits into the values below `value` and the rest.
+    """
+
+    _node_class = AVLNode
+    _mode_node_classes = {
+        (True, False): AVLMapNode,
+        (False, True): AVLMultiNode,
+        (True, True): AVLMultiMapNode,
+    }
+
+    def __init__(self, key=None, multiset=False):
+        super().__init__(key, multiset)
+        self._avl = AVLTree(self._node_class)
+
+    def _store_payloads(self):
+        super()._store_payloads()
+        self._avl._node_class = self._node_class
+
+    def __len__(self):
+        return self.root.size if self.root is not None else 0
+
+    def _build_balanced(self, keys, payloads, lo, hi, counts=None):
+        return self._avl.build_balanced(keys, lo, hi, payloads, counts)
+
+    def _put(self, key, payload, replace, add=False):
+        self.root = self._insert(self.root, key, payload, replace, add)
+
+    def _insert(self, node, key, payload, replace, add):
+        if node is None:
+            return self._node_class(key, payload)
+        if key < node.value:
+            node.left = self._insert(node.left, key, payload, replace, add)
+        elif key > node.value:
+            node.right = self._insert(node.right, key, payload, replace, add)
+        else:
+            if replace:
+                node.payload = payload
+            if add:
+                node.count += 1
+                node.size += 1
+            return node  # Already present: the shape is unchanged, so no rebalancing
+        return self._avl.rebalance(node)
+
+    def _remove(self, value, decrement=False) -> bool:
+        size = len(self)
+        self.root = self._avl.delete(self.root, value, not decrement)
+        return len(self) < size
+
+    def _from_root(self, root):
+        tree = type(self)(key=self.key, multiset=self.multiset)
+        if self._payloads:
+            tree._store_payloads()
+        tree.root = root
+        return tree
+
+    def _copy(self, root):
+        """Copy a subtree into this tree's node class (keeping counts only in multiset mode)."""
+        return self._avl.copy(root, self.multiset)
+
+    def _delta(self, values, key=None):
+        """Build a fresh balanced tree from any iterable of values (or of items, with `key`)."""
+        values = sorted(values, key=key)
+        if self.multiset:
+            keys, payloads, counts = _sorted_runs(values, key)
+        else:
+            (keys, payloads), counts = _sorted_unique(values, key), None
+        return self._build_balanced(keys, payloads, 0, len(keys), counts)
+
+    def _union(self, incoming, existing, payloads):
+        """
+        Merge two roots, keeping `incoming`'s node on equal keys only when it
+        carries `payloads`; plain values leave the existing payloads alone.
+        """
+        if payloads:
+            return self._avl.union(incoming, existing, self.multiset)
+        return self._avl.union(existing, incoming, self.multiset)
+
+    def insert_many(self, values):
+        """Insert a batch of m values in O(m log m + m log(n/m + 1))."""
+        self.root = self._union(self._delta(values, self.key), self.root, self.key is not None)
+
+    def delete_many(self, values):
+        """Delete a batch of m values in O(m log m + m log(n/m + 1))."""
+        self.root = self._avl.difference(self.root, self._delta(values), self.multiset)
+
+    def update(self, other):
+        """Add every value of another AVLTreeMap to this one, in place."""
+        if other._payloads and not self._payloads:
+            self._store_payloads()
+        self.root = self._union(self._copy(other.root), self.root, other._payloads)
+
+    def intersection_update(self, other):
+        """Keep only the values also in `other`, in place."""
+        self.root = self._avl.intersection(self.root, self._copy(other.root), self.multiset)
+
+    def difference_update(self, other):
+        """Remove every value that is in `other`, in place."""
+        self.root = self._avl.difference(self.root, self._copy(other.root), self.multiset)
+
+    def union(self, other):
+        """Return a new tree with the values of both trees."""
+        tree = self._from_root(None)
+        if other._payloads and not tree._payloads:
+            tree._store_payloads()
+        tree.root = tree._union(tree._copy(other.root), tree._copy(self.root), other._payloads)
+        return tree
+
+    def intersection(self, other):
+        """Return a new tree with the values present in both trees."""
+        root = self._avl.intersection(self._copy(self.root), self._copy(other.root), self.multiset)
+        return self._from_root(root)
+
+    def difference(self, other):
+        """Return a new tree with the values of this tree that are not in `other`."""
+        root = self._avl.difference(self._copy(self.root), self._copy(other.root), self.multiset)
+        return self._from_root(root)
+
+    def split(self, value):
+        """
+        Split into two trees in O(log n): values below `value`, and values
+        from `value` up. This tree is left empty.
+        """
+        left, node, right = self._avl.split(self.root, value)
+        if node is not None:
+            right = self._avl.join(None, node, right)
+        self.root = None
+        return self._from_root(left), self._from_root(right)
+
+    def height(self) -> int:
+        """Return the height of the tree (-1 when empty, 0 for a single node)."""
+        return self.root.height - 1 if self.root is not None else -1
+
+    def rank(self, value) -> int:
+        """Return the number of stored values strictly smaller than `value`."""
+        rank = 0
+        node = self.root
+        while node is not None:
+            if value < node.value:
+                node = node.left
+            elif value > node.value:
+                rank += self._avl.get_size(node.left) + node.count
+                node = node.right
+            else:
+                return rank + self._avl.get_size(node.left)
+        return rank
+
+    def select(self, k):
+        """Return the value at 0-based position `k` in sorted order."""
+        if not 0 <= k < len(self):
+            raise IndexError("select index out of range")
+        node = self.root
+        while True:
+            left_size = self._avl.get_size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k < left_size + node.count:
+                return node.value
+            else:
+                k -= left_size + node.count
+                node = node.right
+
+    def kth_smallest(self, k):
+        """Return the k-th smallest value, counting from 1."""
+        return self.select(k - 1)
@@ -0,0 +1,15 @@
+# batch.py
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch results are plain lists without it
+    np = None
+
+
+def to_mask(hits, as_numpy=False):
+    """Return a list of bools unchanged, or as a NumPy bool array when `as_numpy`."""
+    if not as_numpy:
+        return hits
+    if np is None:
+        raise ImportError("as_numpy=True requires NumPy, which is not installed")
+    return np.array(hits, dtype=bool)
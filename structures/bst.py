@@ -1,4 +1,177 @@
-from .node import Node
+from bisect import bisect_left
+from itertools import repeat
+
+from .batch import to_mask
+from .frozen import FrozenIndex
+from .node import BSTMapNode, BSTMultiMapNode, BSTMultiNode, BSTNode
+
+
+def _iter_inorder(node, counts=False):
+    """
+    Yield the values of the subtree rooted at `node` in sorted order, lazily.
+
+    With `counts`, each value is repeated as many times as its node's count.
+    """
+    stack = []
+    while True:
+        while node is not None:
+            stack.append(node)
+            node = node.left
+        if not stack:
+            return
+        node = stack.pop()
+        if counts:
+            yield from repeat(node.value, node.count)
+        else:
+            yield node.value
+        node = node.right
+
+
+def _iter_range(node, lo=None, hi=None, inclusive=(True, True), counts=False):
+    """
+    Yield the values between `lo` and `hi` of the subtree rooted at `node`, lazily.
+
+    Descends straight to `lo` and stops at `hi`, so a window of k values
+    costs O(h + k). A bound of None is open. `counts` repeats values as in
+    `_iter_inorder`.
+    """
+    lo_inclusive, hi_inclusive = inclusive
+    stack = []
+    while node is not None:
+        if lo is None or lo < node.value or (lo_inclusive and lo == node.value):
+            stack.append(node)
+            node = node.left
+        else:
+            node = node.right
+    while stack:
+        node = stack.pop()
+        value = node.value
+        if hi is not None and (hi < value or (not hi_inclusive and hi == value)):
+            return
+        if counts:
+            yield from repeat(value, node.count)
+        else:
+            yield value
+        node = node.right
+        while node is not None:
+            stack.append(node)
+            node = node.left
+
+
+def _iter_nodes(node):
+    """Yield the nodes of the subtree rooted at `node` in sorted order, lazily."""
+    stack = []
+    while True:
+        while node is not None:
+            stack.append(node)
+            node = node.left
+        if not stack:
+            return
+        node = stack.pop()
+        yield node
+        node = node.right
+
+
+def _convert(root, node_class):
+    """
+    Return a copy of the subtree rooted at `root` built from `node_class` nodes.
+
+    The shape is kept and every field of `node_class` is copied over; a
+    field the old nodes lack takes its class default.
+    """
+    if root is None:
+        return None
+    fields = [name for klass in node_class.__mro__ for name in klass.__dict__.get('__slots__', ())]
+    copies = {}
+    for node in _iter_nodes(root):
+        copy = copies[node] = node_class.__new__(node_class)
+        for name in fields:
+            setattr(copy, name, getattr(node, name))
+    for copy in copies.values():
+        if copy.left is not None:
+            copy.left = copies[copy.left]
+        if copy.right is not None:
+            copy.right = copies[copy.right]
+    return copies[root]
+
+
+def _search_many(node, probes):
+    """
+    Return a list saying which of `probes` occur in the subtree rooted at `node`.
+
+    The probes are sorted once and pushed down the tree together: each node
+    splits its slice of them with bisect, so a subtree that no probe falls
+    into is never entered. That is a single partial in-order walk instead of
+    a root-to-leaf descent per probe.
+    """
+    order = sorted(range(len(probes)), key=probes.__getitem__)
+    keys = [probes[i] for i in order]
+    found = [False] * len(keys)
+    stack = [(node, 0, len(keys))] if node is not None and keys else []
+    push, pop = stack.append, stack.pop
+    while stack:
+        node, lo, hi = pop()
+        value = node.value
+        i = j = bisect_left(keys, value, lo, hi)
+        while j < hi and keys[j] == value:  # Every copy of a repeated probe
+            found[j] = True
+            j += 1
+        if lo < i and node.left is not None:
+            push((node.left, lo, i))
+        if j < hi and node.right is not None:
+            push((node.right, j, hi))
+    hits = [False] * len(probes)
+    for position, i in enumerate(order):
+        hits[i] = found[position]
+    return hits
+
+
+def _sorted_unique(iterable, key=None):
+    """
+    Return (keys, items) for a sorted iterable with duplicate keys dropped.
+
+    Without `key` the items are their own keys and `items` is None. With
+    `key`, the last item of each run of equal keys is kept, matching what
+    repeated inserts would leave. Raises ValueError if the keys are not
+    in ascending order.
+    """
+    items = list(iterable)
+    keys = items if key is None else [key(item) for item in items]
+    if all(a < b for a, b in zip(keys, keys[1:])):
+        return keys, (None if key is None else items)
+    unique_keys, unique_items = keys[:1], items[:1]
+    for k, item in zip(keys[1:], items[1:]):
+        if unique_keys[-1] < k:
+            unique_keys.append(k)
+            unique_items.append(item)
+        elif unique_keys[-1] == k:
+            unique_items[-1] = item
+        else:
+            raise ValueError("Input is not sorted")
+    return unique_keys, (None if key is None else unique_items)
+
+
+def _sorted_runs(iterable, key=None):
+    """
+    Return (keys, items, counts) for a sorted iterable, one entry per run of equal keys.
+
+    Like `_sorted_unique`, but `counts` records the length of each run.
+    """
+    keys, items, counts = [], [], []
+    for item in iterable:
+        k = item if key is None else key(item)
+        if keys and not keys[-1] < k:
+            if keys[-1] == k:
+                items[-1] = item
+                counts[-1] += 1
+                continue
+            raise ValueError("Input is not sorted")
+        keys.append(k)
+        items.append(item)
+        counts.append(1)
+    return keys, (None if key is None else items), counts
+
+
 class BinarySearchTree:
     """
     A class that implements a binary search tree (BST) with basic functionalities.
@@ -23,70 +196,323 @@ class BinarySearchTree:
         Returns the maximum value in the BST.
     height():
         Returns the height of the BST.
+    from_sorted(iterable), from_iterable(iterable):
+        Build a perfectly balanced tree in one linear pass.
+    iter(tree):
+        Lazily yields the values in sorted order.
+    irange(lo, hi, inclusive=(True, True)):
+        Lazily yields the values between `lo` and `hi` in sorted order.
+    search_many(values, as_numpy=False):
+        Returns which of a batch of values are present, in one walk.
+    freeze(layout='sorted', typecode=None) -> FrozenIndex:
+        Returns an immutable array-backed index of the values.
+
+    Key/value mode:
+    ---------------
+    tree[key] = value, tree[key], del tree[key], get(key, default):
+        Map a key to a payload; each access is a single descent.
+    floor(key), ceiling(key), predecessor(key), successor(key):
+        Return the nearest stored key (None if there is none).
+    items(), values():
+        Lazily yield (key, payload) pairs or payloads in key order.
+
+    With `key=` given, `insert` stores whole items ordered by `key(item)`
+    (a later item with an equal key replaces the earlier one) and every
+    lookup (search, delete, [], floor, ...) takes a key.
+
+    Multiset mode:
+    --------------
+    With `multiset=True`, inserting a value already present increments a
+    count on its node instead of being ignored, and `delete` decrements it,
+    unlinking the node only at zero; `del tree[key]` removes every copy.
+    count(value) reports the multiplicity. Iteration, `irange` and
+    `inorder_traversal` repeat each value by its count; `items`, `values`
+    and the other traversals visit each node once.
+
+    Nodes only carry the payload and count fields of the modes in use. A
+    tree made without `key=` adds payload fields to its nodes the first
+    time `tree[key] = value` is used, which copies the tree once.
     """
 
-    def __init__(self):
+    _node_class = BSTNode  # Subclasses that reuse these algorithms swap in their own node
+    # Node classes for (key/value mode, multiset mode); the rest use _node_class
+    _mode_node_classes = {
+        (True, False): BSTMapNode,
+        (False, True): BSTMultiNode,
+        (True, True): BSTMultiMapNode,
+    }
+
+    def __init__(self, key=None, multiset=False):
         self.root = None
+        self.key = key  # Maps an inserted item to the key it is ordered by
+        self.multiset = multiset  # Count repeated inserts instead of ignoring them
+        self._payloads = key is not None
+        self._node_class = self._mode_node_classes.get((self._payloads, multiset), self._node_class)
+
+    def _store_payloads(self):
+        """Switch to nodes with a payload field, converting the ones already in the tree."""
+        self._payloads = True
+        node_class = self._mode_node_classes.get((True, self.multiset))
+        if node_class is not None and node_class is not self._node_class:
+            self._node_class = node_class
+            self.root = _convert(self.root, node_class)
+
+    @classmethod
+    def from_sorted(cls, iterable, key=None, multiset=False):
+        """
+        Build a perfectly balanced tree from values in ascending order in O(n).
+
+        Duplicates are dropped (counted, in multiset mode); raises
+        ValueError if the input is not sorted.
+        """
+        tree = cls(key=key, multiset=multiset)
+        if multiset:
+            keys, items, counts = _sorted_runs(iterable, key)
+        else:
+            (keys, items), counts = _sorted_unique(iterable, key), None
+        tree.root = tree._build_balanced(keys, items, 0, len(keys), counts)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, iterable, key=None, multiset=False):
+        """Build a perfectly balanced tree from values in any order in O(n log n)."""
+        return cls.from_sorted(sorted(iterable, key=key), key=key, multiset=multiset)
+
+    def _build_balanced(self, keys, payloads, lo, hi, counts=None):
+        """Return the root of a balanced subtree over keys[lo:hi]."""
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = self._node_class(keys[mid], None if payloads is None else payloads[mid])
+        if counts is not None:
+            node.count = counts[mid]
+        node.left = self._build_balanced(keys, payloads, lo, mid, counts)
+        node.right = self._build_balanced(keys, payloads, mid + 1, hi, counts)
+        return node
+
+    def __iter__(self):
+        """Yield the values in sorted order."""
+        return _iter_inorder(self.root, self.multiset)
+
+    def irange(self, lo=None, hi=None, inclusive=(True, True)):
+        """
+        Yield the values from `lo` to `hi` in sorted order.
+
+        `inclusive` says whether each bound is included; None leaves that
+        side open. Costs O(h + k) for k values yielded.
+        """
+        return _iter_range(self.root, lo, hi, inclusive, self.multiset)
+
+    def freeze(self, layout='sorted', typecode=None):
+        """
+        Return an immutable, array-backed FrozenIndex of the distinct keys.
+
+        `layout` is 'sorted' or 'eytzinger'; `typecode` packs numeric keys
+        (see FrozenIndex). The tree itself is unchanged.
+        """
+        return FrozenIndex(_iter_inorder(self.root), layout, typecode)
 
     def insert(self, value):
         """Insert a new node with the given value into the binary search tree."""
-        if self.root is None:
-            self.root = Node(value)
+        if self.key is None:
+            self._put(value, None, False, self.multiset)  # Duplicates are ignored unless counted
         else:
-            self._insert(self.root, value)
+            self._put(self.key(value), value, True, self.multiset)
 
-    def _insert(self, current_node, value):
-        if value < current_node.value:
-            if current_node.left is None:
-                current_node.left = Node(value)
+    def _put(self, key, payload, replace, add=False):
+        """
+        Add `key` in one descent. If it is present, set its payload only when
+        `replace` and bump its count only when `add`.
+        """
+        if self.root is None:
+            self.root = self._node_class(key, payload)
+            return
+        current_node = self.root
+        while True:
+            if key < current_node.value:
+                if current_node.left is None:
+                    current_node.left = self._node_class(key, payload)
+                    return
+                current_node = current_node.left
+            elif key > current_node.value:
+                if current_node.right is None:
+                    current_node.right = self._node_class(key, payload)
+                    return
+                current_node = current_node.right
             else:
-                self._insert(current_node.left, value)
-        elif value > current_node.value:
-            if current_node.right is None:
-                current_node.right = Node(value)
+                if replace:
+                    current_node.payload = payload
+                if add:
+                    current_node.count += 1
+                return
+
+    def _locate(self, key):
+        """Return the node holding `key`, or None."""
+        current_node = self.root
+        while current_node is not None:
+            if key == current_node.value:
+                return current_node
+            elif key < current_node.value:
+                current_node = current_node.left
             else:
-                self._insert(current_node.right, value)
+                current_node = current_node.right
+        return None
 
     def search(self, value) -> bool:
         """Search for a value in the BST. Returns True if found, False otherwise."""
-        return self._search(self.root, value)
+        return self._locate(value) is not None
 
-    def _search(self, current_node, value) -> bool:
-        if current_node is None:
-            return False
-        if value == current_node.value:
-            return True
-        elif value < current_node.value:
-            return self._search(current_node.left, value)
-        else:
-            return self._search(current_node.right, value)
+    def count(self, value) -> int:
+        """Return how many times `value` is stored (0 or 1 outside multiset mode)."""
+        node = self._locate(value)
+        return 0 if node is None else node.count
+
+    def __contains__(self, key):
+        return self._locate(key) is not None
+
+    def search_many(self, values, as_numpy=False):
+        """
+        Return, for each of `values` in order, whether it is in the tree.
+
+        Sorts the probes and walks the tree once, visiting only the subtrees
+        some probe falls into, instead of descending from the root for each.
+        Returns a list of bools, or a NumPy bool array with `as_numpy`.
+        """
+        return to_mask(_search_many(self.root, list(values)), as_numpy)
+
+    def __getitem__(self, key):
+        node = self._locate(key)
+        if node is None:
+            raise KeyError(key)
+        return node.payload
+
+    def __setitem__(self, key, value):
+        if not self._payloads:
+            self._store_payloads()
+        self._put(key, value, True)
+
+    def __delitem__(self, key):
+        if not self._remove(key):
+            raise KeyError(key)
+
+    def get(self, key, default=None):
+        """Return the payload stored under `key`, or `default` if it is absent."""
+        node = self._locate(key)
+        return default if node is None else node.payload
+
+    def floor(self, key):
+        """Return the largest stored key less than or equal to `key`, or None."""
+        best = None
+        current_node = self.root
+        while current_node is not None:
+            if key < current_node.value:
+                current_node = current_node.left
+            elif key > current_node.value:
+                best = current_node
+                current_node = current_node.right
+            else:
+                return current_node.value
+        return None if best is None else best.value
+
+    def ceiling(self, key):
+        """Return the smallest stored key greater than or equal to `key`, or None."""
+        best = None
+        current_node = self.root
+        while current_node is not None:
+            if key > current_node.value:
+                current_node = current_node.right
+            elif key < current_node.value:
+                best = current_node
+                current_node = current_node.left
+            else:
+                return current_node.value
+        return None if best is None else best.value
+
+    def predecessor(self, key):
+        """Return the largest stored key strictly less than `key`, or None."""
+        best = None
+        current_node = self.root
+        while current_node is not None:
+            if current_node.value < key:
+                best = current_node
+                current_node = current_node.right
+            else:
+                current_node = current_node.left
+        return None if best is None else best.value
+
+    def successor(self, key):
+        """Return the smallest stored key strictly greater than `key`, or None."""
+        best = None
+        current_node = self.root
+        while current_node is not None:
+            if current_node.value > key:
+                best = current_node
+                current_node = current_node.left
+            else:
+                current_node = current_node.right
+        return None if best is None else best.value
+
+    def items(self):
+        """Yield (key, payload) pairs in key order."""
+        for node in _iter_nodes(self.root):
+            yield node.value, node.payload
+
+    def values(self):
+        """Yield the payloads in key order."""
+        for node in _iter_nodes(self.root):
+            yield node.payload
 
     def delete(self, value):
-        """Delete a node with the given value from the BST."""
-        self.root = self._delete(self.root, value)
+        """Delete a node with the given value from the BST (one copy, in multiset mode)."""
+        self._remove(value, True)
 
-    def _delete(self, current_node, value):
-        if current_node is None:
-            return current_node
+    def _remove(self, value, decrement=False) -> bool:
+        """
+        Unlink the node holding `value`; return whether there was one.
+
+        With `decrement`, a node stored more than once only loses one copy.
+        """
+        parent = None
+        current_node = self.root
 
         # Find the node to delete
-        if value < current_node.value:
-            current_node.left = self._delete(current_node.left, value)
-        elif value > current_node.value:
-            current_node.right = self._delete(current_node.right, value)
-        else:
-            # Node with only one child or no child
-            if current_node.left is None:
-                return current_node.right
-            elif current_node.right is None:
-                return current_node.left
+        while current_node is not None:
+            if value < current_node.value:
+                parent, current_node = current_node, current_node.left
+            elif value > current_node.value:
+                parent, current_node = current_node, current_node.right
+            else:
+                break
+        if current_node is None:
+            return False
+        if decrement and current_node.count > 1:
+            current_node.count -= 1
+            return True
 
-            # Node with two children: Get the inorder successor (smallest in the right subtree)
-            min_val = self._min_value_node(current_node.right)
-            current_node.value = min_val.value
-            current_node.right = self._delete(current_node.right, min_val.value)
+        if current_node.left is None:
+            # Node with only one child or no child
+            replacement = current_node.right
+        elif current_node.right is None:
+            replacement = current_node.left
+        else:
+            # Node with two children: unlink the inorder successor (smallest in
+            # the right subtree) and put it in the deleted node's place
+            successor_parent = current_node
+            replacement = current_node.right
+            while replacement.left is not None:
+                successor_parent, replacement = replacement, replacement.left
+            if successor_parent is not current_node:
+                successor_parent.left = replacement.right
+                replacement.right = current_node.right
+            replacement.left = current_node.left
 
-        return current_node
+        if parent is None:
+            self.root = replacement
+        elif parent.left is current_node:
+            parent.left = replacement
+        else:
+            parent.right = replacement
+        return True
 
     def _min_value_node(self, node):
         current = node
@@ -94,71 +520,76 @@ class BinarySearchTree:
             current = current.left
         return current
 
+    def _max_value_node(self, node):
+        current = node
+        while current.right is not None:
+            current = current.right
+        return current
+
     def find_min(self) -> int:
         """Return the minimum value in the BST."""
         if self.root is None:
             raise ValueError("The tree is empty")
-        return self._find_min(self.root).value
-
-    def _find_min(self, current_node):
-        if current_node.left is None:
-            return current_node
-        return self._find_min(current_node.left)
+        return self._min_value_node(self.root).value
 
     def find_max(self) -> int:
         """Return the maximum value in the BST."""
         if self.root is None:
             raise ValueError("The tree is empty")
-        return self._find_max(self.root).value
-
-    def _find_max(self, current_node):
-        if current_node.right is None:
-            return current_node
-        return self._find_max(current_node.right)
+        return self._max_value_node(self.root).value
 
     def inorder_traversal(self) -> list:
         """Return the values of the nodes in an in-order traversal."""
+        if self.multiset:
+            return list(self)
         result = []
-        self._inorder(self.root, result)
-        return result
-
-    def _inorder(self, current_node, result):
-        if current_node:
-            self._inorder(current_node.left, result)
-            result.append(current_node.value)
-            self._inorder(current_node.right, result)
+        append = result.append
+        stack = []
+        push, pop = stack.append, stack.pop
+        current_node = self.root
+        while True:
+            while current_node is not None:
+                push(current_node)
+                current_node = current_node.left
+            if not stack:
+                return result
+            current_node = pop()
+            append(current_node.value)
+            current_node = current_node.right
 
     def preorder_traversal(self) -> list:
         """Return the values of the nodes in a pre-order traversal."""
         result = []
-        self._preorder(self.root, result)
-        return result
-
-    def _preorder(self, current_node, result):
-        if current_node:
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            current_node = stack.pop()
             result.append(current_node.value)
-            self._preorder(current_node.left, result)
-            self._preorder(current_node.right, result)
+            if current_node.right is not None:
+                stack.append(current_node.right)
+            if current_node.left is not None:
+                stack.append(current_node.left)
+        return result
 
     def postorder_traversal(self) -> list:
         """Return the values of the nodes in a post-order traversal."""
+        # Visit root, right, left and reverse: that is left, right, root.
         result = []
-        self._postorder(self.root, result)
-        return result
-
-    def _postorder(self, current_node, result):
-        if current_node:
-            self._postorder(current_node.left, result)
-            self._postorder(current_node.right, result)
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            current_node = stack.pop()
             result.append(current_node.value)
+            if current_node.left is not None:
+                stack.append(current_node.left)
+            if current_node.right is not None:
+                stack.append(current_node.right)
+        result.reverse()
+        return result
 
     def height(self) -> int:
         """Return the height of the BST."""
-        return self._height(self.root)
-
-    def _height(self, current_node) -> int:
-        if current_node is None:
-            return -1  # Empty tree has height -1
-        left_height = self._height(current_node.left)
-        right_height = self._height(current_node.right)
-        return max(left_height, right_height) + 1
+        height = -1  # Empty tree has height -1
+        level = [self.root] if self.root is not None else []
+        while level:
+            height += 1
+            level = [child for node in level for child in (node.left, node.right) if child is not None]
+        return height
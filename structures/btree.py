@@ -0,0 +1,301 @@
+# btree.py
+
+from bisect import bisect_left, bisect_right
+
+from .batch import to_mask
+from .bst import _sorted_unique
+from .frozen import FrozenIndex
+from .node import BTreeNode
+
+
+def _spans(n, capacity):
+    """Split range(n) into the fewest even (lo, hi) spans of at most `capacity` items."""
+    count = -(-n // capacity)
+    return [(i * n // count, (i + 1) * n // count) for i in range(count)]
+
+
+class BTree:
+    """
+    An ordered container that packs many keys into each node (a B+-tree).
+
+    Keys live only in the leaves, as sorted Python lists, and each leaf
+    links to the next, so in-order and range scans walk the leaves without
+    climbing back up. Internal nodes hold separator keys: child i covers
+    the keys from keys[i - 1] up to, but not including, keys[i]. Every
+    level costs one `bisect` on a list, so with `order` keys per node a
+    million keys sit 3 or 4 levels deep instead of about 25 in an AVL tree,
+    and a key costs a list slot rather than a node object.
+
+    Offers the ordered-set API of BinarySearchTree; duplicates are ignored.
+
+    Methods:
+    --------
+    insert(value):
+        Inserts a value, splitting full nodes on the way back up.
+    search(value) -> bool, value in tree, len(tree):
+        Membership and size.
+    search_many(values, as_numpy=False):
+        Membership for a batch of values, descending once per leaf visited.
+    delete(value):
+        Deletes a value if present, borrowing from or merging with a
+        sibling when a node falls below half full.
+    inorder_traversal(), iter(tree):
+        The values in sorted order.
+    irange(lo, hi, inclusive=(True, True)):
+        Lazily yields the values between `lo` and `hi` along the leaf chain.
+    find_min(), find_max(), height():
+        As on BinarySearchTree.
+    from_sorted(iterable), from_iterable(iterable):
+        Build a tree of packed leaves in one linear pass.
+    freeze(layout='sorted', typecode=None) -> FrozenIndex:
+        Returns an immutable array-backed index of the values.
+    """
+
+    def __init__(self, order=64):
+        if order < 3:
+            raise ValueError("order must be at least 3")
+        self.order = order              # Maximum number of keys in a node
+        self._min_keys = order // 2     # Minimum for any node but the root
+        self.root = BTreeNode([])
+        self._head = self.root          # Leftmost leaf; splits and merges keep it first
+        self.size = 0
+
+    @classmethod
+    def from_sorted(cls, iterable, order=64):
+        """
+        Build a tree from values in ascending order in O(n), with every node
+        as full as an even split allows.
+
+        Duplicates are dropped; raises ValueError if the input is not sorted.
+        """
+        tree = cls(order)
+        keys, _ = _sorted_unique(iterable)
+        if not keys:
+            return tree
+        nodes = [BTreeNode(keys[lo:hi]) for lo, hi in _spans(len(keys), order)]
+        for leaf, following in zip(nodes, nodes[1:]):
+            leaf.next = following
+        tree._head = nodes[0]
+        lows = [leaf.keys[0] for leaf in nodes]  # Smallest key under each node
+        while len(nodes) > 1:
+            spans = _spans(len(nodes), order + 1)
+            nodes, lows = (
+                [BTreeNode(lows[lo + 1:hi], nodes[lo:hi]) for lo, hi in spans],
+                [lows[lo] for lo, _ in spans],
+            )
+        tree.root, tree.size = nodes[0], len(keys)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, iterable, order=64):
+        """Build a tree from values in any order in O(n log n)."""
+        return cls.from_sorted(sorted(iterable), order)
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, value):
+        return self.search(value)
+
+    def __iter__(self):
+        """Yield the values in sorted order."""
+        leaf = self._head
+        while leaf is not None:
+            yield from leaf.keys
+            leaf = leaf.next
+
+    def _find_leaf(self, value):
+        """Return the leaf whose range covers `value`."""
+        node = self.root
+        while node.children is not None:
+            node = node.children[bisect_right(node.keys, value)]
+        return node
+
+    def search(self, value) -> bool:
+        """Search for a value in the tree. Returns True if found, False otherwise."""
+        keys = self._find_leaf(value).keys
+        i = bisect_left(keys, value)
+        return i < len(keys) and keys[i] == value
+
+    def search_many(self, values, as_numpy=False):
+        """
+        Return, for each of `values` in order, whether it is in the tree.
+
+        Takes the probes in sorted order and descends from the root only when
+        a probe lies past the current leaf, so probes sharing a leaf share its
+        descent. Returns a list of bools, or a NumPy bool array with `as_numpy`.
+        """
+        probes = list(values)
+        hits = [False] * len(probes)
+        if not self.size:
+            return to_mask(hits, as_numpy)
+        keys = None
+        for i in sorted(range(len(probes)), key=probes.__getitem__):
+            probe = probes[i]
+            if keys is None or not probe <= keys[-1]:
+                keys = self._find_leaf(probe).keys
+            j = bisect_left(keys, probe)
+            hits[i] = j < len(keys) and keys[j] == probe
+        return to_mask(hits, as_numpy)
+
+    def insert(self, value):
+        """Insert a value into the tree; duplicates are ignored."""
+        path = []  # (internal node, index of the child taken)
+        node = self.root
+        while node.children is not None:
+            i = bisect_right(node.keys, value)
+            path.append((node, i))
+            node = node.children[i]
+        keys = node.keys
+        i = bisect_left(keys, value)
+        if i < len(keys) and keys[i] == value:
+            return
+        keys.insert(i, value)
+        self.size += 1
+        if len(keys) > self.order:
+            self._split(node, path)
+
+    def _split(self, node, path):
+        """Split overfull nodes from `node` up the path, growing a new root if needed."""
+        while len(node.keys) > self.order:
+            mid = len(node.keys) // 2
+            if node.children is None:
+                sibling = BTreeNode(node.keys[mid:])
+                sibling.next, node.next = node.next, sibling
+                separator = sibling.keys[0]
+            else:
+                # The middle key moves up rather than being copied
+                sibling = BTreeNode(node.keys[mid + 1:], node.children[mid + 1:])
+                separator = node.keys[mid]
+                del node.children[mid + 1:]
+            del node.keys[mid:]
+            if not path:
+                self.root = BTreeNode([separator], [node, sibling])
+                return
+            parent, i = path.pop()
+            parent.keys.insert(i, separator)
+            parent.children.insert(i + 1, sibling)
+            node = parent
+
+    def delete(self, value):
+        """Delete a value from the tree if present."""
+        path = []
+        node = self.root
+        while node.children is not None:
+            i = bisect_right(node.keys, value)
+            path.append((node, i))
+            node = node.children[i]
+        keys = node.keys
+        i = bisect_left(keys, value)
+        if i == len(keys) or keys[i] != value:
+            return
+        del keys[i]
+        self.size -= 1
+        if len(keys) < self._min_keys:
+            self._refill(node, path)
+
+    def _refill(self, node, path):
+        """Bring underfull nodes from `node` up the path back to half full."""
+        minimum = self._min_keys
+        while path and len(node.keys) < minimum:
+            parent, i = path.pop()
+            children = parent.children
+            if i > 0 and len(children[i - 1].keys) > minimum:
+                # Borrow the last entry of the left sibling
+                left = children[i - 1]
+                if node.children is None:
+                    node.keys.insert(0, left.keys.pop())
+                    parent.keys[i - 1] = node.keys[0]
+                else:
+                    node.keys.insert(0, parent.keys[i - 1])
+                    parent.keys[i - 1] = left.keys.pop()
+                    node.children.insert(0, left.children.pop())
+                return
+            if i + 1 < len(children) and len(children[i + 1].keys) > minimum:
+                # Borrow the first entry of the right sibling
+                right = children[i + 1]
+                if node.children is None:
+                    node.keys.append(right.keys.pop(0))
+                    parent.keys[i] = right.keys[0]
+                else:
+                    node.keys.append(parent.keys[i])
+                    parent.keys[i] = right.keys.pop(0)
+                    node.children.append(right.children.pop(0))
+                return
+            self._merge(parent, i - 1 if i > 0 else i)
+            node = parent
+        if self.root.children is not None and not self.root.keys:
+            self.root = self.root.children[0]
+
+    def _merge(self, parent, i):
+        """Merge child i + 1 of `parent` into child i."""
+        left, right = parent.children[i], parent.children[i + 1]
+        if left.children is None:
+            left.keys += right.keys
+            left.next = right.next
+        else:
+            left.keys.append(parent.keys[i])
+            left.keys += right.keys
+            left.children += right.children
+        del parent.keys[i]
+        del parent.children[i + 1]
+
+    def irange(self, lo=None, hi=None, inclusive=(True, True)):
+        """
+        Yield the values from `lo` to `hi` in sorted order.
+
+        `inclusive` says whether each bound is included; None leaves that
+        side open. Costs one descent plus a walk along the leaf chain.
+        """
+        lo_inclusive, hi_inclusive = inclusive
+        if lo is None:
+            leaf, i = self._head, 0
+        else:
+            leaf = self._find_leaf(lo)
+            i = (bisect_left if lo_inclusive else bisect_right)(leaf.keys, lo)
+        while leaf is not None:
+            keys = leaf.keys
+            j = len(keys) if hi is None else (bisect_right if hi_inclusive else bisect_left)(keys, hi)
+            yield from keys[i:j]
+            if j < len(keys):
+                return
+            leaf, i = leaf.next, 0
+
+    def freeze(self, layout='sorted', typecode=None):
+        """Return an immutable, array-backed FrozenIndex of the values (see BinarySearchTree.freeze)."""
+        return FrozenIndex(self, layout, typecode)
+
+    def inorder_traversal(self) -> list:
+        """Return the values in sorted order."""
+        result = []
+        leaf = self._head
+        while leaf is not None:
+            result += leaf.keys
+            leaf = leaf.next
+        return result
+
+    def find_min(self):
+        """Return the minimum value in the tree."""
+        if not self.size:
+            raise ValueError("The tree is empty")
+        return self._head.keys[0]
+
+    def find_max(self):
+        """Return the maximum value in the tree."""
+        if not self.size:
+            raise ValueError("The tree is empty")
+        node = self.root
+        while node.children is not None:
+            node = node.children[-1]
+        return node.keys[-1]
+
+    def height(self) -> int:
+        """Return the number of levels below the root (-1 when empty, 0 for a single leaf)."""
+        if not self.size:
+            return -1
+        height = 0
+        node = self.root
+        while node.children is not None:
+            height += 1
+            node = node.children[0]
+        return height
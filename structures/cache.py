@@ -0,0 +1,285 @@
+# cache.py
+
+import functools
+import sys
+import time
+
+from .dll import DoublyLinkedList
+
+
+class _Entry:
+    """A cached item. `node` is its handle in the recency list that orders it."""
+
+    __slots__ = ('key', 'value', 'size', 'expires', 'freq', 'node')
+
+    def __init__(self, key, value, size, expires):
+        self.key = key
+        self.value = value
+        self.size = size
+        self.expires = expires
+        self.freq = 1
+        self.node = None
+
+
+class _Cache:
+    """
+    Bookkeeping shared by LRUCache and LFUCache.
+
+    Subclasses decide the order entries live in (`_link`, `_touch`,
+    `_unlink`) and which entry goes first when the cache is over its
+    bounds (`_victim`). get, put and eviction are O(1).
+    """
+
+    def __init__(self, maxsize=128, maxbytes=None, ttl=None, on_evict=None,
+                 sizeof=sys.getsizeof, timer=time.monotonic):
+        self.maxsize = maxsize      # Maximum number of entries, or None
+        self.maxbytes = maxbytes    # Maximum total of sizeof(value), or None
+        self.ttl = ttl              # Default time-to-live in seconds, or None
+        self.on_evict = on_evict    # Called as on_evict(key, value)
+        self._sizeof = sizeof
+        self._timer = timer
+        self._entries = {}
+        self.currbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        """Check for a live entry without counting a hit or changing its priority."""
+        entry = self._entries.get(key)
+        return entry is not None and not self._expired(entry)
+
+    def _expired(self, entry):
+        return entry.expires is not None and entry.expires <= self._timer()
+
+    def get(self, key, default=None):
+        """Return the value for `key`, or `default` if it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        if self._expired(entry):
+            self._discard(entry)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self._touch(entry)
+        self.hits += 1
+        return entry.value
+
+    def put(self, key, value, ttl=None):
+        """Insert or replace `key`, then evict until the cache is within its bounds."""
+        ttl = self.ttl if ttl is None else ttl
+        expires = None if ttl is None else self._timer() + ttl
+        size = self._sizeof(value) if self.maxbytes is not None else 0
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.currbytes += size - entry.size
+            entry.value = value
+            entry.size = size
+            entry.expires = expires
+            self._touch(entry)
+        else:
+            # Make room before linking the new entry, so that it is never
+            # chosen as its own victim (in LFU order it has the lowest count)
+            while self._entries and self._over_bounds(1, size):
+                self._evict(self._victim())
+            entry = _Entry(key, value, size, expires)
+            self._entries[key] = entry
+            self.currbytes += size
+            self._link(entry)
+        while self._over_bounds():
+            self._evict(self._victim())
+
+    def _over_bounds(self, entries=0, nbytes=0):
+        """Check whether the cache, plus `entries` more entries of `nbytes`, exceeds its bounds."""
+        return ((self.maxsize is not None and len(self._entries) + entries > self.maxsize)
+                or (self.maxbytes is not None and self.currbytes + nbytes > self.maxbytes))
+
+    def _evict(self, entry):
+        self._discard(entry)
+        self.evictions += 1
+
+    def _discard(self, entry):
+        del self._entries[entry.key]
+        self.currbytes -= entry.size
+        self._unlink(entry)
+        if self.on_evict is not None:
+            self.on_evict(entry.key, entry.value)
+
+    def pop(self, key, default=None):
+        """Remove `key` and return its value, without calling `on_evict`."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return default
+        self.currbytes -= entry.size
+        self._unlink(entry)
+        return default if self._expired(entry) else entry.value
+
+    def expire(self):
+        """Drop every expired entry now instead of lazily on access. Return how many were dropped."""
+        now = self._timer()
+        expired = [entry for entry in self._entries.values()
+                   if entry.expires is not None and entry.expires <= now]
+        for entry in expired:
+            self._discard(entry)
+        self.expirations += len(expired)
+        return len(expired)
+
+    def clear(self):
+        """Remove every entry without calling `on_evict`. Counters are kept."""
+        for entry in list(self._entries.values()):
+            self._unlink(entry)
+        self._entries.clear()
+        self.currbytes = 0
+
+    def stats(self):
+        """Return the hit, miss, eviction and expiration counters."""
+        return {'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'expirations': self.expirations}
+
+    def _link(self, entry):
+        raise NotImplementedError
+
+    def _touch(self, entry):
+        raise NotImplementedError
+
+    def _unlink(self, entry):
+        raise NotImplementedError
+
+    def _victim(self):
+        raise NotImplementedError
+
+
+class LRUCache(_Cache):
+    """
+    Least-recently-used cache.
+
+    Entries live in one DoublyLinkedList with the most recently used entry
+    at the head. A hit moves its node to the front and eviction pops the
+    tail, so get, put and evict are O(1).
+
+    Parameters:
+    -----------
+    maxsize : int
+        Maximum number of entries (None for no limit).
+    maxbytes : int
+        Maximum total of `sizeof(value)` over all entries (None for no limit).
+    ttl : float
+        Default seconds an entry stays valid (None never expires); `put`
+        can override it per entry.
+    on_evict : callable
+        Called as `on_evict(key, value)` when an entry is evicted or expires.
+    """
+
+    def __init__(self, maxsize=128, maxbytes=None, ttl=None, on_evict=None,
+                 sizeof=sys.getsizeof, timer=time.monotonic):
+        super().__init__(maxsize, maxbytes, ttl, on_evict, sizeof, timer)
+        self._order = DoublyLinkedList()
+
+    def _link(self, entry):
+        entry.node = self._order.prepend(entry)
+
+    def _touch(self, entry):
+        self._order.move_to_front(entry.node)
+
+    def _unlink(self, entry):
+        self._order.remove_node(entry.node)
+
+    def _victim(self):
+        return self._order.tail.value
+
+
+class LFUCache(_Cache):
+    """
+    Least-frequently-used cache with O(1) frequency buckets.
+
+    Each access count has its own DoublyLinkedList of entries, most recent
+    first. A hit moves the entry's node to the next bucket. Eviction takes
+    the tail of the lowest non-empty bucket, so ties go to the least
+    recently used. Parameters are the same as for LRUCache.
+    """
+
+    def __init__(self, maxsize=128, maxbytes=None, ttl=None, on_evict=None,
+                 sizeof=sys.getsizeof, timer=time.monotonic):
+        super().__init__(maxsize, maxbytes, ttl, on_evict, sizeof, timer)
+        self._buckets = {}  # access count -> DoublyLinkedList of entries
+        self._min_freq = 0
+
+    def _link(self, entry):
+        entry.freq = 1
+        bucket = self._buckets.get(1)
+        if bucket is None:
+            bucket = self._buckets[1] = DoublyLinkedList()
+        entry.node = bucket.prepend(entry)
+        self._min_freq = 1
+
+    def _touch(self, entry):
+        freq = entry.freq
+        bucket = self._buckets[freq]
+        bucket.remove_node(entry.node)
+        if bucket.is_empty():
+            del self._buckets[freq]
+            if self._min_freq == freq:
+                self._min_freq = freq + 1
+        entry.freq = freq + 1
+        bucket = self._buckets.get(freq + 1)
+        if bucket is None:
+            bucket = self._buckets[freq + 1] = DoublyLinkedList()
+        entry.node = bucket.prepend(entry)
+
+    def _unlink(self, entry):
+        bucket = self._buckets[entry.freq]
+        bucket.remove_node(entry.node)
+        if bucket.is_empty():
+            del self._buckets[entry.freq]
+
+    def _victim(self):
+        bucket = self._buckets.get(self._min_freq)
+        if bucket is None:
+            # The lowest bucket was emptied by a pop or an expiry.
+            self._min_freq = min(self._buckets)
+            bucket = self._buckets[self._min_freq]
+        return bucket.tail.value
+
+
+_MISSING = object()
+_KWARGS_MARK = object()
+
+
+def memoize(cache=None, *, maxsize=128, ttl=None, policy='lru'):
+    """
+    Decorator caching a function's results by its arguments.
+
+    Use as `@memoize`, `@memoize(maxsize=1024, ttl=60, policy='lfu')` or
+    `@memoize(LRUCache(maxbytes=1 << 20))`. Arguments must be hashable.
+    The wrapped function exposes its cache as `.cache`.
+    """
+    if callable(cache) and not isinstance(cache, _Cache):
+        return memoize()(cache)  # Used bare, as @memoize
+    if cache is None:
+        policies = {'lru': LRUCache, 'lfu': LFUCache}
+        if policy not in policies:
+            raise ValueError(f"Unknown cache policy: {policy!r}")
+        cache = policies[policy](maxsize=maxsize, ttl=ttl)
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args
+            if kwargs:
+                key += (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = func(*args, **kwargs)
+                cache.put(key, result)
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
@@ -0,0 +1,91 @@
+# concurrent_avl.py
+
+import threading
+
+from .persistent_avl import PersistentAVLTree
+
+
+class ConcurrentAVLTree:
+    """
+    Thread-safe ordered set with lock-free reads.
+
+    The current contents are one immutable PersistentAVLTree. Readers load
+    that reference, which is a single atomic attribute read, and query it
+    without taking any lock, so lookups never wait on other lookups or on
+    writers. Writers serialize on a lock, build the next version by path
+    copying in O(log n), and publish it with one assignment. A reader
+    always sees a complete version, never a half-applied update.
+
+    Methods:
+    --------
+    insert(value), delete(value):
+        Apply one update and publish the result.
+    insert_many(values), delete_many(values):
+        Apply a batch under one lock acquisition and publish it once.
+    search(value) -> bool, search_many(values), value in tree, len(tree), iter(tree):
+        Lock-free reads of the latest published version.
+    irange(lo, hi, inclusive=(True, True)), select(k):
+        Lock-free range and order-statistic queries.
+    snapshot() -> PersistentAVLTree:
+        The latest version, for several reads that must agree.
+    """
+
+    def __init__(self, iterable=()):
+        self._tree = PersistentAVLTree.from_iterable(iterable)
+        self._write_lock = threading.Lock()
+
+    def snapshot(self):
+        """Return the latest published version; it never changes afterwards."""
+        return self._tree
+
+    def insert(self, value):
+        """Insert `value` and publish the new version."""
+        with self._write_lock:
+            self._tree = self._tree.insert(value)
+
+    def delete(self, value):
+        """Delete `value` and publish the new version."""
+        with self._write_lock:
+            self._tree = self._tree.delete(value)
+
+    def insert_many(self, values):
+        """Insert a batch of values, publishing them together."""
+        with self._write_lock:
+            tree = self._tree
+            for value in values:
+                tree = tree.insert(value)
+            self._tree = tree
+
+    def delete_many(self, values):
+        """Delete a batch of values, publishing the result together."""
+        with self._write_lock:
+            tree = self._tree
+            for value in values:
+                tree = tree.delete(value)
+            self._tree = tree
+
+    def search(self, value) -> bool:
+        """Search the latest version without locking."""
+        return self._tree.search(value)
+
+    def __contains__(self, value):
+        return self._tree.search(value)
+
+    def search_many(self, values, as_numpy=False):
+        """Search a batch of values in the latest version without locking."""
+        return self._tree.search_many(values, as_numpy)
+
+    def __len__(self):
+        return len(self._tree)
+
+    def __iter__(self):
+        """Iterate over the version current when iteration starts."""
+        return iter(self._tree)
+
+    def irange(self, lo=None, hi=None, inclusive=(True, True)):
+        """Yield the values from `lo` to `hi` of the version current when called."""
+        return self._tree.irange(lo, hi, inclusive)
+
+    def select(self, k):
+        """Return the value at 0-based position `k` in the latest version."""
+        return self._tree.select(k)
@@ -1,10 +1,13 @@
 # dll.py
 
-from .node import Node
+from collections import deque
+
+from .batch import to_mask
+from .node import DLLNode
 
 class DoublyLinkedList:
     """
-    A class that implements a doubly linked list using the Node class.
+    A class that implements a doubly linked list using the DLLNode class.
 
     Methods:
     --------
@@ -16,25 +19,69 @@ class DoublyLinkedList:
         Deletes the first occurrence of the node with the given value.
     search(value) -> bool:
         Searches for a node with the given value. Returns True if found.
+    search_many(values, as_numpy=False):
+        Returns which of a batch of values are present, in one pass.
     display_forward():
         Displays the list in forward order.
     display_backward():
         Displays the list in reverse order.
     length() -> int:
         Returns the length of the doubly linked list.
+    move_to_front(node), move_to_back(node), remove_node(node):
+        O(1) operations on a node handle returned by append/prepend.
+    pop_head(), pop_tail():
+        Remove and return the value at either end.
+    iter(lst), reversed(lst), len(lst), value in lst:
+        Lazy traversal in either direction; len() is O(1).
+
+    With `indexed=True` the list also keeps a dict mapping each value to
+    its nodes in list order, so search, membership and delete by value are
+    O(1). Values must then be hashable.
     """
 
-    def __init__(self):
+    def __init__(self, indexed=False):
         self.head = None  # The head node of the list
         self.tail = None  # The tail node of the list
+        self.size = 0     # Number of nodes, so length is O(1)
+        self._index = {} if indexed else None  # value -> deque of nodes
+
+    def __iter__(self):
+        """Yield the values from head to tail."""
+        current = self.head
+        while current:
+            yield current.value
+            current = current.next
+
+    def __reversed__(self):
+        """Yield the values from tail to head."""
+        current = self.tail
+        while current:
+            yield current.value
+            current = current.prev
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, value):
+        return self.search(value)
 
     def is_empty(self):
         """Check if the list is empty."""
         return self.head is None
 
     def append(self, value):
-        """Append a new node with the given value to the end of the list."""
-        new_node = Node(value)
+        """Append a new node with the given value to the end of the list. Return the node."""
+        new_node = DLLNode(value)
+        self._link_back(new_node)
+        return new_node
+
+    def prepend(self, value):
+        """Insert a new node with the given value at the beginning of the list. Return the node."""
+        new_node = DLLNode(value)
+        self._link_front(new_node)
+        return new_node
+
+    def _link_back(self, new_node):
         if self.is_empty():
             self.head = new_node
             self.tail = new_node
@@ -42,10 +89,11 @@ class DoublyLinkedList:
             self.tail.next = new_node  # Set the current tail's next to new node
             new_node.prev = self.tail  # Set new node's previous to current tail
             self.tail = new_node       # Update tail to the new node
+        self.size += 1
+        if self._index is not None:
+            self._index.setdefault(new_node.value, deque()).append(new_node)
 
-    def prepend(self, value):
-        """Insert a new node with the given value at the beginning of the list."""
-        new_node = Node(value)
+    def _link_front(self, new_node):
         if self.is_empty():
             self.head = new_node
             self.tail = new_node
@@ -53,6 +101,38 @@ class DoublyLinkedList:
             new_node.next = self.head  # Set new node's next to current head
             self.head.prev = new_node  # Set current head's previous to new node
             self.head = new_node       # Update head to the new node
+        self.size += 1
+        if self._index is not None:
+            self._index.setdefault(new_node.value, deque()).appendleft(new_node)
+
+    def move_to_front(self, node):
+        """Move a node of this list to the head in O(1)."""
+        if node is not self.head:
+            self._unlink(node)
+            self._link_front(node)
+
+    def move_to_back(self, node):
+        """Move a node of this list to the tail in O(1)."""
+        if node is not self.tail:
+            self._unlink(node)
+            self._link_back(node)
+
+    def remove_node(self, node):
+        """Remove a node of this list in O(1) and return its value."""
+        self._unlink(node)
+        return node.value
+
+    def pop_head(self):
+        """Remove the head node and return its value. Raise IndexError if the list is empty."""
+        if self.is_empty():
+            raise IndexError("pop from an empty list")
+        return self.remove_node(self.head)
+
+    def pop_tail(self):
+        """Remove the tail node and return its value. Raise IndexError if the list is empty."""
+        if self.is_empty():
+            raise IndexError("pop from an empty list")
+        return self.remove_node(self.tail)
 
     def delete(self, value):
         """Delete the first occurrence of the node with the given value."""
@@ -60,33 +140,50 @@ class DoublyLinkedList:
             print("List is empty. Nothing to delete.")
             return
 
-        current = self.head
-
-        # Traverse the list to find the node to delete
-        while current and current.value != value:
-            current = current.next
-
+        current = self._find(value)
         if current is None:
             print(f"Value {value} not found in the list.")
             return
 
-        # If the node to be deleted is the head
-        if current == self.head:
-            self.head = current.next
-            if self.head:
-                self.head.prev = None
-            else:
-                self.tail = None  # If the list is now empty
-        elif current == self.tail:
-            self.tail = current.prev
-            if self.tail:
-                self.tail.next = None
+        self._unlink(current)
+
+    def _find(self, value):
+        """Return the first node holding `value`, or None."""
+        if self._index is not None:
+            nodes = self._index.get(value)
+            return nodes[0] if nodes else None
+
+        # Traverse the list to find the node
+        current = self.head
+        while current and current.value != value:
+            current = current.next
+        return current
+
+    def _unlink(self, node):
+        """Detach `node` from the list, keeping size and the index in sync."""
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next  # The node was the head
+        if node.next:
+            node.next.prev = node.prev
         else:
-            current.prev.next = current.next
-            current.next.prev = current.prev
+            self.tail = node.prev  # The node was the tail
+        node.prev = node.next = None
+        self.size -= 1
+        if self._index is not None:
+            nodes = self._index[node.value]
+            if nodes[0] is node:
+                nodes.popleft()
+            else:
+                nodes.remove(node)
+            if not nodes:
+                del self._index[node.value]
 
     def search(self, value) -> bool:
         """Search for a node with the given value. Return True if found, False otherwise."""
+        if self._index is not None:
+            return value in self._index
         current = self.head
         while current:
             if current.value == value:
@@ -94,6 +191,28 @@ class DoublyLinkedList:
             current = current.next
         return False
 
+    def search_many(self, values, as_numpy=False):
+        """
+        Return, for each of `values` in order, whether the list holds it.
+
+        Makes a single pass over the list against a set of the probes, and
+        stops early once every probe has been seen (or uses the index, when
+        there is one). Values must be hashable. Returns a list of bools, or
+        a NumPy bool array with `as_numpy`.
+        """
+        probes = list(values)
+        if self._index is not None:
+            found = self._index
+        else:
+            wanted = set(probes)
+            found = set()
+            current = self.head
+            while current and len(found) < len(wanted):
+                if current.value in wanted:
+                    found.add(current.value)
+                current = current.next
+        return to_mask([probe in found for probe in probes], as_numpy)
+
     def display_forward(self):
         """Display the values in the linked list from head to tail."""
         if self.is_empty():
@@ -120,12 +239,7 @@ class DoublyLinkedList:
 
     def length(self) -> int:
         """Return the length of the doubly linked list."""
-        count = 0
-        current = self.head
-        while current:
-            count += 1
-            current = current.next
-        return count
+        return self.size
 
     def traverse_forward(self):
         """
@@ -136,10 +250,4 @@ class DoublyLinkedList:
             print("The list is empty.")
             return []
 
-        result = []
-        current = self.head
-        while current:
-            result.append(current.value)  # Add the value of the current node
-            current = current.next  # Move to the next node
-
-        return result
+        return list(self)
@@ -0,0 +1,131 @@
+# interval.py
+
+from .avl import AVLTree, AVLTreeMap
+from .node import IntervalNode
+
+
+def _check_interval(interval):
+    start, end = interval
+    if end < start:
+        raise ValueError(f"Interval ({start!r}, {end!r}) ends before it starts")
+
+
+def _iter_overlaps(node, lo, hi):
+    """
+    Yield, in order of start, the nodes under `node` whose interval meets [lo, hi].
+
+    Subtrees whose max_end is below `lo` hold nothing that reaches `lo` and
+    are skipped whole; the walk stops at the first start beyond `hi`.
+    """
+    stack = []
+    while True:
+        while node is not None and not node.max_end < lo:
+            stack.append(node)
+            node = node.left
+        if not stack:
+            return
+        node = stack.pop()
+        start, end = node.value
+        if hi < start:
+            return
+        if not end < lo:
+            yield node
+        node = node.right
+
+
+class IntervalAVLTree(AVLTree):
+    """
+    AVL operations on IntervalNodes, keeping each node's max_end current.
+
+    `_update` is the only override: every rotation, rebalance, join and
+    split already recomputes the nodes it touches through it.
+    """
+
+    _node_class = IntervalNode
+
+    def _update(self, node):
+        """Recompute the height, size and max_end of `node` from its children."""
+        super()._update(node)
+        max_end = node.value[1]
+        left, right = node.left, node.right
+        if left is not None and max_end < left.max_end:
+            max_end = left.max_end
+        if right is not None and max_end < right.max_end:
+            max_end = right.max_end
+        node.max_end = max_end
+
+
+class IntervalTree(AVLTreeMap):
+    """
+    An AVL tree of closed intervals (start, end) answering overlap queries.
+
+    Intervals are ordered by (start, end) and each node also stores the
+    largest end in its subtree. A query walks the intervals in order of
+    start, skipping every subtree whose largest end falls short of the
+    query and stopping at the first start past it, so reporting k
+    intervals costs O(log n) when k is 0 and O(min(n, k log n)) at worst;
+    overlaps that cluster together, as time windows do, cost close to
+    O(log n + k).
+
+    Everything else is inherited from AVLTreeMap: insert and delete in
+    O(log n), `tree[(start, end)] = payload` to attach data, `key=` to
+    store records whose key is their (start, end) pair, multiset mode for
+    repeated intervals, and the batch and set operations.
+
+    Methods:
+    --------
+    overlaps(point) -> list:
+        Returns the intervals that contain `point`.
+    overlaps(lo, hi) -> list:
+        Returns the intervals that share at least one point with [lo, hi].
+    overlap_items(lo, hi=None):
+        Yields (interval, payload) for the same intervals.
+    max_end():
+        Returns the largest end of any stored interval.
+    """
+
+    _node_class = IntervalNode
+    _mode_node_classes = {}
+
+    def __init__(self, key=None, multiset=False):
+        super().__init__(key, multiset)
+        self._avl = IntervalAVLTree()
+
+    def _build_balanced(self, keys, payloads, lo, hi, counts=None):
+        for i in range(lo, hi):
+            _check_interval(keys[i])
+        return super()._build_balanced(keys, payloads, lo, hi, counts)
+
+    def _put(self, key, payload, replace, add=False):
+        _check_interval(key)
+        super()._put(key, payload, replace, add)
+
+    def overlaps(self, lo, hi=None) -> list:
+        """
+        Return the stored intervals that meet [lo, hi], in sorted order.
+
+        With one argument, return those that contain the point `lo`. In
+        multiset mode an interval is repeated by its count.
+        """
+        if hi is None:
+            hi = lo
+        result = []
+        for node in _iter_overlaps(self.root, lo, hi):
+            if self.multiset and node.count > 1:
+                result += [node.value] * node.count
+            else:
+                result.append(node.value)
+        return result
+
+    def overlap_items(self, lo, hi=None):
+        """Yield (interval, payload) for each stored interval that meets [lo, hi]."""
+        if hi is None:
+            hi = lo
+        for node in _iter_overlaps(self.root, lo, hi):
+            yield node.value, node.payload
+
+    def max_end(self):
+        """Return the largest end of any stored interval."""
+        if self.root is None:
+            raise ValueError("The tree is empty")
+        return self.root.max_end
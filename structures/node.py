@@ -2,7 +2,10 @@
 
 class Node:
     """
-    A class representing a node in the binary search tree.
+    A general-purpose node carrying every link used by the structures.
+
+    Kept for backwards compatibility; the structures themselves use the
+    compact, structure-specific node classes below.
 
     Attributes:
     -----------
@@ -14,6 +17,8 @@ class Node:
         Reference to the right child node.
     """
 
+    __slots__ = ('value', 'left', 'right', 'next', 'prev', 'height')
+
     def __init__(self, value):
         self.value = value
         self.left = None    # for BST
@@ -21,3 +26,299 @@ class Node:
         self.next = None    # for SLL
         self.prev = None    # for DLL
         self.height = 1     # for AVL
+
+
+class SLLNode:
+    """
+    A node in a singly linked structure (SinglyLinkedList, Stack, Queue).
+
+    Attributes:
+    -----------
+    value : object
+        The value stored in the node.
+    next : SLLNode
+        Reference to the next node.
+    """
+
+    __slots__ = ('value', 'next')
+
+    def __init__(self, value, next=None):
+        self.value = value
+        self.next = next
+
+
+class DLLNode:
+    """
+    A node in a doubly linked list.
+
+    Attributes:
+    -----------
+    value : object
+        The value stored in the node.
+    next : DLLNode
+        Reference to the next node.
+    prev : DLLNode
+        Reference to the previous node.
+    """
+
+    __slots__ = ('value', 'next', 'prev')
+
+    def __init__(self, value):
+        self.value = value
+        self.next = None
+        self.prev = None
+
+
+class BSTNode:
+    """
+    A node in a binary search tree.
+
+    Attributes:
+    -----------
+    value : object
+        The value stored in the node.
+    left : BSTNode
+        Reference to the left child node.
+    right : BSTNode
+        Reference to the right child node.
+
+    A plain node has no room for a payload or a count; reading them gives
+    the class defaults below. Trees in key/value or multiset mode use the
+    subclasses that add those slots.
+    """
+
+    __slots__ = ('value', 'left', 'right')
+
+    payload = None  # Data attached to the value in key/value mode
+    count = 1  # How many times the value is stored, in multiset mode
+
+    def __init__(self, value, payload=None):
+        self.value = value
+        self.left = None
+        self.right = None
+
+
+class BSTMapNode(BSTNode):
+    """A BSTNode with a payload, for key/value mode."""
+
+    __slots__ = ('payload',)
+
+    def __init__(self, value, payload=None):
+        self.value = value
+        self.left = None
+        self.right = None
+        self.payload = payload
+
+
+class BSTMultiNode(BSTNode):
+    """A BSTNode with a count, for multiset mode."""
+
+    __slots__ = ('count',)
+
+    def __init__(self, value, payload=None):
+        self.value = value
+        self.left = None
+        self.right = None
+        self.count = 1
+
+
+class BSTMultiMapNode(BSTNode):
+    """A BSTNode with both a payload and a count."""
+
+    __slots__ = ('payload', 'count')
+
+    def __init__(self, value, payload=None):
+        self.value = value
+        self.left = None
+        self.right = None
+        self.payload = payload
+        self.count = 1
+
+
+class AVLNode:
+    """
+    A node in an AVL tree.
+
+    Attributes:
+    -----------
+    value : object
+        The value stored in the node.
+    left : AVLNode
+        Reference to the left child node.
+    right : AVLNode
+        Reference to the right child node.
+    height : int
+        Height of the subtree rooted at this node (a leaf has height 1).
+    size : int
+        Number of values in the subtree rooted at this node, counting
+        repeats.
+
+    As with BSTNode, `payload` and `count` are class defaults here and
+    slots only in the subclasses for the modes that need them.
+    """
+
+    __slots__ = ('value', 'left', 'right', 'height', 'size')
+
+    payload = None  # Data attached to the value in key/value mode
+    count = 1  # How many times the value is stored, when duplicates are counted
+
+    def __init__(self, value, payload=None):
+        self.value = value
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.size = 1
+
+
+class AVLMapNode(AVLNode):
+    """An AVLNode with a payload, for key/value mode."""
+
+    __slots__ = ('payload',)
+
+    def __init__(self, value, payload=None):
+        self.value = value
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.size = 1
+        self.payload = payload
+
+
+class AVLMultiNode(AVLNode):
+    """An AVLNode with a count, for trees that count duplicates."""
+
+    __slots__ = ('count',)
+
+    def __init__(self, value, payload=None):
+        self.value = value
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.size = 1
+        self.count = 1
+
+
+class AVLMultiMapNode(AVLNode):
+    """An AVLNode with both a payload and a count."""
+
+    __slots__ = ('payload', 'count')
+
+    def __init__(self, value, payload=None):
+        self.value = value
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.size = 1
+        self.payload = payload
+        self.count = 1
+
+
+class BTreeNode:
+    """
+    A node in a B+-tree.
+
+    Attributes:
+    -----------
+    keys : list
+        The sorted keys in a leaf, or the separator keys in an internal node.
+    children : list
+        The len(keys) + 1 child nodes of an internal node; None in a leaf.
+    next : BTreeNode
+        Reference to the next leaf in key order (leaves only).
+    """
+
+    __slots__ = ('keys', 'children', 'next')
+
+    def __init__(self, keys, children=None):
+        self.keys = keys
+        self.children = children
+        self.next = None
+
+
+class RBNode:
+    """
+    A node in a red-black tree.
+
+    Attributes:
+    -----------
+    value : object
+        The value stored in the node.
+    left : RBNode
+        Reference to the left child node.
+    right : RBNode
+        Reference to the right child node.
+    payload : object
+        Data attached to the value in key/value mode (None otherwise).
+    count : int
+        How many times the value is stored (above 1 only in multiset mode).
+    red : bool
+        The node's color; new nodes start red.
+    """
+
+    __slots__ = ('value', 'left', 'right', 'payload', 'count', 'red')
+
+    def __init__(self, value, payload=None):
+        self.value = value
+        self.left = None
+        self.right = None
+        self.payload = payload
+        self.count = 1
+        self.red = True
+
+
+class TreapNode:
+    """
+    A node in a treap.
+
+    Attributes:
+    -----------
+    value : object
+        The value stored in the node.
+    left : TreapNode
+        Reference to the left child node.
+    right : TreapNode
+        Reference to the right child node.
+    payload : object
+        Data attached to the value in key/value mode (None otherwise).
+    count : int
+        How many times the value is stored (above 1 only in multiset mode).
+    priority : float
+        Random heap priority; no child has a higher one than its parent.
+    """
+
+    __slots__ = ('value', 'left', 'right', 'payload', 'count', 'priority')
+
+    def __init__(self, value, payload=None, priority=0.0):
+        self.value = value
+        self.left = None
+        self.right = None
+        self.payload = payload
+        self.count = 1
+        self.priority = priority
+
+
+class IntervalNode(AVLNode):
+    """
+    A node in an interval tree: an AVLNode whose value is a (start, end) pair.
+
+    Attributes:
+    -----------
+    max_end : object
+        The largest end of any interval in the subtree rooted at this node.
+    payload : object
+        Data attached to the interval (None otherwise).
+    count : int
+        How many times the interval is stored (above 1 only in multiset mode).
+    """
+
+    __slots__ = ('max_end', 'payload', 'count')
+
+    def __init__(self, value, payload=None):
+        self.value = value
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.size = 1
+        self.max_end = value[1]
+        self.payload = payload
+        self.count = 1
@@ -0,0 +1,224 @@
+# persistent_avl.py
+
+from collections import deque
+
+from .avl import AVLTree
+from .batch import to_mask
+from .bst import _iter_inorder, _iter_range, _search_many, _sorted_unique
+from .node import AVLNode
+
+
+def _height(node):
+    return node.height if node is not None else 0
+
+
+def _size(node):
+    return node.size if node is not None else 0
+
+
+def _make(value, left, right):
+    """Create a node over two existing (shared) subtrees."""
+    node = AVLNode(value)
+    node.left, node.right = left, right
+    node.height = 1 + max(_height(left), _height(right))
+    node.size = 1 + _size(left) + _size(right)
+    return node
+
+
+def _balance(value, left, right):
+    """Create a balanced node over `left` and `right`, rotating by building new nodes."""
+    left_height, right_height = _height(left), _height(right)
+    if left_height > right_height + 1:
+        if _height(left.left) >= _height(left.right):
+            return _make(left.value, left.left, _make(value, left.right, right))
+        pivot = left.right
+        return _make(pivot.value, _make(left.value, left.left, pivot.left), _make(value, pivot.right, right))
+    if right_height > left_height + 1:
+        if _height(right.right) >= _height(right.left):
+            return _make(right.value, _make(value, left, right.left), right.right)
+        pivot = right.left
+        return _make(pivot.value, _make(value, left, pivot.left), _make(right.value, pivot.right, right.right))
+    return _make(value, left, right)
+
+
+def _insert(node, value):
+    if node is None:
+        return _make(value, None, None)
+    if value < node.value:
+        left = _insert(node.left, value)
+        return node if left is node.left else _balance(node.value, left, node.right)
+    if value > node.value:
+        right = _insert(node.right, value)
+        return node if right is node.right else _balance(node.value, node.left, right)
+    return node  # Already present: share the whole tree
+
+
+def _pop_min(node):
+    """Return (tree without its minimum, minimum value)."""
+    if node.left is None:
+        return node.right, node.value
+    left, minimum = _pop_min(node.left)
+    return _balance(node.value, left, node.right), minimum
+
+
+def _delete(node, value):
+    if node is None:
+        return None
+    if value < node.value:
+        left = _delete(node.left, value)
+        return node if left is node.left else _balance(node.value, left, node.right)
+    if value > node.value:
+        right = _delete(node.right, value)
+        return node if right is node.right else _balance(node.value, node.left, right)
+    if node.left is None:
+        return node.right
+    if node.right is None:
+        return node.left
+    right, successor = _pop_min(node.right)
+    return _balance(successor, node.left, right)
+
+
+class PersistentAVLTree:
+    """
+    An immutable AVL tree of values.
+
+    `insert` and `delete` never modify a tree. They return a new tree that
+    copies only the O(log n) nodes on the search path and shares every
+    other subtree with the original, so old versions stay valid and cheap
+    to keep. Nodes are ordinary AVLNode objects that are never mutated
+    once built.
+
+    Methods:
+    --------
+    insert(value) -> PersistentAVLTree:
+        Returns a tree that also holds `value`.
+    delete(value) -> PersistentAVLTree:
+        Returns a tree without `value`.
+    search(value) -> bool, search_many(values), value in tree, len(tree), iter(tree):
+        Read-only queries, as on the mutable trees.
+    irange(lo, hi, inclusive=(True, True)):
+        Lazily yields the values between `lo` and `hi`.
+    select(k):
+        Returns the value at 0-based position `k` in sorted order.
+    """
+
+    __slots__ = ('root',)
+
+    def __init__(self, root=None):
+        self.root = root
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Build a balanced tree holding every value of an iterable in O(n log n)."""
+        values, _ = _sorted_unique(sorted(iterable))
+        return cls(AVLTree(AVLNode).build_balanced(values))
+
+    def insert(self, value):
+        """Return a tree that also holds `value` (this tree itself if already present)."""
+        root = _insert(self.root, value)
+        return self if root is self.root else PersistentAVLTree(root)
+
+    def delete(self, value):
+        """Return a tree without `value` (this tree itself if absent)."""
+        root = _delete(self.root, value)
+        return self if root is self.root else PersistentAVLTree(root)
+
+    def search(self, value) -> bool:
+        """Search for a value in the tree. Returns True if found, False otherwise."""
+        node = self.root
+        while node is not None:
+            if value < node.value:
+                node = node.left
+            elif value > node.value:
+                node = node.right
+            else:
+                return True
+        return False
+
+    def __contains__(self, value):
+        return self.search(value)
+
+    def search_many(self, values, as_numpy=False):
+        """Return, for each of `values` in order, whether it is in the tree (see BinarySearchTree.search_many)."""
+        return to_mask(_search_many(self.root, list(values)), as_numpy)
+
+    def __len__(self):
+        return _size(self.root)
+
+    def __iter__(self):
+        return _iter_inorder(self.root)
+
+    def irange(self, lo=None, hi=None, inclusive=(True, True)):
+        """Yield the values from `lo` to `hi` in sorted order."""
+        return _iter_range(self.root, lo, hi, inclusive)
+
+    def select(self, k):
+        """Return the value at 0-based position `k` in sorted order."""
+        if not 0 <= k < len(self):
+            raise IndexError("select index out of range")
+        node = self.root
+        while True:
+            left_size = _size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.value
+            else:
+                k -= left_size + 1
+                node = node.right
+
+
+class VersionedAVLTree:
+    """
+    A mutable handle over a history of PersistentAVLTree versions.
+
+    Each `insert` or `delete` publishes a new numbered version in O(log n).
+    Any retained version can be read through `snapshot(version)` while
+    writers carry on. With `max_versions` set, only that many of the most
+    recent versions are kept.
+    """
+
+    def __init__(self, max_versions=None):
+        self._versions = deque([PersistentAVLTree()], maxlen=max_versions)
+        self.version = 0  # Number of the latest version
+
+    @property
+    def current(self):
+        """Return the latest version."""
+        return self._versions[-1]
+
+    def snapshot(self, version=None):
+        """Return the tree as of `version` (default: the latest), without copying."""
+        if version is None:
+            return self._versions[-1]
+        oldest = self.version - len(self._versions) + 1
+        if not oldest <= version <= self.version:
+            raise IndexError(f"Version {version} is not retained")
+        return self._versions[version - oldest]
+
+    def _publish(self, tree):
+        if tree is not self._versions[-1]:
+            self._versions.append(tree)
+            self.version += 1
+        return self.version
+
+    def insert(self, value):
+        """Insert `value`, returning the number of the resulting version."""
+        return self._publish(self.current.insert(value))
+
+    def delete(self, value):
+        """Delete `value`, returning the number of the resulting version."""
+        return self._publish(self.current.delete(value))
+
+    def search(self, value) -> bool:
+        """Search the latest version."""
+        return self.current.search(value)
+
+    def __contains__(self, value):
+        return value in self.current
+
+    def __len__(self):
+        return len(self.current)
+
+    def __iter__(self):
+        return iter(self.current)
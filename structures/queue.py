@@ -1,4 +1,15 @@
-from .node import Node
+import threading
+
+from .node import SLLNode
+
+
+class Empty(Exception):
+    """Raised by BlockingQueue.get when no element is available in time."""
+
+
+class Full(Exception):
+    """Raised by BlockingQueue.put when no slot frees up in time."""
+
 
 class Queue:
     """
@@ -10,9 +21,22 @@ class Queue:
         self.rear = None  # Reference to the rear of the queue
         self.size = 0  # Track the size of the queue
 
+    def __iter__(self):
+        """Yield the elements from front to rear."""
+        current = self.front
+        while current:
+            yield current.value
+            current = current.next
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, value):
+        return any(item == value for item in self)
+
     def enqueue(self, value):
         """Enqueue a new element at the rear of the queue."""
-        new_node = Node(value)
+        new_node = SLLNode(value)
         if self.rear is None:  # If queue is empty
             self.front = self.rear = new_node
         else:
@@ -32,6 +56,24 @@ class Queue:
         self.size -= 1
         return dequeued_value
 
+    def enqueue_many(self, values):
+        """Enqueue every element of an iterable at the rear, in order."""
+        for value in values:
+            self.enqueue(value)
+
+    def dequeue_many(self, n):
+        """Dequeue up to `n` elements from the front, returning them in FIFO order."""
+        result = []
+        front = self.front
+        while front is not None and len(result) < n:
+            result.append(front.value)
+            front = front.next
+        self.front = front
+        if front is None:
+            self.rear = None
+        self.size -= len(result)
+        return result
+
     def peek(self):
         """Return the front element without removing it."""
         if self.is_empty():
@@ -57,3 +99,230 @@ class Queue:
             print(current.value, end=" -> ")
             current = current.next
         print("None")
+
+
+class RingBufferQueue:
+    """
+    Queue implementation using a growable circular buffer.
+    Follows First-In, First-Out (FIFO) principle.
+
+    Elements live in a Python list whose length is a power of two; the
+    front is tracked by an index, so enqueue and dequeue allocate no nodes.
+    The buffer doubles when full. Bulk operations copy whole slices.
+    """
+    def __init__(self, capacity=16):
+        size = 1
+        while size < capacity:
+            size <<= 1
+        self._buffer = [None] * size
+        self._head = 0  # Index of the front element
+        self.size = 0  # Track the size of the queue
+
+    def __iter__(self):
+        """Yield the elements from front to rear."""
+        buffer = self._buffer
+        mask = len(buffer) - 1
+        for offset in range(self.size):
+            yield buffer[(self._head + offset) & mask]
+
+    def __reversed__(self):
+        """Yield the elements from rear to front."""
+        buffer = self._buffer
+        mask = len(buffer) - 1
+        for offset in range(self.size - 1, -1, -1):
+            yield buffer[(self._head + offset) & mask]
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, value):
+        return any(item == value for item in self)
+
+    @property
+    def capacity(self):
+        """Return the number of slots currently allocated."""
+        return len(self._buffer)
+
+    def _grow(self, min_capacity):
+        capacity = len(self._buffer)
+        while capacity < min_capacity:
+            capacity <<= 1
+        items = self._slice(self.size)
+        self._buffer = items + [None] * (capacity - len(items))
+        self._head = 0
+
+    def _slice(self, count):
+        """Return the first `count` elements in FIFO order without removing them."""
+        buffer = self._buffer
+        head = self._head
+        end = head + count
+        if end <= len(buffer):
+            return buffer[head:end]
+        return buffer[head:] + buffer[:end - len(buffer)]
+
+    def enqueue(self, value):
+        """Enqueue a new element at the rear of the queue."""
+        if self.size == len(self._buffer):
+            self._grow(self.size + 1)
+        buffer = self._buffer
+        buffer[(self._head + self.size) & (len(buffer) - 1)] = value
+        self.size += 1
+
+    def enqueue_many(self, values):
+        """Enqueue every element of an iterable at the rear, in order."""
+        if not isinstance(values, list):
+            values = list(values)
+        count = len(values)
+        if self.size + count > len(self._buffer):
+            self._grow(self.size + count)
+        buffer = self._buffer
+        tail = (self._head + self.size) & (len(buffer) - 1)
+        first = min(count, len(buffer) - tail)
+        buffer[tail:tail + first] = values[:first]
+        if first < count:
+            buffer[:count - first] = values[first:]
+        self.size += count
+
+    def dequeue(self):
+        """Dequeue the front element from the queue."""
+        if self.size == 0:
+            print("Queue is empty.")
+            return None
+        buffer = self._buffer
+        head = self._head
+        value = buffer[head]
+        buffer[head] = None  # Drop the reference so it can be collected
+        self._head = (head + 1) & (len(buffer) - 1)
+        self.size -= 1
+        return value
+
+    def dequeue_many(self, n):
+        """Dequeue up to `n` elements from the front, returning them in FIFO order."""
+        count = max(0, min(n, self.size))
+        buffer = self._buffer
+        head = self._head
+        result = self._slice(count)
+        first = min(count, len(buffer) - head)
+        buffer[head:head + first] = [None] * first
+        if first < count:
+            buffer[:count - first] = [None] * (count - first)
+        self._head = (head + count) & (len(buffer) - 1)
+        self.size -= count
+        return result
+
+    def peek(self):
+        """Return the front element without removing it."""
+        if self.size == 0:
+            print("Queue is empty.")
+            return None
+        return self._buffer[self._head]
+
+    def is_empty(self):
+        """Check if the queue is empty."""
+        return self.size == 0
+
+    def get_size(self):
+        """Return the size of the queue."""
+        return self.size
+
+    def display(self):
+        """Display the elements of the queue."""
+        if self.is_empty():
+            print("Queue is empty.")
+            return
+        for value in self._slice(self.size):
+            print(value, end=" -> ")
+        print("None")
+
+
+class BlockingQueue:
+    """
+    Thread-safe FIFO queue with optional bounded capacity.
+
+    Backed by a RingBufferQueue guarded by one lock and two condition
+    variables. When `maxsize` is positive, `put` blocks while the queue
+    is full, so producers are throttled instead of growing memory without
+    bound; `get` blocks while it is empty, so consumers sleep instead of
+    polling. A `maxsize` of 0 means unbounded.
+    """
+    def __init__(self, maxsize=0):
+        self.maxsize = maxsize
+        self._queue = RingBufferQueue()
+        self._mutex = threading.Lock()
+        self._not_empty = threading.Condition(self._mutex)
+        self._not_full = threading.Condition(self._mutex)
+
+    def _has_room(self):
+        return self.maxsize <= 0 or self._queue.size < self.maxsize
+
+    def _has_items(self):
+        return self._queue.size > 0
+
+    def put(self, value, block=True, timeout=None):
+        """
+        Put an element at the rear of the queue.
+
+        Waits up to `timeout` seconds (forever if None) for a free slot
+        when the queue is full; raises Full if none frees up, or at once
+        if `block` is False.
+        """
+        with self._not_full:
+            if not self._has_room():
+                if not block or not self._not_full.wait_for(self._has_room, timeout):
+                    raise Full
+            self._queue.enqueue(value)
+            self._not_empty.notify()
+
+    def get(self, block=True, timeout=None):
+        """
+        Remove and return the front element.
+
+        Waits up to `timeout` seconds (forever if None) for an element
+        when the queue is empty; raises Empty if none arrives, or at once
+        if `block` is False.
+        """
+        with self._not_empty:
+            if not self._queue.size:
+                if not block or not self._not_empty.wait_for(self._has_items, timeout):
+                    raise Empty
+            value = self._queue.dequeue()
+            self._not_full.notify()
+            return value
+
+    def get_many(self, max_items, timeout=None):
+        """
+        Remove and return up to `max_items` elements in FIFO order.
+
+        Waits up to `timeout` seconds (forever if None) for at least one
+        element, then takes everything available up to `max_items` without
+        waiting further. Returns an empty list if the wait times out.
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(self._has_items, timeout):
+                return []
+            values = self._queue.dequeue_many(max_items)
+            self._not_full.notify(len(values))
+            return values
+
+    def put_nowait(self, value):
+        """Put an element without blocking; raise Full if there is no room."""
+        self.put(value, block=False)
+
+    def get_nowait(self):
+        """Get an element without blocking; raise Empty if there is none."""
+        return self.get(block=False)
+
+    def is_empty(self):
+        """Check if the queue is empty."""
+        with self._mutex:
+            return self._queue.size == 0
+
+    def is_full(self):
+        """Check if a bounded queue has reached `maxsize`."""
+        with self._mutex:
+            return not self._has_room()
+
+    def get_size(self):
+        """Return the size of the queue."""
+        with self._mutex:
+            return self._queue.size
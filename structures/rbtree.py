@@ -0,0 +1,202 @@
+# rbtree.py
+
+from .bst import BinarySearchTree
+from .node import RBNode
+
+
+def _is_red(node):
+    return node is not None and node.red
+
+
+def _rotate_left(node):
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    return pivot
+
+
+def _rotate_right(node):
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    return pivot
+
+
+class RedBlackTree(BinarySearchTree):
+    """
+    A red-black tree sharing the ordered-map API of BinarySearchTree.
+
+    Balance is looser than AVL (a path may be up to twice as long as
+    another), so an insert needs at most two rotations and a delete at most
+    three, with the rest of the rebalancing done by recoloring. That suits
+    write-heavy workloads; AVLTreeMap's shallower tree suits read-heavy
+    ones. Nodes keep no parent link: inserts and deletes record the path
+    they walk down and fix colors back up along it.
+
+    Lookups, nearest-key queries, traversals, key/value and multiset mode
+    are inherited from BinarySearchTree.
+    """
+
+    _node_class = RBNode
+    _mode_node_classes = {}  # RBNode has payload and count slots already
+
+    @classmethod
+    def from_sorted(cls, iterable, key=None, multiset=False):
+        """
+        Build a perfectly balanced tree from values in ascending order in O(n).
+
+        Duplicates are dropped (counted, in multiset mode); raises
+        ValueError if the input is not sorted.
+        """
+        tree = super().from_sorted(iterable, key=key, multiset=multiset)
+        # Every root-to-leaf path of a perfectly balanced tree ends on the
+        # last level or the one above it, so painting the last level red
+        # gives every path the same number of black nodes.
+        level = [tree.root] if tree.root is not None else []
+        while level:
+            below = [child for node in level for child in (node.left, node.right) if child is not None]
+            for node in level:
+                node.red = not below and node is not tree.root
+            level = below
+        return tree
+
+    def _relink(self, parent, old, new):
+        """Put `new` where `old` hangs below `parent` (or at the root)."""
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+
+    def _put(self, key, payload, replace, add=False):
+        path = []
+        node = self.root
+        while node is not None:
+            if key < node.value:
+                path.append(node)
+                node = node.left
+            elif key > node.value:
+                path.append(node)
+                node = node.right
+            else:
+                if replace:
+                    node.payload = payload
+                if add:
+                    node.count += 1
+                return
+        node = RBNode(key, payload)
+        if not path:
+            self.root = node
+        elif key < path[-1].value:
+            path[-1].left = node
+        else:
+            path[-1].right = node
+        self._fix_insert(node, path)
+
+    def _fix_insert(self, node, path):
+        """Restore the colors after red `node` was attached below path[-1]."""
+        while path and path[-1].red:
+            parent = path.pop()
+            grandparent = path.pop()  # A red parent is never the root
+            if parent is grandparent.left:
+                uncle = grandparent.right
+                if _is_red(uncle):
+                    parent.red = uncle.red = False
+                    grandparent.red = True
+                    node = grandparent
+                    continue
+                if node is parent.right:
+                    parent = grandparent.left = _rotate_left(parent)
+                parent.red, grandparent.red = False, True
+                self._relink(path[-1] if path else None, grandparent, _rotate_right(grandparent))
+            else:
+                uncle = grandparent.left
+                if _is_red(uncle):
+                    parent.red = uncle.red = False
+                    grandparent.red = True
+                    node = grandparent
+                    continue
+                if node is parent.left:
+                    parent = grandparent.right = _rotate_right(parent)
+                parent.red, grandparent.red = False, True
+                self._relink(path[-1] if path else None, grandparent, _rotate_left(grandparent))
+            break
+        self.root.red = False
+
+    def _remove(self, value, decrement=False) -> bool:
+        path = []
+        node = self.root
+        while node is not None:
+            if value < node.value:
+                path.append(node)
+                node = node.left
+            elif value > node.value:
+                path.append(node)
+                node = node.right
+            else:
+                break
+        if node is None:
+            return False
+        if decrement and node.count > 1:
+            node.count -= 1
+            return True
+
+        if node.left is not None and node.right is not None:
+            # Two children: move the inorder successor's entry here and
+            # unlink the successor node instead, which has no left child
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.value, node.payload, node.count = successor.value, successor.payload, successor.count
+            node = successor
+        child = node.left if node.left is not None else node.right
+        self._relink(path[-1] if path else None, node, child)
+        if not node.red:
+            self._fix_remove(child, path)
+        return True
+
+    def _fix_remove(self, node, path):
+        """Restore the colors after a black node was unlinked, leaving `node` a black short."""
+        while path and not _is_red(node):
+            parent = path.pop()
+            grandparent = path[-1] if path else None
+            if node is parent.left:
+                sibling = parent.right
+                if sibling.red:
+                    sibling.red, parent.red = False, True
+                    self._relink(grandparent, parent, _rotate_left(parent))
+                    grandparent = sibling
+                    path.append(grandparent)
+                    sibling = parent.right
+                if not _is_red(sibling.left) and not _is_red(sibling.right):
+                    sibling.red = True
+                    node = parent
+                    continue
+                if not _is_red(sibling.right):
+                    sibling.left.red, sibling.red = False, True
+                    sibling = parent.right = _rotate_right(sibling)
+                sibling.red, parent.red, sibling.right.red = parent.red, False, False
+                self._relink(grandparent, parent, _rotate_left(parent))
+            else:
+                sibling = parent.left
+                if sibling.red:
+                    sibling.red, parent.red = False, True
+                    self._relink(grandparent, parent, _rotate_right(parent))
+                    grandparent = sibling
+                    path.append(grandparent)
+                    sibling = parent.left
+                if not _is_red(sibling.left) and not _is_red(sibling.right):
+                    sibling.red = True
+                    node = parent
+                    continue
+                if not _is_red(sibling.left):
+                    sibling.right.red, sibling.red = False, True
+                    sibling = parent.left = _rotate_left(sibling)
+                sibling.red, parent.red, sibling.left.red = parent.red, False, False
+                self._relink(grandparent, parent, _rotate_right(parent))
+            return
+        if node is not None:
+            node.red = False
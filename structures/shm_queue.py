@@ -0,0 +1,251 @@
+# shm_queue.py
+
+import struct
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+_HEADER = struct.Struct('<QQ')  # capacity, record size (0 = variable length)
+_INDEX = struct.Struct('<Q')
+_LENGTH = struct.Struct('<I')
+
+# The two indices sit on their own cache lines so the producer and the
+# consumer never write to the same line.
+_HEAD_OFFSET = 64
+_TAIL_OFFSET = 128
+_DATA_OFFSET = 192
+
+_WRAP = 0xFFFFFFFF  # Length marker telling the consumer to jump back to offset 0
+
+
+def _attach(name):
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 has no `track`; only the creator should clean up.
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+
+class SharedRingQueue:
+    """
+    Single-producer/single-consumer FIFO queue in shared memory.
+
+    Records are stored back to back in a ring buffer inside a
+    `multiprocessing.shared_memory` block, so two processes exchange bytes
+    with no pickling and no lock or system call per message. Head and tail
+    are monotonically increasing byte counters. Only the consumer writes
+    head and only the producer writes tail. Each side publishes its
+    counter after the record bytes are in place, which relies on the
+    ordered stores of x86 and similar platforms.
+
+    With `record_size` set, every record is exactly that many bytes;
+    otherwise records are variable-length and carry a 4-byte length prefix.
+    A variable-length record, prefix included, may take at most half the
+    ring: a record never straddles the end, so a larger one could find no
+    room even in an empty ring, depending on where the last record ended.
+
+    Methods:
+    --------
+    create(capacity, record_size=None, name=None):
+        Allocates a new queue with `capacity` bytes of ring space.
+    attach(name):
+        Opens an existing queue, e.g. from another process.
+    enqueue(data) -> bool:
+        Appends a record; returns False if there is no room.
+    dequeue() -> bytes:
+        Removes the oldest record; returns None if the queue is empty.
+    enqueue_many(records) -> int / dequeue_many(n) -> list:
+        Batched variants that publish their counter once per call.
+    put(data, timeout=None) / get(timeout=None):
+        Spin-waiting variants for when the ring is full or empty.
+    """
+
+    def __init__(self, shm, owner=False):
+        self._shm = shm
+        self._owner = owner
+        self._buf = shm.buf
+        self.capacity, record_size = _HEADER.unpack_from(self._buf, 0)
+        self.record_size = record_size or None
+        # Each side caches the other side's counter and only re-reads it
+        # when the cached value says the ring is full (or empty).
+        self._head = self._read(_HEAD_OFFSET)
+        self._tail = self._read(_TAIL_OFFSET)
+
+    @classmethod
+    def create(cls, capacity, record_size=None, name=None):
+        """Create a new queue with `capacity` bytes of ring space."""
+        if record_size is not None:
+            if record_size <= 0:
+                raise ValueError("record_size must be positive")
+            capacity -= capacity % record_size
+        if capacity < (record_size or 2 * _LENGTH.size):
+            raise ValueError("capacity is too small")
+        shm = shared_memory.SharedMemory(name=name, create=True, size=_DATA_OFFSET + capacity)
+        _HEADER.pack_into(shm.buf, 0, capacity, record_size or 0)
+        _INDEX.pack_into(shm.buf, _HEAD_OFFSET, 0)
+        _INDEX.pack_into(shm.buf, _TAIL_OFFSET, 0)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        """Attach to an existing queue by its shared-memory name."""
+        return cls(_attach(name))
+
+    @property
+    def name(self):
+        """Return the shared-memory name other processes attach with."""
+        return self._shm.name
+
+    def __reduce__(self):
+        # Passing the queue to another process re-attaches by name.
+        return (SharedRingQueue.attach, (self.name,))
+
+    def _read(self, offset):
+        return _INDEX.unpack_from(self._buf, offset)[0]
+
+    def _write(self, data, tail):
+        """Copy one record in at `tail`; return the new tail, or None if it does not fit."""
+        buf = self._buf
+        capacity = self.capacity
+        pos = tail % capacity
+        size = len(data)
+        if self.record_size is not None:
+            if size != self.record_size:
+                raise ValueError(f"record must be exactly {self.record_size} bytes")
+            if tail + size - self._head > capacity:
+                self._head = self._read(_HEAD_OFFSET)
+                if tail + size - self._head > capacity:
+                    return None
+            start = _DATA_OFFSET + pos
+            buf[start:start + size] = data
+            return tail + size
+
+        needed = _LENGTH.size + size
+        # Records do not straddle the end of the ring, so one that fits an
+        # empty ring from any offset can take at most half of it.
+        if 2 * needed > capacity:
+            raise ValueError("record is larger than half the queue")
+        skip = capacity - pos if capacity - pos < needed else 0
+        if tail + skip + needed - self._head > capacity:
+            self._head = self._read(_HEAD_OFFSET)
+            if tail + skip + needed - self._head > capacity:
+                return None
+        if skip:
+            if skip >= _LENGTH.size:
+                _LENGTH.pack_into(buf, _DATA_OFFSET + pos, _WRAP)
+            pos = 0
+        start = _DATA_OFFSET + pos
+        _LENGTH.pack_into(buf, start, size)
+        buf[start + _LENGTH.size:start + needed] = data
+        return tail + skip + needed
+
+    def _read_record(self, head):
+        """Copy out the record at `head`; return (record, new head)."""
+        buf = self._buf
+        capacity = self.capacity
+        pos = head % capacity
+        if self.record_size is not None:
+            start = _DATA_OFFSET + pos
+            return bytes(buf[start:start + self.record_size]), head + self.record_size
+
+        to_end = capacity - pos
+        size = _WRAP if to_end < _LENGTH.size else _LENGTH.unpack_from(buf, _DATA_OFFSET + pos)[0]
+        if size == _WRAP:
+            head += to_end
+            pos = 0
+            size = _LENGTH.unpack_from(buf, _DATA_OFFSET)[0]
+        start = _DATA_OFFSET + pos + _LENGTH.size
+        return bytes(buf[start:start + size]), head + _LENGTH.size + size
+
+    def enqueue(self, data):
+        """Append a record. Return False, without blocking, if it does not fit."""
+        tail = self._write(data, self._tail)
+        if tail is None:
+            return False
+        self._tail = tail
+        _INDEX.pack_into(self._buf, _TAIL_OFFSET, tail)
+        return True
+
+    def enqueue_many(self, records):
+        """Append records in order until one does not fit. Return how many were added."""
+        tail = self._tail
+        count = 0
+        for data in records:
+            new_tail = self._write(data, tail)
+            if new_tail is None:
+                break
+            tail = new_tail
+            count += 1
+        if count:
+            self._tail = tail
+            _INDEX.pack_into(self._buf, _TAIL_OFFSET, tail)
+        return count
+
+    def dequeue(self):
+        """Remove and return the oldest record, or None if the queue is empty."""
+        head = self._head
+        if head == self._tail:
+            self._tail = self._read(_TAIL_OFFSET)
+            if head == self._tail:
+                return None
+        data, self._head = self._read_record(head)
+        _INDEX.pack_into(self._buf, _HEAD_OFFSET, self._head)
+        return data
+
+    def dequeue_many(self, n):
+        """Remove and return up to `n` of the oldest records."""
+        head = self._head
+        self._tail = tail = self._read(_TAIL_OFFSET)
+        result = []
+        while head != tail and len(result) < n:
+            data, head = self._read_record(head)
+            result.append(data)
+        if result:
+            self._head = head
+            _INDEX.pack_into(self._buf, _HEAD_OFFSET, head)
+        return result
+
+    def put(self, data, timeout=None):
+        """Append a record, spinning until there is room. Return False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.enqueue(data):
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0)
+        return True
+
+    def get(self, timeout=None):
+        """Remove and return a record, spinning until one arrives. Return None on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            data = self.dequeue()
+            if data is not None:
+                return data
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(0)
+
+    def is_empty(self):
+        """Check if the queue is empty."""
+        return self._read(_HEAD_OFFSET) == self._read(_TAIL_OFFSET)
+
+    def used_bytes(self):
+        """Return the number of ring bytes currently occupied."""
+        return self._read(_TAIL_OFFSET) - self._read(_HEAD_OFFSET)
+
+    def close(self):
+        """Detach this handle from the shared memory."""
+        self._buf = None
+        self._shm.close()
+
+    def unlink(self):
+        """Free the shared memory. Call once, from the creating process."""
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        if self._owner:
+            self.unlink()
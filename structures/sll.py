@@ -1,10 +1,11 @@
 # sll.py
 
-from .node import Node
+from .batch import to_mask
+from .node import SLLNode
 
 class SinglyLinkedList:
     """
-    A class that implements a singly linked list using the Node class.
+    A class that implements a singly linked list using the SLLNode class.
 
     Methods:
     --------
@@ -16,6 +17,8 @@ class SinglyLinkedList:
         Deletes the first occurrence of the node with the given value.
     search(value) -> bool:
         Searches for a node with the given value. Returns True if found.
+    search_many(values, as_numpy=False):
+        Returns which of a batch of values are present, in one pass.
     display():
         Displays the entire list.
     length() -> int:
@@ -24,10 +27,27 @@ class SinglyLinkedList:
         Reverses the linked list.
     find_middle() -> Node:
         Finds the middle node of the linked list.
+    iter(lst), len(lst), value in lst:
+        Lazy traversal from head to tail; len() is O(1).
     """
 
     def __init__(self):
         self.head = None
+        self.tail = None  # The last node, so append is O(1)
+        self.size = 0     # Number of nodes, so length is O(1)
+
+    def __iter__(self):
+        """Yield the values from head to tail."""
+        current = self.head
+        while current:
+            yield current.value
+            current = current.next
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, value):
+        return self.search(value)
 
     def is_empty(self):
         """Check if the list is empty."""
@@ -35,20 +55,20 @@ class SinglyLinkedList:
 
     def append(self, value):
         """Append a new node with the given value to the end of the list."""
-        new_node = Node(value)
+        new_node = SLLNode(value)
         if self.is_empty():
             self.head = new_node
         else:
-            current = self.head
-            while current.next:  # Traverse to the end of the list
-                current = current.next
-            current.next = new_node
+            self.tail.next = new_node
+        self.tail = new_node
+        self.size += 1
 
     def prepend(self, value):
         """Insert a new node with the given value at the beginning of the list."""
-        new_node = Node(value)
-        new_node.next = self.head  # Point the new node's next to the current head
-        self.head = new_node
+        self.head = SLLNode(value, self.head)  # New node points to the current head
+        if self.tail is None:
+            self.tail = self.head
+        self.size += 1
 
     def delete(self, value):
         """Delete the first occurrence of the node with the given value."""
@@ -59,6 +79,9 @@ class SinglyLinkedList:
         # If the value is at the head
         if self.head.value == value:
             self.head = self.head.next
+            if self.head is None:
+                self.tail = None
+            self.size -= 1
             return
 
         current = self.head
@@ -67,7 +90,10 @@ class SinglyLinkedList:
 
         # If the value was found
         if current.next:
+            if current.next is self.tail:
+                self.tail = current
             current.next = current.next.next
+            self.size -= 1
         else:
             print(f"Value {value} not found in the list.")
 
@@ -80,6 +106,25 @@ class SinglyLinkedList:
             current = current.next
         return False
 
+    def search_many(self, values, as_numpy=False):
+        """
+        Return, for each of `values` in order, whether the list holds it.
+
+        Makes a single pass over the list against a set of the probes, and
+        stops early once every probe has been seen, so a batch costs O(n + m)
+        rather than O(n * m). Values must be hashable. Returns a list of
+        bools, or a NumPy bool array with `as_numpy`.
+        """
+        probes = list(values)
+        wanted = set(probes)
+        found = set()
+        current = self.head
+        while current and len(found) < len(wanted):
+            if current.value in wanted:
+                found.add(current.value)
+            current = current.next
+        return to_mask([probe in found for probe in probes], as_numpy)
+
     def display(self):
         """Print the values in the linked list."""
         if self.is_empty():
@@ -94,17 +139,13 @@ class SinglyLinkedList:
 
     def length(self) -> int:
         """Return the length of the linked list."""
-        count = 0
-        current = self.head
-        while current:
-            count += 1
-            current = current.next
-        return count
+        return self.size
 
     def reverse(self):
         """Reverse the linked list in place."""
         previous = None
         current = self.head
+        self.tail = current  # The old head becomes the tail
 
         while current:
             next_node = current.next  # Store the next node
@@ -135,9 +176,10 @@ class SinglyLinkedList:
         current = self.head
         while current:
             if current.value == prev_value:
-                new_node = Node(new_value)
-                new_node.next = current.next
-                current.next = new_node
+                current.next = SLLNode(new_value, current.next)
+                if current is self.tail:
+                    self.tail = current.next
+                self.size += 1
                 return
             current = current.next
         print(f"Value {prev_value} not found in the list.")
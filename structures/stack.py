@@ -1,4 +1,6 @@
-from .node import Node
+from array import array
+
+from .node import SLLNode
 
 class Stack:
     """
@@ -9,11 +11,22 @@ class Stack:
         self.top = None  # Reference to the top of the stack
         self.size = 0  # Track the size of the stack
 
+    def __iter__(self):
+        """Yield the elements from top to bottom."""
+        current = self.top
+        while current:
+            yield current.value
+            current = current.next
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, value):
+        return any(item == value for item in self)
+
     def push(self, value):
         """Push a new element onto the stack."""
-        new_node = Node(value)
-        new_node.next = self.top  # Point to the current top node
-        self.top = new_node  # Update the top to the new node
+        self.top = SLLNode(value, self.top)  # New node points to the current top
         self.size += 1
 
     def pop(self):
@@ -26,6 +39,27 @@ class Stack:
         self.size -= 1
         return popped_value
 
+    def push_many(self, values):
+        """Push every element of an iterable onto the stack, in order."""
+        top = self.top
+        count = 0
+        for value in values:
+            top = SLLNode(value, top)
+            count += 1
+        self.top = top
+        self.size += count
+
+    def pop_many(self, n):
+        """Pop up to `n` elements, returning them in pop order (top first)."""
+        result = []
+        top = self.top
+        while top is not None and len(result) < n:
+            result.append(top.value)
+            top = top.next
+        self.top = top
+        self.size -= len(result)
+        return result
+
     def peek(self):
         """Return the top element without removing it."""
         if self.is_empty():
@@ -51,3 +85,80 @@ class Stack:
             print(current.value, end=" -> ")
             current = current.next
         print("None")
+
+
+class ArrayStack:
+    """
+    Stack implementation backed by a contiguous array.
+    Follows Last-In, First-Out (LIFO) principle.
+
+    Elements live in a Python list, or in an `array.array` when a
+    `typecode` (e.g. 'q' or 'd') is given, so push and pop are amortized
+    O(1) and allocate no node per element.
+    """
+    def __init__(self, typecode=None):
+        self.typecode = typecode
+        self._items = [] if typecode is None else array(typecode)
+
+    def __iter__(self):
+        """Yield the elements from top to bottom."""
+        return reversed(self._items)
+
+    def __reversed__(self):
+        """Yield the elements from bottom to top."""
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, value):
+        return value in self._items
+
+    def push(self, value):
+        """Push a new element onto the stack."""
+        self._items.append(value)
+
+    def pop(self):
+        """Pop the top element off the stack."""
+        if not self._items:
+            print("Stack is empty.")
+            return None
+        return self._items.pop()
+
+    def push_many(self, values):
+        """Push every element of an iterable onto the stack, in order."""
+        self._items.extend(values)
+
+    def pop_many(self, n):
+        """Pop up to `n` elements, returning them in pop order (top first)."""
+        if n <= 0:
+            return []
+        items = self._items
+        popped = items[-n:]
+        del items[-n:]
+        popped.reverse()
+        return popped if self.typecode is None else popped.tolist()
+
+    def peek(self):
+        """Return the top element without removing it."""
+        if not self._items:
+            print("Stack is empty.")
+            return None
+        return self._items[-1]
+
+    def is_empty(self):
+        """Check if the stack is empty."""
+        return not self._items
+
+    def get_size(self):
+        """Return the size of the stack."""
+        return len(self._items)
+
+    def display(self):
+        """Display the elements of the stack."""
+        if self.is_empty():
+            print("Stack is empty.")
+            return
+        for value in reversed(self._items):
+            print(value, end=" -> ")
+        print("None")
@@ -0,0 +1,161 @@
+# treap.py
+
+import random
+
+from .bst import BinarySearchTree
+from .node import TreapNode
+
+
+def _merge(left, right):
+    """Join two treaps where every value in `left` is smaller than every value in `right`."""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        return left
+    right.left = _merge(left, right.left)
+    return right
+
+
+def _split(node, value):
+    """Split a treap into the values below `value` and the rest."""
+    if node is None:
+        return None, None
+    if node.value < value:
+        node.right, right = _split(node.right, value)
+        return node, right
+    left, node.left = _split(node.left, value)
+    return left, node
+
+
+class Treap(BinarySearchTree):
+    """
+    A randomized balanced tree sharing the ordered-map API of BinarySearchTree.
+
+    Every node draws a random priority and the tree is kept a heap on those
+    priorities, which makes its shape that of a BST built from a random
+    insertion order: O(log n) expected depth whatever order the values
+    arrive in. An insert needs under two rotations on average. A delete
+    merges the node's two subtrees, and `split` and `join` cut and splice
+    whole trees in O(log n) expected time.
+
+    Lookups, nearest-key queries, traversals, key/value and multiset mode
+    are inherited from BinarySearchTree.
+
+    Methods:
+    --------
+    split(value) -> (Treap, Treap):
+        Splits into the values below `value` and the rest.
+    join(other):
+        Appends every value of `other`, which must all be larger.
+    """
+
+    _node_class = TreapNode
+    _mode_node_classes = {}  # One node class for every mode
+
+    def __init__(self, key=None, multiset=False, seed=None):
+        super().__init__(key, multiset)
+        self._random = random.Random(seed).random
+
+    @classmethod
+    def from_sorted(cls, iterable, key=None, multiset=False, seed=None):
+        """
+        Build a perfectly balanced treap from values in ascending order in O(n log n).
+
+        Duplicates are dropped (counted, in multiset mode); raises
+        ValueError if the input is not sorted.
+        """
+        tree = super().from_sorted(iterable, key=key, multiset=multiset)
+        tree._random = random.Random(seed).random
+        # Hand out random priorities in decreasing order, level by level,
+        # so that the balanced shape is also a valid heap.
+        level = [tree.root] if tree.root is not None else []
+        nodes = []
+        while level:
+            nodes += level
+            level = [child for node in level for child in (node.left, node.right) if child is not None]
+        priorities = sorted((tree._random() for _ in nodes), reverse=True)
+        for node, priority in zip(nodes, priorities):
+            node.priority = priority
+        return tree
+
+    @classmethod
+    def from_iterable(cls, iterable, key=None, multiset=False, seed=None):
+        """Build a perfectly balanced treap from values in any order in O(n log n)."""
+        return cls.from_sorted(sorted(iterable, key=key), key=key, multiset=multiset, seed=seed)
+
+    def _put(self, key, payload, replace, add=False):
+        self.root = self._insert(self.root, key, payload, replace, add)
+
+    def _insert(self, node, key, payload, replace, add):
+        if node is None:
+            return TreapNode(key, payload, self._random())
+        if key < node.value:
+            child = node.left = self._insert(node.left, key, payload, replace, add)
+            if child.priority > node.priority:
+                node.left, child.right = child.right, node
+                return child
+        elif key > node.value:
+            child = node.right = self._insert(node.right, key, payload, replace, add)
+            if child.priority > node.priority:
+                node.right, child.left = child.left, node
+                return child
+        else:
+            if replace:
+                node.payload = payload
+            if add:
+                node.count += 1
+        return node
+
+    def _remove(self, value, decrement=False) -> bool:
+        parent = None
+        node = self.root
+        while node is not None:
+            if value < node.value:
+                parent, node = node, node.left
+            elif value > node.value:
+                parent, node = node, node.right
+            else:
+                break
+        if node is None:
+            return False
+        if decrement and node.count > 1:
+            node.count -= 1
+            return True
+        replacement = _merge(node.left, node.right)
+        if parent is None:
+            self.root = replacement
+        elif parent.left is node:
+            parent.left = replacement
+        else:
+            parent.right = replacement
+        return True
+
+    def _from_root(self, root):
+        tree = type(self)(key=self.key, multiset=self.multiset)
+        tree._random = self._random
+        tree._payloads = self._payloads
+        tree.root = root
+        return tree
+
+    def split(self, value):
+        """
+        Split into two treaps in O(log n) expected: values below `value`, and
+        values from `value` up. This tree is left empty.
+        """
+        left, right = _split(self.root, value)
+        self.root = None
+        return self._from_root(left), self._from_root(right)
+
+    def join(self, other):
+        """
+        Append every value of `other` in O(log n) expected; `other` is left empty.
+
+        Every value of `other` must be larger than every value of this tree.
+        """
+        if self.root is not None and other.root is not None and not self.find_max() < other.find_min():
+            raise ValueError("Every value of other must be larger")
+        self.root = _merge(self.root, other.root)
+        other.root = None
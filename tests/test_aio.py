@@ -0,0 +1,109 @@
+import asyncio
+import unittest
+from structures.aio import AsyncQueue, AsyncStack
+from structures.queue import Empty, Full
+
+class TestAsyncQueue(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        """Set up a bounded async queue before each test."""
+        self.queue = AsyncQueue(maxsize=2)
+
+    async def test_put_get(self):
+        """Test that elements come out in FIFO order."""
+        await self.queue.put(10)
+        await self.queue.put(20)
+        self.assertEqual(self.queue.get_size(), 2)
+        self.assertEqual(await self.queue.get(), 10)
+        self.assertEqual(await self.queue.get(), 20)
+
+    async def test_nowait(self):
+        """Test the non-waiting variants on empty and full queues."""
+        with self.assertRaises(Empty):
+            self.queue.get_nowait()
+        self.queue.put_nowait(1)
+        self.queue.put_nowait(2)
+        with self.assertRaises(Full):
+            self.queue.put_nowait(3)
+
+    async def test_getter_parks_until_put(self):
+        """Test that a waiting getter is woken by a put."""
+        getter = asyncio.create_task(self.queue.get())
+        await asyncio.sleep(0)
+        self.assertFalse(getter.done())
+        await self.queue.put(42)
+        self.assertEqual(await getter, 42)
+
+    async def test_putter_parks_while_full(self):
+        """Test that a putter waits for room in a bounded queue."""
+        await self.queue.put(1)
+        await self.queue.put(2)
+        putter = asyncio.create_task(self.queue.put(3))
+        await asyncio.sleep(0)
+        self.assertFalse(putter.done())
+        self.assertEqual(await self.queue.get(), 1)
+        await putter
+        self.assertEqual(self.queue.get_size(), 2)
+
+    async def test_cancelled_getter(self):
+        """Test that a cancelled getter does not swallow an element."""
+        getter = asyncio.create_task(self.queue.get())
+        await asyncio.sleep(0)
+        getter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await getter
+        await self.queue.put(7)
+        self.assertEqual(await asyncio.wait_for(self.queue.get(), 1), 7)
+
+    async def test_join_and_task_done(self):
+        """Test that join waits for every element to be marked done."""
+        await self.queue.put(1)
+        await self.queue.put(2)
+        joiner = asyncio.create_task(self.queue.join())
+        for _ in range(2):
+            await self.queue.get()
+            await asyncio.sleep(0)
+            self.assertFalse(joiner.done())
+            self.queue.task_done()
+        await asyncio.wait_for(joiner, 1)
+        with self.assertRaises(ValueError):
+            self.queue.task_done()
+
+    async def test_async_iteration_until_closed(self):
+        """Test that async iteration drains the queue and ends after close."""
+        queue = AsyncQueue()
+
+        async def produce():
+            for value in range(5):
+                await queue.put(value)
+                await asyncio.sleep(0)
+            queue.close()
+
+        producer = asyncio.create_task(produce())
+        self.assertEqual([value async for value in queue], [0, 1, 2, 3, 4])
+        await producer
+        with self.assertRaises(RuntimeError):
+            queue.put_nowait(5)
+
+
+class TestAsyncStack(unittest.IsolatedAsyncioTestCase):
+
+    async def test_lifo_order(self):
+        """Test that elements come out in LIFO order."""
+        stack = AsyncStack()
+        for value in (1, 2, 3):
+            await stack.put(value)
+        stack.close()
+        self.assertEqual([value async for value in stack], [3, 2, 1])
+
+    async def test_getter_parks_until_put(self):
+        """Test that a waiting getter is woken by a put."""
+        stack = AsyncStack()
+        getter = asyncio.create_task(stack.get())
+        await asyncio.sleep(0)
+        await stack.put("x")
+        self.assertEqual(await getter, "x")
+
+
+if __name__ == '__main__':
+    unittest.main()
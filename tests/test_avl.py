@@ -1,5 +1,7 @@
+import random
 import unittest
-from structures.avl import AVLTree
+from structures.avl import AVLTree, AVLTreeMap
+from structures.node import AVLMapNode, AVLNode
 
 class TestAVLTree(unittest.TestCase):
 
@@ -71,6 +73,29 @@ class TestAVLTree(unittest.TestCase):
         expected_inorder = [10, 20, 30, 40, 50, 60, 70]
         self.assertEqual(self.avl.inorder_traversal(self.root), expected_inorder)
 
+    def test_lazy_inorder_and_irange(self):
+        """Test the generator-based traversal and range iteration on a threaded root."""
+        for value in range(0, 100, 5):
+            self.root = self.avl.insert(self.root, value)
+        iterator = self.avl.iter_inorder(self.root)
+        self.assertEqual([next(iterator), next(iterator)], [0, 5])
+        self.assertEqual(list(self.avl.irange(self.root, 12, 30)), [15, 20, 25, 30])
+        self.assertEqual(list(self.avl.irange(self.root, 15, 30, inclusive=(False, False))), [20, 25])
+        self.assertEqual(list(self.avl.irange(self.root, hi=10)), [0, 5, 10])
+        self.assertEqual(list(self.avl.irange(self.root, 96)), [])
+
+    def test_duplicates_share_a_node(self):
+        """Test that repeated values are counted on one node rather than added as nodes."""
+        for value in [10, 20, 10, 10, 30]:
+            self.root = self.avl.insert(self.root, value)
+        self.assertEqual(self.avl.get_size(self.root), 5)
+        self.assertEqual(self.avl.get_height(self.root), 2)
+        self.assertEqual(self.avl.inorder_traversal(self.root), [10, 10, 10, 20, 30])
+        self.root = self.avl.delete(self.root, 10)
+        self.assertEqual(self.avl.inorder_traversal(self.root), [10, 10, 20, 30])
+        self.root = self.avl.delete(self.root, 10, all_copies=True)
+        self.assertEqual(self.avl.inorder_traversal(self.root), [20, 30])
+
     def test_delete_leaf_node(self):
         """Test deleting a leaf node and check if the AVL tree rebalances correctly."""
         values = [40, 20, 60, 10, 30, 50, 70]
@@ -116,6 +141,263 @@ class TestAVLTree(unittest.TestCase):
         # In-order traversal should still return the correct sorted order
         self.assertEqual(self.avl.inorder_traversal(self.root), [10, 20, 30, 50, 60, 70])
 
+    def test_delete_moves_successor_node(self):
+        """Test that the successor node itself replaces a deleted node with two children."""
+        for value in [40, 20, 60, 10, 30, 50, 70]:
+            self.root = self.avl.insert(self.root, value)
+        successor = self.root.right.left  # 50
+        self.root = self.avl.delete(self.root, 40)
+        self.assertIs(self.root, successor)
+        self.assertEqual(self.avl.get_size(self.root), 6)
+        self.assertEqual(self.avl.get_height(self.root), 3)
+
+
+class TestAVLTreeMap(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an AVLTreeMap holding 10..70 in steps of 10."""
+        self.tree = AVLTreeMap()
+        for value in [40, 20, 60, 10, 30, 50, 70]:
+            self.tree.insert(value)
+
+    def assertValid(self, node):
+        """Check BST order, AVL balance, heights and sizes; return (height, size)."""
+        if node is None:
+            return 0, 0
+        left_height, left_size = self.assertValid(node.left)
+        right_height, right_size = self.assertValid(node.right)
+        if node.left:
+            self.assertLess(node.left.value, node.value)
+        if node.right:
+            self.assertGreater(node.right.value, node.value)
+        self.assertLessEqual(abs(left_height - right_height), 1)
+        self.assertEqual(node.height, 1 + max(left_height, right_height))
+        self.assertEqual(node.size, node.count + left_size + right_size)
+        return node.height, node.size
+
+    def test_owns_root(self):
+        """Test that callers no longer thread the root through each call."""
+        self.assertEqual(self.tree.inorder_traversal(), [10, 20, 30, 40, 50, 60, 70])
+        self.assertEqual(len(self.tree), 7)
+        self.assertEqual(self.tree.height(), 2)
+        self.assertIn(30, self.tree)
+        self.assertNotIn(35, self.tree)
+        self.assertEqual(self.tree.find_min(), 10)
+        self.assertEqual(self.tree.find_max(), 70)
+
+    def test_iteration(self):
+        """Test sorted iteration and lazy range scans on the container."""
+        self.assertEqual(list(self.tree), [10, 20, 30, 40, 50, 60, 70])
+        self.assertEqual(list(self.tree.irange(25, 55)), [30, 40, 50])
+        self.assertEqual(list(self.tree.irange(30, 50, inclusive=(False, True))), [40, 50])
+        self.assertEqual(list(self.tree.irange(lo=60)), [60, 70])
+
+    def test_duplicates_ignored(self):
+        """Test that inserting an existing value leaves the tree unchanged."""
+        self.tree.insert(40)
+        self.assertEqual(len(self.tree), 7)
+
+    def test_rank_and_select(self):
+        """Test order statistics against the sorted values."""
+        values = self.tree.inorder_traversal()
+        for index, value in enumerate(values):
+            self.assertEqual(self.tree.rank(value), index)
+            self.assertEqual(self.tree.select(index), value)
+            self.assertEqual(self.tree.kth_smallest(index + 1), value)
+        self.assertEqual(self.tree.rank(35), 3)
+        self.assertEqual(self.tree.rank(0), 0)
+        self.assertEqual(self.tree.rank(99), 7)
+        with self.assertRaises(IndexError):
+            self.tree.select(7)
+
+    def test_random_operations_keep_invariants(self):
+        """Test random inserts and deletes against a Python set."""
+        rng = random.Random(7)
+        tree = AVLTreeMap()
+        expected = set()
+        for _ in range(2000):
+            value = rng.randrange(300)
+            if rng.random() < 0.6:
+                tree.insert(value)
+                expected.add(value)
+            else:
+                tree.delete(value)
+                expected.discard(value)
+        self.assertValid(tree.root)
+        self.assertEqual(tree.inorder_traversal(), sorted(expected))
+        self.assertEqual(len(tree), len(expected))
+        ordered = sorted(expected)
+        self.assertEqual(tree.select(len(ordered) // 2), ordered[len(ordered) // 2])
+
+    def test_bulk_load(self):
+        """Test that bulk-loaded trees have correct AVL heights and sizes."""
+        tree = AVLTreeMap.from_sorted(range(1000))
+        self.assertIsInstance(tree, AVLTreeMap)
+        self.assertValid(tree.root)
+        self.assertEqual(len(tree), 1000)
+        self.assertEqual(tree.select(500), 500)
+        tree.insert(1000)
+        tree.delete(0)
+        self.assertValid(tree.root)
+        tree = AVLTreeMap.from_iterable([3, 1, 2, 3])
+        self.assertEqual(list(tree), [1, 2, 3])
+        root = AVLTree().build_balanced([1, 2, 3, 4])
+        self.assertEqual(AVLTree().inorder_traversal(root), [1, 2, 3, 4])
+        self.assertEqual(root.height, 3)
+
+    def test_batch_insert_and_delete(self):
+        """Test insert_many and delete_many against a Python set."""
+        rng = random.Random(11)
+        tree = AVLTreeMap.from_iterable(rng.sample(range(10000), 3000))
+        expected = set(tree)
+        batch = [rng.randrange(10000) for _ in range(200)]
+        tree.insert_many(batch)
+        expected.update(batch)
+        self.assertValid(tree.root)
+        self.assertEqual(list(tree), sorted(expected))
+        batch = rng.sample(range(10000), 2500)
+        tree.delete_many(batch)
+        expected.difference_update(batch)
+        self.assertValid(tree.root)
+        self.assertEqual(list(tree), sorted(expected))
+        self.assertEqual(len(tree), len(expected))
+
+    def test_set_algebra(self):
+        """Test union, intersection and difference, both copying and in place."""
+        rng = random.Random(5)
+        a_values = set(rng.sample(range(500), 200))
+        b_values = set(rng.sample(range(500), 30))
+        a, b = AVLTreeMap.from_iterable(a_values), AVLTreeMap.from_iterable(b_values)
+        for result, expected in [(a.union(b), a_values | b_values),
+                                 (a.intersection(b), a_values & b_values),
+                                 (a.difference(b), a_values - b_values),
+                                 (b.difference(a), b_values - a_values)]:
+            self.assertValid(result.root)
+            self.assertEqual(list(result), sorted(expected))
+        # The copying forms leave their inputs untouched
+        self.assertEqual(list(a), sorted(a_values))
+        self.assertEqual(list(b), sorted(b_values))
+        a.update(b)
+        self.assertEqual(list(a), sorted(a_values | b_values))
+        a.difference_update(b)
+        self.assertEqual(list(a), sorted(a_values - b_values))
+        a.intersection_update(AVLTreeMap.from_iterable(range(100)))
+        self.assertValid(a.root)
+        self.assertEqual(list(a), sorted(v for v in a_values - b_values if v < 100))
+
+    def test_split(self):
+        """Test splitting around present and absent values."""
+        left, right = self.tree.split(40)
+        self.assertEqual(list(left), [10, 20, 30])
+        self.assertEqual(list(right), [40, 50, 60, 70])
+        self.assertValid(right.root)
+        self.assertEqual(len(self.tree), 0)
+        low, high = right.split(55)
+        self.assertEqual((list(low), list(high)), ([40, 50], [60, 70]))
+
+    def test_sorted_insert_stays_balanced(self):
+        """Test that sorted input gives a logarithmic height."""
+        tree = AVLTreeMap()
+        for value in range(1000):
+            tree.insert(value)
+        self.assertLessEqual(tree.height(), 14)
+        self.assertValid(tree.root)
+
+    def test_key_value_mode(self):
+        """Test the map API and nearest-key queries on a rebalancing tree."""
+        for value in range(100):
+            self.tree[value] = str(value)
+        self.assertValid(self.tree.root)
+        self.assertEqual(self.tree[42], '42')
+        self.tree[42] = 'answer'
+        self.assertEqual(len(self.tree), 100)
+        self.assertEqual(self.tree.get(42), 'answer')
+        del self.tree[42]
+        self.assertValid(self.tree.root)
+        with self.assertRaises(KeyError):
+            del self.tree[42]
+        self.assertEqual(self.tree.floor(42), 41)
+        self.assertEqual(self.tree.ceiling(42), 43)
+        self.assertEqual(self.tree.predecessor(43), 41)
+        self.assertEqual(self.tree.successor(41), 43)
+
+    def test_payloads_survive_batch_operations(self):
+        """Test that payloads move with their nodes through split/join updates."""
+        key = lambda record: record[0]
+        tree = AVLTreeMap.from_iterable([(i, 'old') for i in range(0, 20, 2)], key=key)
+        tree.insert_many([(i, 'new') for i in range(10, 30, 2)])
+        self.assertValid(tree.root)
+        self.assertEqual(tree[8], (8, 'old'))
+        self.assertEqual(tree[10], (10, 'new'))  # Inserted items replace equal keys
+        tree.delete_many([0, 2])
+        low, high = tree.split(20)
+        self.assertEqual(list(low.values())[0], (4, 'old'))
+        self.assertEqual(high.get(28), (28, 'new'))
+        self.assertIs(high.key, key)
+
+    def test_payload_fields_added_on_demand(self):
+        """Test that a plain tree gains payload fields when it first stores or merges payloads."""
+        self.assertIs(type(self.tree.root), AVLNode)
+        other = AVLTreeMap()
+        other[100] = 'x'
+        self.assertIs(type(other.root), AVLMapNode)
+        merged = self.tree.union(other)
+        self.assertEqual(merged[100], 'x')
+        self.assertIs(type(self.tree.root), AVLNode)  # The union left this tree alone
+        self.tree.update(other)
+        self.assertValid(self.tree.root)
+        self.assertEqual(self.tree.get(100), 'x')
+        self.tree.insert_many(range(200, 210))
+        self.assertEqual(len(self.tree), 18)
+        self.assertIs(type(self.tree.root), AVLMapNode)
+
+    def test_plain_values_keep_payloads(self):
+        """Test that merging plain values into equal keys keeps the stored payloads."""
+        self.tree[10] = 'ten'
+        self.tree.insert(10)
+        self.tree.insert_many([10, 20, 80])
+        self.assertEqual(self.tree[10], 'ten')
+        plain = AVLTreeMap.from_iterable([10, 90])
+        self.assertEqual(self.tree.union(plain)[10], 'ten')
+        self.tree.update(plain)
+        self.assertEqual(self.tree[10], 'ten')
+        self.assertEqual(list(self.tree), [10, 20, 30, 40, 50, 60, 70, 80, 90])
+        other = AVLTreeMap()
+        other[10] = 'TEN'
+        self.tree.update(other)  # Incoming payloads still win
+        self.assertEqual(self.tree[10], 'TEN')
+        key = lambda record: record[0]
+        records = AVLTreeMap.from_iterable([(1, 'old')], key=key)
+        records.insert_many([(1, 'new')])
+        self.assertEqual(records[1], (1, 'new'))
+
+    def test_multiset(self):
+        """Test counts, order statistics over every copy, and multiset batch algebra."""
+        tree = AVLTreeMap(multiset=True)
+        for value in [1] * 1000 + [2, 3, 3]:
+            tree.insert(value)
+        self.assertValid(tree.root)
+        self.assertEqual(tree.root.size, 1003)
+        self.assertEqual(tree.height(), 1)  # Three nodes in all
+        self.assertEqual(len(tree), 1003)
+        self.assertEqual(tree.count(1), 1000)
+        self.assertEqual(tree.rank(2), 1000)
+        self.assertEqual(tree.select(999), 1)
+        self.assertEqual(tree.select(1001), 3)
+        tree.delete(1)
+        self.assertEqual(tree.count(1), 999)
+        del tree[1]
+        self.assertEqual(list(tree), [2, 3, 3])
+        tree.insert_many([3, 4, 4])
+        self.assertEqual(list(tree), [2, 3, 3, 3, 4, 4])
+        tree.delete_many([3, 3, 4, 2])
+        self.assertEqual(list(tree), [3, 4])
+        self.assertValid(tree.root)
+        other = AVLTreeMap.from_iterable([3, 3, 5], multiset=True)
+        self.assertEqual(list(tree.union(other)), [3, 3, 3, 4, 5])
+        self.assertEqual(list(other.intersection(tree)), [3])
+        self.assertEqual(list(other.difference(tree)), [3, 5])
+
 
 if __name__ == '__main__':
     unittest.main()
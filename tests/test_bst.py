@@ -1,7 +1,9 @@
 # tests/test_bst.py
 
 import unittest
+from structures import batch
 from structures.bst import BinarySearchTree
+from structures.node import BSTMapNode, BSTMultiNode, BSTNode
 
 class TestBinarySearchTree(unittest.TestCase):
 
@@ -129,6 +131,164 @@ class TestBinarySearchTree(unittest.TestCase):
             self.bst.find_max()
         self.assertEqual(self.bst.height(), -1)
 
+    def test_sorted_insert_deep_tree(self):
+        """Test that a degenerate chain deeper than the recursion limit works."""
+        values = list(range(5000))
+        for value in values:
+            self.bst.insert(value)
+        self.assertEqual(self.bst.height(), 4999)
+        self.assertTrue(self.bst.search(4999))
+        self.assertEqual(self.bst.find_max(), 4999)
+        self.assertEqual(self.bst.inorder_traversal(), values)
+        self.assertEqual(self.bst.preorder_traversal(), values)
+        self.assertEqual(self.bst.postorder_traversal(), values[::-1])
+        self.bst.delete(0)
+        self.bst.delete(4999)
+        self.assertEqual(self.bst.inorder_traversal(), values[1:-1])
+
+    def test_delete_with_deep_successor(self):
+        """Test deleting a node whose inorder successor has a right child."""
+        for value in [50, 30, 80, 60, 90, 70, 65]:
+            self.bst.insert(value)
+        self.bst.delete(50)  # Successor 60 has right subtree 70 -> 65
+        self.assertEqual(self.bst.root.value, 60)
+        self.assertEqual(self.bst.inorder_traversal(), [30, 60, 65, 70, 80, 90])
+        self.assertEqual(self.bst.preorder_traversal(), [60, 30, 80, 70, 65, 90])
+
+    def test_delete_missing_and_duplicates(self):
+        """Test that duplicates are ignored and deleting a missing value is a no-op."""
+        for value in [50, 30, 50, 70]:
+            self.bst.insert(value)
+        self.bst.delete(99)
+        self.assertEqual(self.bst.inorder_traversal(), [30, 50, 70])
+
+    def test_iteration_and_irange(self):
+        """Test lazy sorted iteration and bounded range scans."""
+        for value in [50, 30, 70, 20, 40, 60, 80]:
+            self.bst.insert(value)
+        self.assertEqual(list(self.bst), [20, 30, 40, 50, 60, 70, 80])
+        self.assertEqual(list(self.bst.irange(35, 65)), [40, 50, 60])
+        self.assertEqual(list(self.bst.irange(40, 60, inclusive=(False, False))), [50])
+        self.assertEqual(list(BinarySearchTree().irange(1, 2)), [])
+
+    def test_from_sorted(self):
+        """Test bulk-loading a perfectly balanced tree from sorted input."""
+        tree = BinarySearchTree.from_sorted(range(1023))
+        self.assertEqual(tree.height(), 9)
+        self.assertEqual(tree.inorder_traversal(), list(range(1023)))
+        tree = BinarySearchTree.from_sorted([1, 2, 2, 3])
+        self.assertEqual(tree.inorder_traversal(), [1, 2, 3])
+        self.assertIsNone(BinarySearchTree.from_sorted([]).root)
+        with self.assertRaises(ValueError):
+            BinarySearchTree.from_sorted([2, 1])
+
+    def test_from_iterable(self):
+        """Test bulk-loading from unsorted input."""
+        tree = BinarySearchTree.from_iterable([5, 1, 4, 1, 3])
+        self.assertEqual(tree.inorder_traversal(), [1, 3, 4, 5])
+        self.assertEqual(tree.height(), 2)
+
+    def test_node_fields_follow_mode(self):
+        """Test that nodes get payload and count fields only in the modes that use them."""
+        for value in range(10):
+            self.bst.insert(value)  # A chain, so the conversion below must not recurse
+        self.assertIs(type(self.bst.root), BSTNode)
+        self.bst[10] = 'j'  # The first payload converts the existing nodes
+        self.assertIs(type(self.bst.root), BSTMapNode)
+        self.assertEqual(list(self.bst.items())[-2:], [(9, None), (10, 'j')])
+        self.assertEqual(self.bst.height(), 10)
+        self.assertIs(type(BinarySearchTree.from_sorted([1, 1, 2], multiset=True).root), BSTMultiNode)
+        self.assertIs(type(BinarySearchTree.from_sorted([(1, 'a')], key=lambda item: item[0]).root), BSTMapNode)
+
+    def test_key_value_mode(self):
+        """Test mapping keys to payloads with [], get and del."""
+        self.bst[2] = 'b'
+        self.bst[1] = 'a'
+        self.bst[2] = 'B'  # Replaces the payload, not the node
+        self.assertEqual(self.bst[2], 'B')
+        self.assertEqual(self.bst.get(1), 'a')
+        self.assertEqual(self.bst.get(3, 'none'), 'none')
+        self.assertEqual(list(self.bst.items()), [(1, 'a'), (2, 'B')])
+        self.assertEqual(list(self.bst.values()), ['a', 'B'])
+        del self.bst[1]
+        self.assertNotIn(1, self.bst)
+        with self.assertRaises(KeyError):
+            self.bst[1]
+        with self.assertRaises(KeyError):
+            del self.bst[1]
+
+    def test_floor_ceiling_predecessor_successor(self):
+        """Test nearest-key queries on present and absent keys."""
+        for value in [50, 30, 70, 20, 40, 60, 80]:
+            self.bst.insert(value)
+        self.assertEqual(self.bst.floor(45), 40)
+        self.assertEqual(self.bst.floor(40), 40)
+        self.assertIsNone(self.bst.floor(10))
+        self.assertEqual(self.bst.ceiling(45), 50)
+        self.assertEqual(self.bst.ceiling(50), 50)
+        self.assertIsNone(self.bst.ceiling(90))
+        self.assertEqual(self.bst.predecessor(50), 40)
+        self.assertIsNone(self.bst.predecessor(20))
+        self.assertEqual(self.bst.successor(50), 60)
+        self.assertEqual(self.bst.successor(65), 70)
+        self.assertIsNone(self.bst.successor(80))
+
+    def test_key_function(self):
+        """Test storing whole records ordered by a key function."""
+        tree = BinarySearchTree(key=lambda record: record[0])
+        tree.insert((3, 'c'))
+        tree.insert((1, 'a'))
+        tree.insert((3, 'C'))  # Same key: the later record wins
+        self.assertEqual(list(tree), [1, 3])
+        self.assertEqual(tree[3], (3, 'C'))
+        self.assertTrue(tree.search(1))
+        tree.delete(1)
+        self.assertEqual(list(tree.values()), [(3, 'C')])
+        tree = BinarySearchTree.from_iterable([(2, 'x'), (1, 'y'), (2, 'z')], key=lambda record: record[0])
+        self.assertEqual(list(tree.items()), [(1, (1, 'y')), (2, (2, 'z'))])
+
+    def test_search_many(self):
+        """Test batch membership in input order, with repeated and absent probes."""
+        for value in [50, 30, 70, 20, 40, 60, 80]:
+            self.bst.insert(value)
+        probes = [80, 45, 20, 20, 100, -5, 50]
+        self.assertEqual(self.bst.search_many(probes), [True, False, True, True, False, False, True])
+        self.assertEqual(self.bst.search_many(iter([])), [])
+        self.assertEqual(BinarySearchTree().search_many([1]), [False])
+
+    @unittest.skipUnless(batch.np is None, "NumPy is installed")
+    def test_search_many_as_numpy_needs_numpy(self):
+        """Test that asking for a NumPy mask without NumPy raises ImportError."""
+        with self.assertRaises(ImportError):
+            self.bst.search_many([1], as_numpy=True)
+
+    @unittest.skipIf(batch.np is None, "NumPy is not installed")
+    def test_search_many_as_numpy(self):
+        """Test that as_numpy returns a NumPy bool array."""
+        self.bst.insert(1)
+        mask = self.bst.search_many([1, 2], as_numpy=True)
+        self.assertEqual(mask.dtype, batch.np.bool_)
+        self.assertEqual(mask.tolist(), [True, False])
+
+    def test_multiset(self):
+        """Test that multiset mode counts duplicates on one node."""
+        tree = BinarySearchTree(multiset=True)
+        for value in [5, 3, 5, 5, 8, 3]:
+            tree.insert(value)
+        self.assertEqual(tree.count(5), 3)
+        self.assertEqual(tree.count(4), 0)
+        self.assertEqual(tree.inorder_traversal(), [3, 3, 5, 5, 5, 8])
+        self.assertEqual(list(tree.irange(4, 8, inclusive=(True, False))), [5, 5, 5])
+        self.assertEqual(tree.preorder_traversal(), [5, 3, 8])  # One node per value
+        tree.delete(5)
+        self.assertEqual(tree.count(5), 2)
+        del tree[5]
+        self.assertNotIn(5, tree)
+        self.assertEqual(list(tree), [3, 3, 8])
+        tree = BinarySearchTree.from_iterable([2, 1, 2, 2], multiset=True)
+        self.assertEqual((tree.count(1), tree.count(2)), (1, 3))
+        self.assertEqual(tree.height(), 1)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,122 @@
+import random
+import unittest
+from structures.btree import BTree
+
+class TestBTree(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a small-order BTree so that a few values already split nodes."""
+        self.tree = BTree(order=4)
+
+    def assertValid(self, tree):
+        """Check key order, node fill, uniform leaf depth and the leaf chain."""
+        leaves = []
+
+        def walk(node, lo, hi, depth):
+            if node is not tree.root:
+                self.assertGreaterEqual(len(node.keys), tree.order // 2)
+            self.assertLessEqual(len(node.keys), tree.order)
+            self.assertEqual(node.keys, sorted(set(node.keys)))
+            for key in node.keys:
+                self.assertTrue(lo is None or lo <= key)
+                self.assertTrue(hi is None or key < hi)
+            if node.children is None:
+                leaves.append((node, depth))
+                return
+            self.assertEqual(len(node.children), len(node.keys) + 1)
+            bounds = [lo] + node.keys + [hi]
+            for i, child in enumerate(node.children):
+                walk(child, bounds[i], bounds[i + 1], depth + 1)
+
+        walk(tree.root, None, None, 0)
+        self.assertEqual(len({depth for _, depth in leaves}), 1)
+        chain, leaf = [], tree._head
+        while leaf is not None:
+            chain.append(leaf)
+            leaf = leaf.next
+        self.assertEqual(chain, [leaf for leaf, _ in leaves])
+        self.assertEqual(len(tree), sum(len(leaf.keys) for leaf in chain))
+
+    def test_insert_and_search(self):
+        """Test that inserts split nodes and every value stays findable."""
+        for value in [50, 30, 70, 20, 40, 60, 80, 30]:
+            self.tree.insert(value)
+        self.assertValid(self.tree)
+        self.assertEqual(self.tree.inorder_traversal(), [20, 30, 40, 50, 60, 70, 80])
+        self.assertEqual(len(self.tree), 7)
+        self.assertEqual(self.tree.height(), 1)
+        self.assertTrue(self.tree.search(60))
+        self.assertNotIn(65, self.tree)
+
+    def test_delete(self):
+        """Test deleting values, including missing ones, until the tree is empty."""
+        for value in range(20):
+            self.tree.insert(value)
+        for value in [0, 19, 10, 10, 99]:
+            self.tree.delete(value)
+        self.assertValid(self.tree)
+        self.assertEqual(list(self.tree), [v for v in range(20) if v not in (0, 10, 19)])
+        for value in range(20):
+            self.tree.delete(value)
+        self.assertEqual(list(self.tree), [])
+        self.assertEqual(self.tree.height(), -1)
+
+    def test_random_operations_keep_invariants(self):
+        """Test random operations against a Python set for several orders."""
+        for order in (3, 4, 5, 16):
+            rng = random.Random(order)
+            tree = BTree(order)
+            expected = set()
+            for _ in range(3000):
+                value = rng.randrange(300)
+                if rng.random() < 0.55:
+                    tree.insert(value)
+                    expected.add(value)
+                else:
+                    tree.delete(value)
+                    expected.discard(value)
+            self.assertValid(tree)
+            self.assertEqual(tree.inorder_traversal(), sorted(expected))
+
+    def test_irange(self):
+        """Test range scans along the leaf chain, with open and exclusive bounds."""
+        tree = BTree.from_iterable(range(0, 100, 2), order=4)
+        self.assertEqual(list(tree.irange(9, 21)), [10, 12, 14, 16, 18, 20])
+        self.assertEqual(list(tree.irange(10, 20, inclusive=(False, False))), [12, 14, 16, 18])
+        self.assertEqual(list(tree.irange(hi=4)), [0, 2, 4])
+        self.assertEqual(list(tree.irange(95)), [96, 98])
+        self.assertEqual(list(tree.irange(200)), [])
+
+    def test_from_sorted(self):
+        """Test bulk loading packed, valid trees of many sizes."""
+        for n in (0, 1, 4, 5, 17, 100, 1000):
+            tree = BTree.from_sorted(range(n), order=4)
+            self.assertValid(tree)
+            self.assertEqual(list(tree), list(range(n)))
+        self.assertEqual(BTree.from_sorted(range(10 ** 4)).height(), 2)
+        with self.assertRaises(ValueError):
+            BTree.from_sorted([2, 1])
+
+    def test_min_max(self):
+        """Test find_min and find_max, and the error on an empty tree."""
+        with self.assertRaises(ValueError):
+            self.tree.find_min()
+        for value in [5, 3, 9, 1, 7]:
+            self.tree.insert(value)
+        self.assertEqual((self.tree.find_min(), self.tree.find_max()), (1, 9))
+
+    def test_search_many(self):
+        """Test batch membership in input order across many leaves."""
+        tree = BTree.from_iterable(range(0, 1000, 3), order=4)
+        probes = [999, -1, 0, 500, 501, 3, 3, 2000]
+        self.assertEqual(tree.search_many(probes), [p in range(0, 1000, 3) for p in probes])
+        self.assertEqual(self.tree.search_many([1, 2]), [False, False])
+
+    def test_invalid_order(self):
+        """Test that an order below 3 is rejected."""
+        with self.assertRaises(ValueError):
+            BTree(order=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,185 @@
+import unittest
+from structures.cache import LRUCache, LFUCache, memoize
+
+
+class FakeTimer:
+    """A controllable clock for TTL tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a three-entry LRU cache that records evictions."""
+        self.evicted = []
+        self.timer = FakeTimer()
+        self.cache = LRUCache(maxsize=3, timer=self.timer,
+                              on_evict=lambda key, value: self.evicted.append(key))
+
+    def test_get_put(self):
+        """Test storing and retrieving values and the hit/miss counters."""
+        self.cache.put("a", 1)
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.get("b", 0), 0)
+        self.assertEqual(self.cache.stats(), {'hits': 1, 'misses': 2, 'evictions': 0, 'expirations': 0})
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted first."""
+        for key in "abc":
+            self.cache.put(key, key)
+        self.cache.get("a")  # "b" is now the least recently used
+        self.cache.put("d", "d")
+        self.assertEqual(self.evicted, ["b"])
+        self.assertNotIn("b", self.cache)
+        self.assertEqual(len(self.cache), 3)
+        self.assertEqual(self.cache.evictions, 1)
+
+    def test_replace_refreshes(self):
+        """Test that replacing a value counts as a use and does not evict."""
+        for key in "abc":
+            self.cache.put(key, key)
+        self.cache.put("a", "A")
+        self.cache.put("d", "d")
+        self.assertEqual(self.evicted, ["b"])
+        self.assertEqual(self.cache.get("a"), "A")
+
+    def test_maxbytes(self):
+        """Test eviction by total size."""
+        cache = LRUCache(maxsize=None, maxbytes=10, sizeof=len)
+        cache.put("a", "xxxx")
+        cache.put("b", "yyyy")
+        cache.put("c", "zzzz")
+        self.assertNotIn("a", cache)
+        self.assertEqual(cache.currbytes, 8)
+
+    def test_ttl(self):
+        """Test that entries expire lazily on access and eagerly via expire()."""
+        self.cache.put("a", 1, ttl=5)
+        self.cache.put("b", 2, ttl=50)
+        self.timer.now = 10
+        self.assertNotIn("a", self.cache)
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(self.cache.expirations, 1)
+        self.timer.now = 100
+        self.assertEqual(self.cache.expire(), 1)
+        self.assertEqual(self.evicted, ["a", "b"])
+        self.assertEqual(len(self.cache), 0)
+
+    def test_pop_and_clear(self):
+        """Test explicit removal, which does not call the eviction callback."""
+        self.cache.put("a", 1)
+        self.cache.put("b", 2)
+        self.assertEqual(self.cache.pop("a"), 1)
+        self.assertIsNone(self.cache.pop("a"))
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.evicted, [])
+        self.cache.put("c", 3)
+        self.assertEqual(self.cache.get("c"), 3)
+
+
+class TestLFUCache(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a three-entry LFU cache."""
+        self.cache = LFUCache(maxsize=3)
+
+    def test_evicts_least_frequently_used(self):
+        """Test that the entry with the fewest hits is evicted first."""
+        for key in "abc":
+            self.cache.put(key, key)
+        for _ in range(3):
+            self.cache.get("a")
+        self.cache.get("c")
+        self.cache.put("d", "d")
+        self.assertNotIn("b", self.cache)
+        self.cache.put("e", "e")  # "d" has the lowest count now
+        self.assertNotIn("d", self.cache)
+        self.assertIn("a", self.cache)
+        self.assertIn("c", self.cache)
+
+    def test_ties_broken_by_recency(self):
+        """Test that equally frequent entries are evicted least recently used first."""
+        for key in "abc":
+            self.cache.put(key, key)
+        self.cache.put("d", "d")
+        self.assertNotIn("a", self.cache)
+
+    def test_min_frequency_after_pop(self):
+        """Test that eviction still works after the lowest bucket is emptied by pop."""
+        self.cache.put("a", 1)
+        self.cache.get("a")
+        self.cache.put("b", 2)
+        self.cache.get("b")
+        self.cache.put("c", 3)
+        self.cache.pop("c")
+        self.cache.put("c", 3)
+        self.cache.get("c")
+        self.cache.put("d", 4)  # Every other entry has a count of 2; "a" is the oldest
+        self.assertNotIn("a", self.cache)
+        self.assertIn("d", self.cache)
+        self.cache.put("e", 5)
+        self.assertNotIn("d", self.cache)
+        self.assertEqual(len(self.cache), 3)
+
+    def test_new_key_survives_its_own_put(self):
+        """Test that a new key is admitted when every resident entry has a higher count."""
+        evicted = []
+        cache = LFUCache(maxsize=2, on_evict=lambda key, value: evicted.append(key))
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.get("b")
+        cache.put("c", 3)
+        self.assertIn("c", cache)
+        self.assertEqual(evicted, ["a"])
+        self.assertEqual(cache.evictions, 1)
+
+
+class TestMemoize(unittest.TestCase):
+
+    def test_caches_results(self):
+        """Test that repeated calls hit the cache."""
+        calls = []
+
+        @memoize(maxsize=2)
+        def square(x, offset=0):
+            calls.append(x)
+            return x * x + offset
+
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3, offset=1), 10)
+        self.assertEqual(calls, [3, 3])
+        self.assertEqual(square.cache.hits, 1)
+
+    def test_bare_decorator_and_custom_cache(self):
+        """Test @memoize without arguments and with an explicit cache."""
+        @memoize
+        def double(x):
+            return 2 * x
+
+        @memoize(LFUCache(maxsize=1))
+        def triple(x):
+            return 3 * x
+
+        self.assertEqual(double(2), 4)
+        self.assertIsInstance(double.cache, LRUCache)
+        self.assertEqual(triple(2), 6)
+        self.assertEqual(triple(2), 6)
+        self.assertEqual(triple.cache.hits, 1)
+
+    def test_unknown_policy(self):
+        """Test that an unknown policy name is rejected."""
+        with self.assertRaises(ValueError):
+            memoize(policy='fifo')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import threading
+import unittest
+from structures.concurrent_avl import ConcurrentAVLTree
+
+class TestConcurrentAVLTree(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a tree holding 0..99."""
+        self.tree = ConcurrentAVLTree(range(100))
+
+    def test_basic_operations(self):
+        """Test single-threaded reads and writes."""
+        self.assertEqual(len(self.tree), 100)
+        self.tree.insert(150)
+        self.tree.delete(0)
+        self.assertIn(150, self.tree)
+        self.assertFalse(self.tree.search(0))
+        self.assertEqual(self.tree.select(0), 1)
+        self.assertEqual(list(self.tree.irange(97)), [97, 98, 99, 150])
+        self.tree.insert_many([200, 201])
+        self.tree.delete_many(range(1, 100))
+        self.assertEqual(list(self.tree), [150, 200, 201])
+
+    def test_snapshot_is_stable(self):
+        """Test that a snapshot and an in-progress iteration ignore later writes."""
+        snapshot = self.tree.snapshot()
+        iterator = iter(self.tree)
+        self.tree.delete_many(range(50))
+        self.assertEqual(list(snapshot), list(range(100)))
+        self.assertEqual(list(iterator), list(range(100)))
+        self.assertEqual(len(self.tree), 50)
+
+    def test_concurrent_writers_and_readers(self):
+        """Test that concurrent writers lose no updates and readers always see whole versions."""
+        errors = []
+
+        def write(offset):
+            for value in range(1000 + offset, 3000, 4):
+                self.tree.insert(value)
+
+        def read():
+            for _ in range(200):
+                snapshot = self.tree.snapshot()
+                values = list(snapshot)
+                if values != sorted(values) or len(values) != len(snapshot):
+                    errors.append(values)
+
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(4)]
+        threads += [threading.Thread(target=read) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(list(self.tree), list(range(100)) + list(range(1000, 3000)))
+
+
+if __name__ == '__main__':
+    unittest.main()
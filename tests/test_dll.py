@@ -58,3 +58,70 @@ class TestDoublyLinkedList(unittest.TestCase):
     def test_delete_middle(self):
         """Test deleting a middle element from the list."""
 
+    def test_iteration(self):
+        """Test forward and reverse iteration, len and membership."""
+        for value in (10, 20, 30):
+            self.dll.append(value)
+        self.dll.delete(20)
+        self.assertEqual(list(self.dll), [10, 30])
+        self.assertEqual(list(reversed(self.dll)), [30, 10])
+        self.assertEqual(len(self.dll), 2)
+        self.assertIn(30, self.dll)
+        self.assertNotIn(20, self.dll)
+
+    def test_node_handles(self):
+        """Test O(1) moves and pops through the node returned by append/prepend."""
+        first = self.dll.append(1)
+        self.dll.append(2)
+        last = self.dll.append(3)
+        self.dll.move_to_front(last)
+        self.assertEqual(list(self.dll), [3, 1, 2])
+        self.dll.move_to_back(first)
+        self.assertEqual(list(self.dll), [3, 2, 1])
+        self.assertEqual(list(reversed(self.dll)), [1, 2, 3])
+        self.assertEqual(self.dll.remove_node(first), 1)
+        self.assertEqual(self.dll.pop_tail(), 2)
+        self.assertEqual(self.dll.pop_head(), 3)
+        self.assertTrue(self.dll.is_empty())
+        self.assertEqual(len(self.dll), 0)
+        with self.assertRaises(IndexError):
+            self.dll.pop_tail()
+
+    def test_search_many(self):
+        """Test batch membership in input order, with repeated and absent probes."""
+        for value in ("a", "b", "c"):
+            self.dll.append(value)
+        self.dll.delete("b")
+        self.assertEqual(self.dll.search_many(["c", "b", "a", "c"]), [True, False, True, True])
+        self.assertEqual(self.dll.search_many(iter(["z"])), [False])
+
+
+class TestIndexedDoublyLinkedList(TestDoublyLinkedList):
+
+    def setUp(self):
+        """Set up an indexed doubly linked list so every test also runs through the index."""
+        self.dll = DoublyLinkedList(indexed=True)
+
+    def test_duplicates_delete_first_occurrence(self):
+        """Test that deleting a duplicated value removes the earliest node in list order."""
+        self.dll.append("b")
+        self.dll.append("a")
+        self.dll.prepend("a")
+        self.dll.append("a")
+        self.dll.delete("a")
+        self.assertEqual(list(self.dll), ["b", "a", "a"])
+        self.dll.delete("a")
+        self.assertEqual(list(self.dll), ["b", "a"])
+        self.dll.delete("a")
+        self.assertFalse(self.dll.search("a"))
+        self.assertEqual(list(self.dll), ["b"])
+        self.assertEqual(list(reversed(self.dll)), ["b"])
+
+    def test_delete_missing(self):
+        """Test that deleting an absent value leaves the list unchanged."""
+        self.dll.append(10)
+        self.dll.delete(99)
+        self.assertEqual(list(self.dll), [10])
+        self.dll.delete(10)
+        self.assertTrue(self.dll.is_empty())
+        self.assertIsNone(self.dll.tail)
@@ -0,0 +1,78 @@
+import random
+import unittest
+from structures import frozen
+from structures.avl import AVLTreeMap
+from structures.bst import BinarySearchTree
+from structures.btree import BTree
+from structures.frozen import FrozenIndex
+
+class TestFrozenIndex(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an AVLTreeMap of the even numbers below 200."""
+        self.tree = AVLTreeMap.from_iterable(range(0, 200, 2))
+
+    def test_layouts_agree(self):
+        """Test that every layout and backing answers the same queries."""
+        probes = list(range(-3, 205))
+        expected = [p % 2 == 0 and 0 <= p < 200 for p in probes]
+        for layout in ('sorted', 'eytzinger'):
+            for typecode in (None, 'q'):
+                index = self.tree.freeze(layout, typecode)
+                self.assertEqual(len(index), 100)
+                self.assertEqual(list(index), list(range(0, 200, 2)))
+                self.assertEqual([p in index for p in probes], expected)
+                self.assertEqual([bool(hit) for hit in index.search_many(probes)], expected)
+
+    def test_eytzinger_every_size(self):
+        """Test Eytzinger search against sorted search for small sizes, present and absent keys."""
+        for n in range(40):
+            index = FrozenIndex(range(0, 2 * n, 2), layout='eytzinger')
+            self.assertEqual(list(index), list(range(0, 2 * n, 2)))
+            for probe in range(-1, 2 * n + 1):
+                self.assertEqual(index.search(probe), probe % 2 == 0 and 0 <= probe < 2 * n)
+
+    def test_freeze_from_other_trees(self):
+        """Test freezing trees of other kinds, including non-numeric keys and multisets."""
+        words = ['pear', 'apple', 'fig']
+        index = BinarySearchTree.from_iterable(words).freeze(layout='eytzinger')
+        self.assertEqual(index.search_many(['fig', 'kiwi']), [True, False])
+        index = BinarySearchTree.from_iterable([3, 1, 3], multiset=True).freeze()
+        self.assertEqual(list(index), [1, 3])
+        keys = random.Random(1).sample(range(10 ** 6), 1000)
+        index = BTree.from_iterable(keys).freeze(typecode='q')
+        self.assertEqual(list(index), sorted(keys))
+
+    def test_frozen_copy_is_independent(self):
+        """Test that the index does not change when the tree does."""
+        index = self.tree.freeze()
+        self.tree.insert(1)
+        self.assertNotIn(1, index)
+
+    def test_unknown_layout(self):
+        """Test that an unknown layout is rejected."""
+        with self.assertRaises(ValueError):
+            self.tree.freeze(layout='heap')
+
+    @unittest.skipIf(frozen.np is None, "NumPy is not installed")
+    def test_numpy_batches(self):
+        """Test that a NumPy-backed index returns a NumPy bool mask for large batches."""
+        np = frozen.np
+        probes = np.arange(-5, 250)
+        for layout in ('sorted', 'eytzinger'):
+            mask = self.tree.freeze(layout, 'q').search_many(probes)
+            self.assertEqual(mask.dtype, np.bool_)
+            self.assertEqual(mask.tolist(), [p % 2 == 0 and 0 <= p < 200 for p in probes.tolist()])
+
+    @unittest.skipIf(frozen.np is None, "NumPy is not installed")
+    def test_numpy_batches_from_iterators(self):
+        """Test that a NumPy-backed index accepts generators and ranges as well as arrays."""
+        for layout in ('sorted', 'eytzinger'):
+            index = self.tree.freeze(layout, 'q')
+            self.assertEqual(index.search_many(x for x in [0, 5, 198]).tolist(), [True, False, True])
+            self.assertEqual(index.search_many(iter([3, 4])).tolist(), [False, True])
+            self.assertEqual(index.search_many(range(0, 4)).tolist(), [True, False, True, False])
+
+
+if __name__ == '__main__':
+    unittest.main()
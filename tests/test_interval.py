@@ -0,0 +1,116 @@
+import random
+import unittest
+from structures.interval import IntervalTree
+
+class TestIntervalTree(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an interval tree holding a few overlapping time windows."""
+        self.tree = IntervalTree()
+        for interval in [(5, 10), (15, 20), (1, 3), (8, 12), (17, 19), (30, 40), (12, 12)]:
+            self.tree.insert(interval)
+
+    def assertValid(self, node):
+        """Check AVL balance and that every max_end is the largest end below it."""
+        if node is None:
+            return 0, None
+        left_height, left_end = self.assertValid(node.left)
+        right_height, right_end = self.assertValid(node.right)
+        self.assertLessEqual(abs(left_height - right_height), 1)
+        self.assertEqual(node.height, 1 + max(left_height, right_height))
+        self.assertEqual(node.max_end, max(end for end in (node.value[1], left_end, right_end) if end is not None))
+        return node.height, node.max_end
+
+    def test_point_queries(self):
+        """Test stabbing queries, including points on interval ends and in gaps."""
+        self.assertValid(self.tree.root)
+        self.assertEqual(self.tree.overlaps(9), [(5, 10), (8, 12)])
+        self.assertEqual(self.tree.overlaps(12), [(8, 12), (12, 12)])
+        self.assertEqual(self.tree.overlaps(3), [(1, 3)])
+        self.assertEqual(self.tree.overlaps(25), [])
+        self.assertEqual(self.tree.overlaps(0), [])
+
+    def test_range_queries(self):
+        """Test overlap queries with closed bounds."""
+        self.assertEqual(self.tree.overlaps(10, 16), [(5, 10), (8, 12), (12, 12), (15, 20)])
+        self.assertEqual(self.tree.overlaps(21, 29), [])
+        self.assertEqual(self.tree.overlaps(40, 100), [(30, 40)])
+        self.assertEqual(len(self.tree.overlaps(-100, 100)), len(self.tree))
+
+    def test_delete_updates_max_end(self):
+        """Test that deletes, through rotations, keep max_end current."""
+        self.assertEqual(self.tree.max_end(), 40)
+        self.tree.delete((30, 40))
+        self.assertValid(self.tree.root)
+        self.assertEqual(self.tree.max_end(), 20)
+        self.assertEqual(self.tree.overlaps(35), [])
+        for interval in list(self.tree):
+            self.tree.delete(interval)
+        self.assertEqual(self.tree.overlaps(0, 100), [])
+        with self.assertRaises(ValueError):
+            self.tree.max_end()
+
+    def test_random_operations_match_scan(self):
+        """Test random inserts, deletes and queries against a brute-force scan."""
+        rng = random.Random(3)
+        tree = IntervalTree()
+        expected = set()
+        for _ in range(3000):
+            start = rng.randrange(1000)
+            interval = (start, start + rng.randrange(50))
+            if rng.random() < 0.6:
+                tree.insert(interval)
+                expected.add(interval)
+            else:
+                tree.delete(interval)
+                expected.discard(interval)
+            lo = rng.randrange(1000)
+            hi = lo + rng.randrange(20)
+            self.assertEqual(tree.overlaps(lo, hi), sorted(i for i in expected if i[0] <= hi and lo <= i[1]))
+        self.assertValid(tree.root)
+
+    def test_bulk_and_set_operations(self):
+        """Test that bulk loading, insert_many, split and union keep max_end current."""
+        intervals = [(i, i + (i * 7) % 13) for i in range(0, 300, 3)]
+        tree = IntervalTree.from_iterable(intervals)
+        self.assertValid(tree.root)
+        tree.insert_many([(50, 400), (7, 8)])
+        self.assertValid(tree.root)
+        self.assertIn((50, 400), tree.overlaps(350))
+        left, right = tree.split((150, 0))
+        self.assertValid(left.root)
+        self.assertValid(right.root)
+        self.assertEqual(left.overlaps(350), [(50, 400)])
+        merged = left.union(right)
+        self.assertValid(merged.root)
+        self.assertEqual(merged.overlaps(0, 1000), sorted(intervals + [(50, 400), (7, 8)]))
+
+    def test_payloads_and_key(self):
+        """Test attaching data to intervals, and storing records through key=."""
+        self.tree[(5, 10)] = 'meeting'
+        self.assertIn(((5, 10), 'meeting'), list(self.tree.overlap_items(6)))
+        bookings = IntervalTree(key=lambda booking: (booking['from'], booking['to']))
+        bookings.insert({'from': 9, 'to': 11, 'room': 'A'})
+        bookings.insert({'from': 10, 'to': 14, 'room': 'B'})
+        rooms = [booking['room'] for _, booking in bookings.overlap_items(12, 13)]
+        self.assertEqual(rooms, ['B'])
+
+    def test_multiset(self):
+        """Test that repeated intervals are counted and reported by their count."""
+        tree = IntervalTree(multiset=True)
+        for interval in [(1, 5), (1, 5), (2, 3)]:
+            tree.insert(interval)
+        self.assertEqual(tree.overlaps(4), [(1, 5), (1, 5)])
+        tree.delete((1, 5))
+        self.assertEqual(tree.overlaps(1, 2), [(1, 5), (2, 3)])
+
+    def test_invalid_interval(self):
+        """Test that an interval ending before it starts is rejected."""
+        with self.assertRaises(ValueError):
+            self.tree.insert((5, 4))
+        with self.assertRaises(ValueError):
+            IntervalTree.from_iterable([(1, 2), (3, 0)])
+
+
+if __name__ == '__main__':
+    unittest.main()
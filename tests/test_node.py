@@ -0,0 +1,37 @@
+import unittest
+from structures.node import SLLNode, DLLNode, BSTNode, BSTMapNode, BSTMultiNode, BSTMultiMapNode, AVLNode, IntervalNode
+
+class TestNodes(unittest.TestCase):
+
+    def test_nodes_have_no_instance_dict(self):
+        """Test that the per-structure nodes are slotted and carry no __dict__."""
+        for node in (SLLNode(1), DLLNode(1), BSTNode(1), AVLNode(1), IntervalNode((1, 2))):
+            self.assertFalse(hasattr(node, '__dict__'))
+
+    def test_node_fields(self):
+        """Test that each node holds only the fields its structure needs."""
+        self.assertEqual(SLLNode.__slots__, ('value', 'next'))
+        self.assertEqual(DLLNode.__slots__, ('value', 'next', 'prev'))
+        self.assertEqual(BSTNode.__slots__, ('value', 'left', 'right'))
+        self.assertEqual(AVLNode(1).height, 1)
+        self.assertEqual(IntervalNode((1, 2)).max_end, 2)
+
+    def test_mode_fields_only_where_used(self):
+        """Test that payload and count take a slot only in the node variants that store them."""
+        node = BSTNode(1, 'ignored')
+        self.assertEqual((node.payload, node.count), (None, 1))
+        with self.assertRaises(AttributeError):
+            node.payload = 'x'
+        self.assertEqual(BSTMapNode(1, 'x').payload, 'x')
+        self.assertEqual(BSTMultiNode(1).count, 1)
+        self.assertEqual(BSTMultiMapNode.__slots__, ('payload', 'count'))
+        self.assertLess(BSTNode(1).__sizeof__(), BSTMultiMapNode(1).__sizeof__())
+
+    def test_unknown_attribute_rejected(self):
+        """Test that assigning a field the node does not define fails."""
+        with self.assertRaises(AttributeError):
+            SLLNode(1).prev = None
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import random
+import unittest
+from structures.persistent_avl import PersistentAVLTree, VersionedAVLTree
+
+class TestPersistentAVLTree(unittest.TestCase):
+
+    def assertValid(self, node):
+        """Check order, balance, heights and sizes; return (height, size)."""
+        if node is None:
+            return 0, 0
+        left_height, left_size = self.assertValid(node.left)
+        right_height, right_size = self.assertValid(node.right)
+        if node.left:
+            self.assertLess(node.left.value, node.value)
+        if node.right:
+            self.assertGreater(node.right.value, node.value)
+        self.assertLessEqual(abs(left_height - right_height), 1)
+        self.assertEqual(node.height, 1 + max(left_height, right_height))
+        self.assertEqual(node.size, 1 + left_size + right_size)
+        return node.height, node.size
+
+    def test_updates_leave_old_versions_intact(self):
+        """Test that insert and delete return new trees and never modify the old one."""
+        empty = PersistentAVLTree()
+        one = empty.insert(10)
+        two = one.insert(20)
+        fewer = two.delete(10)
+        self.assertEqual(list(empty), [])
+        self.assertEqual(list(one), [10])
+        self.assertEqual(list(two), [10, 20])
+        self.assertEqual(list(fewer), [20])
+        self.assertIn(10, two)
+        self.assertNotIn(10, fewer)
+
+    def test_structural_sharing(self):
+        """Test that an update copies only the search path."""
+        tree = PersistentAVLTree.from_iterable(range(1023))
+        updated = tree.insert(2000)
+        self.assertIs(updated.root.left, tree.root.left)  # Left half untouched
+        self.assertIs(tree.insert(5), tree)  # No-op updates share everything
+        self.assertIs(tree.delete(5000), tree)
+
+    def test_random_operations_keep_invariants(self):
+        """Test random operations against Python sets, checking every retained version."""
+        rng = random.Random(3)
+        tree = PersistentAVLTree()
+        expected = set()
+        history = []
+        for _ in range(1500):
+            value = rng.randrange(200)
+            if rng.random() < 0.6:
+                tree = tree.insert(value)
+                expected.add(value)
+            else:
+                tree = tree.delete(value)
+                expected.discard(value)
+            history.append((tree, sorted(expected)))
+        for tree, values in history[::100]:
+            self.assertValid(tree.root)
+            self.assertEqual(list(tree), values)
+            self.assertEqual(len(tree), len(values))
+        tree, values = history[-1]
+        self.assertEqual(tree.select(len(values) - 1), values[-1])
+        self.assertEqual(list(tree.irange(50, 60)), [v for v in values if 50 <= v <= 60])
+        self.assertEqual(tree.search_many(range(200)), [v in values for v in range(200)])
+
+
+class TestVersionedAVLTree(unittest.TestCase):
+
+    def test_versions(self):
+        """Test that every update publishes a version readable later."""
+        tree = VersionedAVLTree()
+        self.assertEqual(tree.insert(1), 1)
+        self.assertEqual(tree.insert(2), 2)
+        self.assertEqual(tree.insert(2), 2)  # No change, no new version
+        self.assertEqual(tree.delete(1), 3)
+        self.assertEqual(list(tree.snapshot(2)), [1, 2])
+        self.assertEqual(list(tree.snapshot()), [2])
+        self.assertEqual(list(tree), [2])
+        self.assertEqual(len(tree.snapshot(0)), 0)
+
+    def test_snapshot_survives_later_writes(self):
+        """Test that a reader's snapshot is unaffected by writes after it was taken."""
+        tree = VersionedAVLTree()
+        for value in range(100):
+            tree.insert(value)
+        snapshot = tree.snapshot()
+        for value in range(0, 100, 2):
+            tree.delete(value)
+        self.assertEqual(list(snapshot), list(range(100)))
+        self.assertEqual(len(tree), 50)
+
+    def test_max_versions(self):
+        """Test that only the most recent versions are retained when bounded."""
+        tree = VersionedAVLTree(max_versions=3)
+        for value in range(5):
+            tree.insert(value)
+        self.assertEqual(list(tree.snapshot(3)), [0, 1, 2])
+        with self.assertRaises(IndexError):
+            tree.snapshot(2)
+
+
+if __name__ == '__main__':
+    unittest.main()
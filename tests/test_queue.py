@@ -1,5 +1,7 @@
+import threading
+import time
 import unittest
-from structures.queue import Queue
+from structures.queue import Queue, RingBufferQueue, BlockingQueue, Empty, Full
 
 class TestQueue(unittest.TestCase):
 
@@ -84,5 +86,128 @@ class TestQueue(unittest.TestCase):
         self.assertEqual(self.queue.dequeue(), 30)
         self.assertIsNone(self.queue.dequeue())  # Queue should be empty now
 
+    def test_enqueue_many(self):
+        """Test enqueuing a batch of elements."""
+        self.queue.enqueue_many([10, 20, 30])
+        self.assertEqual(self.queue.get_size(), 3)
+        self.assertEqual(self.queue.peek(), 10)
+
+    def test_dequeue_many(self):
+        """Test dequeuing a batch of elements in FIFO order."""
+        self.queue.enqueue_many(range(5))
+        self.assertEqual(self.queue.dequeue_many(3), [0, 1, 2])
+        self.assertEqual(self.queue.get_size(), 2)
+        self.assertEqual(self.queue.dequeue_many(10), [3, 4])
+        self.assertTrue(self.queue.is_empty())
+        self.assertEqual(self.queue.dequeue_many(1), [])
+        self.queue.enqueue(5)
+        self.assertEqual(self.queue.peek(), 5)
+
+    def test_iteration(self):
+        """Test that iteration runs from front to rear and len/in work."""
+        self.queue.enqueue_many([10, 20, 30])
+        self.queue.dequeue()
+        self.queue.enqueue(40)
+        self.assertEqual(list(self.queue), [20, 30, 40])
+        self.assertEqual(len(self.queue), 3)
+        self.assertIn(40, self.queue)
+        self.assertNotIn(10, self.queue)
+
+
+class TestRingBufferQueue(TestQueue):
+
+    def setUp(self):
+        """Set up a small ring-buffer queue so tests exercise wrap-around and growth."""
+        self.queue = RingBufferQueue(capacity=2)
+
+    def test_wrap_around(self):
+        """Test that elements keep FIFO order when the buffer wraps."""
+        queue = RingBufferQueue(capacity=4)
+        queue.enqueue_many([1, 2, 3])
+        self.assertEqual(queue.dequeue_many(2), [1, 2])
+        queue.enqueue_many([4, 5, 6])  # Wraps past the end of the buffer
+        self.assertEqual(queue.capacity, 4)
+        self.assertEqual(queue.dequeue_many(4), [3, 4, 5, 6])
+
+    def test_reversed(self):
+        """Test that reversed iteration runs from rear to front across the wrap."""
+        queue = RingBufferQueue(capacity=4)
+        queue.enqueue_many([1, 2, 3])
+        queue.dequeue_many(2)
+        queue.enqueue_many([4, 5])
+        self.assertEqual(list(reversed(queue)), [5, 4, 3])
+
+    def test_growth_preserves_order(self):
+        """Test that growing a wrapped buffer preserves FIFO order."""
+        queue = RingBufferQueue(capacity=4)
+        queue.enqueue_many([1, 2, 3, 4])
+        queue.dequeue_many(2)
+        for value in range(5, 12):
+            queue.enqueue(value)
+        self.assertEqual(queue.dequeue_many(20), list(range(3, 12)))
+
+
+class TestBlockingQueue(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a bounded blocking queue before each test."""
+        self.queue = BlockingQueue(maxsize=3)
+
+    def test_put_get(self):
+        """Test that elements come out in FIFO order."""
+        self.queue.put(10)
+        self.queue.put(20)
+        self.assertEqual(self.queue.get_size(), 2)
+        self.assertEqual(self.queue.get(), 10)
+        self.assertEqual(self.queue.get(), 20)
+        self.assertTrue(self.queue.is_empty())
+
+    def test_get_timeout_on_empty(self):
+        """Test that get raises Empty once the timeout expires."""
+        with self.assertRaises(Empty):
+            self.queue.get(timeout=0.01)
+        with self.assertRaises(Empty):
+            self.queue.get_nowait()
+
+    def test_put_timeout_on_full(self):
+        """Test that put raises Full when the bounded queue stays full."""
+        for value in range(3):
+            self.queue.put(value)
+        self.assertTrue(self.queue.is_full())
+        with self.assertRaises(Full):
+            self.queue.put(3, timeout=0.01)
+        with self.assertRaises(Full):
+            self.queue.put_nowait(3)
+
+    def test_get_many(self):
+        """Test taking a batch without waiting for it to fill."""
+        self.queue.put(1)
+        self.queue.put(2)
+        self.assertEqual(self.queue.get_many(10, timeout=0.01), [1, 2])
+        self.assertEqual(self.queue.get_many(10, timeout=0.01), [])
+
+    def test_blocked_consumer_wakes_on_put(self):
+        """Test that a consumer sleeping in get is woken by a producer."""
+        result = []
+        consumer = threading.Thread(target=lambda: result.append(self.queue.get(timeout=5)))
+        consumer.start()
+        time.sleep(0.01)
+        self.queue.put(42)
+        consumer.join()
+        self.assertEqual(result, [42])
+
+    def test_producer_throttled_until_consumer_drains(self):
+        """Test that a producer blocked on a full queue resumes after a get_many."""
+        produced = list(range(100))
+        producer = threading.Thread(target=lambda: [self.queue.put(v, timeout=5) for v in produced])
+        producer.start()
+        consumed = []
+        while len(consumed) < len(produced):
+            self.assertLessEqual(self.queue.get_size(), 3)
+            consumed.extend(self.queue.get_many(2, timeout=5))
+        producer.join()
+        self.assertEqual(consumed, produced)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,85 @@
+import random
+import unittest
+from structures.rbtree import RedBlackTree
+
+class TestRedBlackTree(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an empty RedBlackTree instance for testing."""
+        self.tree = RedBlackTree()
+
+    def assertValid(self, tree):
+        """Check BST order, a black root, no red-red edge and equal black heights."""
+        def black_height(node, lo, hi):
+            if node is None:
+                return 1
+            self.assertTrue(lo is None or lo < node.value)
+            self.assertTrue(hi is None or node.value < hi)
+            if node.red:
+                self.assertFalse(node.left is not None and node.left.red)
+                self.assertFalse(node.right is not None and node.right.red)
+            left = black_height(node.left, lo, node.value)
+            self.assertEqual(left, black_height(node.right, node.value, hi))
+            return left + (not node.red)
+
+        if tree.root is not None:
+            self.assertFalse(tree.root.red)
+        black_height(tree.root, None, None)
+
+    def test_sorted_inserts_stay_balanced(self):
+        """Test that ascending inserts, the worst case for a plain BST, keep a logarithmic height."""
+        for value in range(1000):
+            self.tree.insert(value)
+        self.assertValid(self.tree)
+        self.assertLessEqual(self.tree.height(), 2 * 10)
+        self.assertEqual(self.tree.inorder_traversal(), list(range(1000)))
+
+    def test_random_operations_keep_invariants(self):
+        """Test random inserts and deletes against a Python set."""
+        rng = random.Random(5)
+        expected = set()
+        for step in range(4000):
+            value = rng.randrange(400)
+            if rng.random() < 0.55:
+                self.tree.insert(value)
+                expected.add(value)
+            else:
+                self.tree.delete(value)
+                expected.discard(value)
+            if step % 500 == 0:
+                self.assertValid(self.tree)
+        self.assertValid(self.tree)
+        self.assertEqual(list(self.tree), sorted(expected))
+        for value in sorted(expected):
+            self.tree.delete(value)
+        self.assertIsNone(self.tree.root)
+
+    def test_shared_map_api(self):
+        """Test the key/value, nearest-key and multiset API inherited from BinarySearchTree."""
+        for value in range(0, 100, 10):
+            self.tree[value] = str(value)
+        self.assertEqual(self.tree[30], '30')
+        del self.tree[30]
+        self.assertValid(self.tree)
+        self.assertEqual((self.tree.floor(35), self.tree.ceiling(35)), (20, 40))
+        self.assertEqual(self.tree.get(30, 'gone'), 'gone')
+        tree = RedBlackTree(multiset=True)
+        for value in [2, 1, 2, 2]:
+            tree.insert(value)
+        tree.delete(2)
+        self.assertEqual((tree.count(2), list(tree)), (2, [1, 2, 2]))
+
+    def test_from_sorted(self):
+        """Test that bulk-loaded trees are valid red-black trees of every size."""
+        for n in range(80):
+            tree = RedBlackTree.from_sorted(range(n))
+            self.assertValid(tree)
+            self.assertEqual(list(tree), list(range(n)))
+        tree = RedBlackTree.from_iterable(range(500, 0, -1))
+        tree.insert(0)
+        tree.delete(250)
+        self.assertValid(tree)
+
+
+if __name__ == '__main__':
+    unittest.main()
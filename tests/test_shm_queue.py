@@ -0,0 +1,101 @@
+import multiprocessing
+import unittest
+from structures.shm_queue import SharedRingQueue
+
+
+def _produce(queue, count):
+    for i in range(count):
+        queue.put(str(i).encode())
+    queue.close()
+
+
+class TestSharedRingQueue(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a small variable-length queue and a second handle attached to it."""
+        self.producer = SharedRingQueue.create(64)
+        self.consumer = SharedRingQueue.attach(self.producer.name)
+
+    def tearDown(self):
+        self.consumer.close()
+        self.producer.close()
+        self.producer.unlink()
+
+    def test_enqueue_dequeue(self):
+        """Test that records cross between handles in FIFO order."""
+        self.assertTrue(self.producer.enqueue(b"hello"))
+        self.assertTrue(self.producer.enqueue(b""))
+        self.assertEqual(self.consumer.dequeue(), b"hello")
+        self.assertEqual(self.consumer.dequeue(), b"")
+        self.assertIsNone(self.consumer.dequeue())
+        self.assertTrue(self.consumer.is_empty())
+
+    def test_full_queue_rejects(self):
+        """Test that enqueue returns False instead of overwriting unread records."""
+        self.assertTrue(self.producer.enqueue(b"x" * 28))
+        self.assertTrue(self.producer.enqueue(b"y" * 28))
+        self.assertFalse(self.producer.enqueue(b"z"))
+        self.assertEqual(self.consumer.dequeue(), b"x" * 28)
+        self.assertTrue(self.producer.enqueue(b"z"))
+
+    def test_wrap_around(self):
+        """Test that variable-length records survive wrapping past the end of the ring."""
+        sent = [bytes([i]) * (i % 23) for i in range(200)]
+        received = []
+        for record in sent:
+            while not self.producer.enqueue(record):
+                received.append(self.consumer.dequeue())
+        received.extend(self.consumer.dequeue_many(len(sent)))
+        self.assertEqual(received, sent)
+
+    def test_batches(self):
+        """Test enqueue_many and dequeue_many."""
+        self.assertEqual(self.producer.enqueue_many([b"a", b"bb", b"ccc"]), 3)
+        self.assertEqual(self.consumer.dequeue_many(2), [b"a", b"bb"])
+        self.assertEqual(self.consumer.dequeue_many(2), [b"ccc"])
+        self.assertEqual(self.producer.enqueue_many([b"z" * 19] * 5), 2)
+
+    def test_oversized_record(self):
+        """Test that a record taking more than half the ring is refused."""
+        with self.assertRaises(ValueError):
+            self.producer.enqueue(b"x" * 100)
+        with self.assertRaises(ValueError):
+            self.producer.enqueue(b"x" * 29)
+
+    def test_largest_record_after_wrap(self):
+        """Test that an empty ring accepts a half-ring record whatever offset it was left at."""
+        for offset in range(0, 64, 4):
+            with SharedRingQueue.create(64) as queue:
+                for _ in range(offset // 4):
+                    queue.enqueue(b"")
+                    queue.dequeue()
+                self.assertTrue(queue.put(b"y" * 28, timeout=0.2))
+                self.assertEqual(queue.dequeue(), b"y" * 28)
+                self.assertTrue(queue.put(b"z" * 28, timeout=0.2))
+
+    def test_fixed_width_records(self):
+        """Test fixed-width mode, where records carry no length prefix."""
+        with SharedRingQueue.create(20, record_size=8) as queue:
+            self.assertEqual(queue.capacity, 16)
+            for i in range(10):
+                self.assertTrue(queue.enqueue(i.to_bytes(8, 'little')))
+                self.assertEqual(int.from_bytes(queue.dequeue(), 'little'), i)
+            with self.assertRaises(ValueError):
+                queue.enqueue(b"short")
+
+    def test_get_timeout(self):
+        """Test that get gives up after the timeout on an empty queue."""
+        self.assertIsNone(self.consumer.get(timeout=0.01))
+
+    def test_cross_process(self):
+        """Test a producer in a child process feeding a consumer in this one."""
+        count = 500
+        child = multiprocessing.Process(target=_produce, args=(self.producer, count))
+        child.start()
+        received = [self.consumer.get(timeout=10) for _ in range(count)]
+        child.join()
+        self.assertEqual(received, [str(i).encode() for i in range(count)])
+
+
+if __name__ == '__main__':
+    unittest.main()
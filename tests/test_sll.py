@@ -111,6 +111,53 @@ class TestSinglyLinkedList(unittest.TestCase):
         self.sll.append(20)
         self.assertEqual(self.sll.length(), 2)
 
+    def test_tail_tracking(self):
+        """Test that append stays correct after every tail-changing operation."""
+        self.sll.prepend(20)
+        self.sll.append(30)
+        self.sll.insert_after(30, 40)  # New tail
+        self.sll.append(50)
+        self.sll.delete(50)  # Delete the tail
+        self.sll.append(60)
+        self.sll.reverse()
+        self.sll.append(10)
+        values = []
+        current = self.sll.head
+        while current:
+            values.append(current.value)
+            current = current.next
+        self.assertEqual(values, [60, 40, 30, 20, 10])
+        self.assertEqual(self.sll.tail.value, 10)
+        self.assertEqual(self.sll.length(), 5)
+
+    def test_delete_only_element(self):
+        """Test that deleting the last remaining element resets the tail."""
+        self.sll.append(10)
+        self.sll.delete(10)
+        self.assertIsNone(self.sll.tail)
+        self.sll.append(20)
+        self.assertEqual(self.sll.head.value, 20)
+        self.assertEqual(self.sll.length(), 1)
+
+    def test_iteration(self):
+        """Test the iterator, len and membership protocols."""
+        for value in (10, 20, 30):
+            self.sll.append(value)
+        self.assertEqual(list(self.sll), [10, 20, 30])
+        self.assertEqual(len(self.sll), 3)
+        self.assertIn(20, self.sll)
+        self.assertNotIn(40, self.sll)
+        iterator = iter(self.sll)
+        self.assertEqual(next(iterator), 10)  # Lazy: stops early without walking the rest
+
+    def test_search_many(self):
+        """Test batch membership in input order, with repeated and absent probes."""
+        for value in (10, 20, 30, 20):
+            self.sll.append(value)
+        self.assertEqual(self.sll.search_many([30, 5, 10, 30]), [True, False, True, True])
+        self.assertEqual(self.sll.search_many([]), [])
+        self.assertEqual(SinglyLinkedList().search_many([1]), [False])
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,5 +1,5 @@
 import unittest
-from structures.stack import Stack
+from structures.stack import Stack, ArrayStack
 
 class TestStack(unittest.TestCase):
 
@@ -84,5 +84,52 @@ class TestStack(unittest.TestCase):
         self.assertEqual(self.stack.pop(), 10)
         self.assertIsNone(self.stack.pop())  # Stack should be empty now
 
+    def test_push_many(self):
+        """Test pushing a batch of elements."""
+        self.stack.push_many([10, 20, 30])
+        self.assertEqual(self.stack.get_size(), 3)
+        self.assertEqual(self.stack.peek(), 30)
+
+    def test_pop_many(self):
+        """Test popping a batch of elements in LIFO order."""
+        self.stack.push_many(range(5))
+        self.assertEqual(self.stack.pop_many(3), [4, 3, 2])
+        self.assertEqual(self.stack.get_size(), 2)
+        self.assertEqual(self.stack.pop_many(10), [1, 0])
+        self.assertTrue(self.stack.is_empty())
+        self.assertEqual(self.stack.pop_many(1), [])
+
+    def test_iteration(self):
+        """Test that iteration runs from top to bottom and len/in work."""
+        self.stack.push_many([10, 20, 30])
+        self.assertEqual(list(self.stack), [30, 20, 10])
+        self.assertEqual(len(self.stack), 3)
+        self.assertIn(20, self.stack)
+        self.assertNotIn(40, self.stack)
+
+
+class TestArrayStack(TestStack):
+
+    def setUp(self):
+        """Set up a list-backed stack instance before each test."""
+        self.stack = ArrayStack()
+
+    def test_reversed(self):
+        """Test that reversed iteration runs from bottom to top."""
+        self.stack.push_many([10, 20, 30])
+        self.assertEqual(list(reversed(self.stack)), [10, 20, 30])
+
+
+class TestTypedArrayStack(TestStack):
+
+    def setUp(self):
+        """Set up an array.array-backed stack of signed 64-bit integers."""
+        self.stack = ArrayStack('q')
+
+    def test_rejects_wrong_type(self):
+        """Test that a typed stack refuses values of the wrong type."""
+        with self.assertRaises(TypeError):
+            self.stack.push("x")
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,78 @@
+import random
+import unittest
+from structures.treap import Treap
+
+class TestTreap(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an empty, seeded Treap instance for testing."""
+        self.tree = Treap(seed=1)
+
+    def assertValid(self, node, lo=None, hi=None):
+        """Check BST order on values and heap order on priorities."""
+        if node is None:
+            return
+        self.assertTrue(lo is None or lo < node.value)
+        self.assertTrue(hi is None or node.value < hi)
+        for child in (node.left, node.right):
+            if child is not None:
+                self.assertLessEqual(child.priority, node.priority)
+        self.assertValid(node.left, lo, node.value)
+        self.assertValid(node.right, node.value, hi)
+
+    def test_sorted_inserts_stay_shallow(self):
+        """Test that ascending inserts give a logarithmic expected height."""
+        for value in range(2000):
+            self.tree.insert(value)
+        self.assertValid(self.tree.root)
+        self.assertLess(self.tree.height(), 40)
+        self.assertEqual(self.tree.inorder_traversal(), list(range(2000)))
+
+    def test_random_operations_keep_invariants(self):
+        """Test random inserts and deletes against a Python set."""
+        rng = random.Random(5)
+        expected = set()
+        for _ in range(4000):
+            value = rng.randrange(400)
+            if rng.random() < 0.55:
+                self.tree.insert(value)
+                expected.add(value)
+            else:
+                self.tree.delete(value)
+                expected.discard(value)
+        self.assertValid(self.tree.root)
+        self.assertEqual(list(self.tree), sorted(expected))
+
+    def test_split_and_join(self):
+        """Test cutting a treap in two and splicing the halves back."""
+        tree = Treap.from_iterable(range(100), seed=2)
+        self.assertValid(tree.root)
+        low, high = tree.split(40)
+        self.assertIsNone(tree.root)
+        self.assertEqual(list(low), list(range(40)))
+        self.assertEqual(list(high), list(range(40, 100)))
+        self.assertValid(low.root)
+        high.insert(1000)
+        low.join(high)
+        self.assertIsNone(high.root)
+        self.assertValid(low.root)
+        self.assertEqual(list(low), list(range(100)) + [1000])
+        with self.assertRaises(ValueError):
+            low.join(Treap.from_iterable([5]))
+
+    def test_shared_map_api(self):
+        """Test the key/value, nearest-key and multiset API inherited from BinarySearchTree."""
+        tree = Treap(key=lambda record: record[0], seed=3)
+        for record in [(3, 'c'), (1, 'a'), (2, 'b'), (3, 'C')]:
+            tree.insert(record)
+        self.assertEqual(tree[3], (3, 'C'))
+        self.assertEqual(tree.successor(1), 2)
+        del tree[2]
+        self.assertEqual(list(tree), [1, 3])
+        tree = Treap.from_iterable([2, 1, 2, 2], multiset=True)
+        self.assertEqual(tree.count(2), 3)
+        self.assertEqual(tree.inorder_traversal(), [1, 2, 2, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()